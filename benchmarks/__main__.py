@@ -0,0 +1,47 @@
+"""Conjunto de benchmarks do solucionador e da renderização.
+
+Uso:
+    python -m benchmarks executar [--filtro solver] [--salvar benchmarks/baselines/referencia.json]
+    python -m benchmarks comparar benchmarks/baselines/referencia.json [atual.json] [--limite 0.25]
+"""
+import argparse
+import sys
+
+from . import suite
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description=__doc__.splitlines()[0])
+    comandos = parser.add_subparsers(dest="comando", required=True)
+
+    executar = comandos.add_parser("executar", help="roda os benchmarks")
+    executar.add_argument("--filtro", help="grupo (solver, render) ou trecho do nome")
+    executar.add_argument("--repeticoes", type=int, default=5)
+    executar.add_argument("--salvar", help="grava o resultado em JSON")
+
+    comparar = comandos.add_parser("comparar", help="compara com uma linha de base salva")
+    comparar.add_argument("base")
+    comparar.add_argument("atual", nargs="?", help="resultado salvo; se omitido, roda os benchmarks agora")
+    comparar.add_argument("--limite", type=float, default=0.25, help="aumento relativo tolerado (padrão: 0.25)")
+    comparar.add_argument("--filtro")
+    comparar.add_argument("--repeticoes", type=int, default=5)
+
+    args = parser.parse_args(argv)
+    if args.comando == "executar":
+        resultado = suite.executar(args.filtro, args.repeticoes)
+        if args.salvar: suite.salvar(resultado, args.salvar)
+        return 0
+
+    base = suite.carregar(args.base)
+    atual = suite.carregar(args.atual) if args.atual else suite.executar(args.filtro, args.repeticoes)
+    linhas, regressoes = suite.comparar(base, atual, args.limite)
+    print("\n".join(linhas))
+    if regressoes:
+        print(f"\n{len(regressoes)} regressão(ões) acima de {args.limite:.0%}: {', '.join(regressoes)}")
+        return 1
+    print("\nNenhuma regressão.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,52 @@
+"""Escalabilidade da BFS paralela de 1 a N processos numa variante sintética.
+
+Uso: python -m benchmarks.bench_paralelo [--itens 18] [--max-processos N] [--repeticoes 3]
+
+Cada linha compara o tempo com ``processos`` ao de 1 processo (aceleração e
+eficiência) e confere que o caminho tem o comprimento da BFS serial
+vetorizada. Com menos núcleos que processos a aceleração naturalmente para.
+"""
+import argparse
+import os
+import time
+
+from travessia import RegrasTravessia, resolver
+from travessia.paralelo import buscar_paralelo
+
+
+def medir(funcao, repeticoes):
+    melhor = None
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        resultado = funcao()
+        decorrido = time.perf_counter() - inicio
+        melhor = decorrido if melhor is None else min(melhor, decorrido)
+    return resultado, melhor
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--itens", type=int, default=18)
+    parser.add_argument("--capacidade", type=int, default=2)
+    parser.add_argument("--max-processos", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--repeticoes", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    regras = RegrasTravessia.sintetica(args.itens, args.capacidade)
+    serial, t_serial = medir(lambda: resolver(regras, 0, "vetorizado"), args.repeticoes)
+    comprimento = len(serial.caminho) if serial.caminho else None
+    print(f"{args.itens} itens, {regras.num_estados} estados, {len(regras.movimentos)} movimentos, "
+          f"{os.cpu_count()} CPUs; serial vetorizado: {t_serial * 1000:.1f} ms, caminho {comprimento}")
+
+    print(f"{'processos':>9} {'tempo (ms)':>11} {'aceleração':>10} {'eficiência':>10}")
+    t_um = None
+    for processos in range(1, args.max_processos + 1):
+        resultado, decorrido = medir(lambda: buscar_paralelo(regras, 0, processos=processos), args.repeticoes)
+        if (len(resultado.caminho) if resultado.caminho else None) != comprimento:
+            raise SystemExit(f"Comprimento divergente com {processos} processos.")
+        if t_um is None: t_um = decorrido
+        print(f"{processos:>9} {decorrido * 1000:>11.1f} {t_um / decorrido:>9.2f}x {t_um / decorrido / processos:>9.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""Compara a BFS em Python puro com o backend NumPy em variantes sintéticas.
+
+Uso: python -m benchmarks.bench_vetorizado [--max-itens 14] [--capacidade 2]
+"""
+import argparse
+import time
+
+from travessia import RegrasTravessia, resolver
+
+
+def medir(regras, estrategia, repeticoes):
+    melhor = None
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        resultado = resolver(regras, 0, estrategia)
+        decorrido = time.perf_counter() - inicio
+        melhor = decorrido if melhor is None else min(melhor, decorrido)
+    return resultado, melhor
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--min-itens", type=int, default=2)
+    parser.add_argument("--max-itens", type=int, default=14)
+    parser.add_argument("--capacidade", type=int, default=2)
+    parser.add_argument("--repeticoes", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    print(f"{'itens':>5} {'movs':>5} {'expandidos':>10} {'python (ms)':>12} {'numpy (ms)':>11} {'ganho':>6}")
+    cruzamento = None
+    for num_itens in range(args.min_itens, args.max_itens + 1):
+        regras = RegrasTravessia.sintetica(num_itens, args.capacidade)
+        puro, t_puro = medir(regras, "bfs", args.repeticoes)
+        vetor, t_vetor = medir(regras, "vetorizado", args.repeticoes)
+        if (puro.caminho, puro.nos_expandidos) != (vetor.caminho, vetor.nos_expandidos):
+            raise SystemExit(f"Resultados divergentes com {num_itens} itens.")
+        if cruzamento is None and t_vetor < t_puro:
+            cruzamento = num_itens
+        print(f"{num_itens:>5} {len(regras.movimentos):>5} {puro.nos_expandidos:>10} "
+              f"{t_puro * 1000:>12.2f} {t_vetor * 1000:>11.2f} {t_puro / t_vetor:>5.1f}x")
+
+    if cruzamento is None:
+        print("O backend NumPy não superou a BFS pura nesta faixa.")
+    else:
+        print(f"O backend NumPy passa a ganhar a partir de {cruzamento} itens.")
+
+
+if __name__ == "__main__":
+    main()
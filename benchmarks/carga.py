@@ -0,0 +1,137 @@
+"""Gerador de carga para o serviço HTTP do solucionador (python -m travessia servir).
+
+Uso: python -m benchmarks.carga [--url http://127.0.0.1:8765 | --embutido] [-c 64] [-n 5000] [--distintos 200]
+
+Cada conexão envia pedidos em sequência (keep-alive); os estados são
+sorteados entre ``--distintos`` instâncias, então pedidos repetidos chegam ao
+mesmo tempo e exercitam a coalescência. Ao final mostra vazão, percentis de
+latência, respostas por status e as métricas do próprio serviço.
+"""
+import argparse
+import asyncio
+import json
+import math
+import random
+import time
+from urllib.parse import urlsplit
+
+from travessia import RegrasTravessia
+
+
+def _percentil(ordenadas, p):
+    return ordenadas[min(len(ordenadas) - 1, math.ceil(p * len(ordenadas)) - 1)] if ordenadas else 0.0
+
+
+def pedidos_distintos(quantidade, num_itens=10, semente=0):
+    """Corpos JSON de até ``quantidade`` instâncias válidas de uma variante sintética."""
+    regras = RegrasTravessia.sintetica(num_itens)
+    especificacao = regras.para_dict()
+    gerador = random.Random(semente)
+    corpos, vistos = [], set()
+    while len(corpos) < quantidade and len(vistos) < regras.num_estados:
+        codigo = gerador.randrange(regras.num_estados)
+        if codigo in vistos: continue
+        vistos.add(codigo)
+        if not (regras.valido(codigo) and regras.consistente(codigo)): continue
+        estado = " ".join(regras.decodificar(codigo))
+        corpos.append(json.dumps({"estado": estado, "regras": especificacao}).encode("utf-8"))
+    return corpos
+
+
+async def _requisitar(leitor, escritor, host, metodo, caminho, corpo=b""):
+    escritor.write(f"{metodo} {caminho} HTTP/1.1\r\nHost: {host}\r\nContent-Type: application/json\r\n"
+                   f"Content-Length: {len(corpo)}\r\n\r\n".encode("latin-1") + corpo)
+    await escritor.drain()
+    status = int((await leitor.readline()).split()[1])
+    tamanho = 0
+    while True:
+        linha = await leitor.readline()
+        if linha in (b"\r\n", b""): break
+        nome, _, valor = linha.decode("latin-1").partition(":")
+        if nome.strip().lower() == "content-length": tamanho = int(valor)
+    return status, await leitor.readexactly(tamanho)
+
+
+async def _cliente(host, porta, corpos, restantes, latencias, status, gerador):
+    leitor, escritor = await asyncio.open_connection(host, porta)
+    try:
+        while restantes[0] > 0:
+            restantes[0] -= 1
+            comeco = time.perf_counter()
+            codigo, _resposta = await _requisitar(leitor, escritor, host, "POST", "/resolver", gerador.choice(corpos))
+            latencias.append((time.perf_counter() - comeco) * 1000)
+            status[codigo] = status.get(codigo, 0) + 1
+    finally:
+        escritor.close()
+
+
+async def gerar_carga(host, porta, conexoes=64, total=5000, distintos=200, num_itens=10, semente=0):
+    corpos = pedidos_distintos(distintos, num_itens, semente)
+    latencias, status, restantes = [], {}, [total]
+    comeco = time.perf_counter()
+    await asyncio.gather(*(_cliente(host, porta, corpos, restantes, latencias, status, random.Random(semente + i))
+                           for i in range(conexoes)))
+    duracao = time.perf_counter() - comeco
+
+    leitor, escritor = await asyncio.open_connection(host, porta)
+    try:
+        _codigo, corpo = await _requisitar(leitor, escritor, host, "GET", "/metricas")
+    finally:
+        escritor.close()
+    ordenadas = sorted(latencias)
+    return {
+        "requisicoes": len(latencias),
+        "conexoes": conexoes,
+        "instancias_distintas": len(corpos),
+        "duracao_s": round(duracao, 3),
+        "vazao_rps": round(len(latencias) / duracao, 1) if duracao else 0.0,
+        "latencia_ms": {nome: round(_percentil(ordenadas, p), 3)
+                        for nome, p in (("p50", 0.5), ("p90", 0.9), ("p99", 0.99), ("max", 1.0))},
+        "status": {str(codigo): n for codigo, n in sorted(status.items())},
+        "servico": json.loads(corpo),
+    }
+
+
+async def _com_servico_embutido(args):
+    from travessia.servico import ServicoTravessia
+
+    async with await ServicoTravessia(processos=args.processos, cache=None).iniciar("127.0.0.1", 0) as servico:
+        host, porta = servico.endereco
+        return await gerar_carga(host, porta, args.conexoes, args.total, args.distintos, args.itens, args.semente)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url", default="http://127.0.0.1:8765", help="endereço de um serviço já rodando")
+    parser.add_argument("--embutido", action="store_true",
+                        help="sobe o serviço (sem cache) neste processo, numa porta livre, só para a medição")
+    parser.add_argument("--processos", type=int, default=None, help="processos do serviço embutido")
+    parser.add_argument("-c", "--conexoes", type=int, default=64)
+    parser.add_argument("-n", "--total", type=int, default=5000)
+    parser.add_argument("--distintos", type=int, default=200, help="instâncias diferentes sorteadas")
+    parser.add_argument("--itens", type=int, default=10, help="itens da variante sintética")
+    parser.add_argument("--semente", type=int, default=0)
+    parser.add_argument("--json", action="store_true", help="imprime o relatório completo em JSON")
+    args = parser.parse_args(argv)
+
+    if args.embutido:
+        relatorio = asyncio.run(_com_servico_embutido(args))
+    else:
+        endereco = urlsplit(args.url)
+        relatorio = asyncio.run(gerar_carga(endereco.hostname, endereco.port or 80, args.conexoes, args.total,
+                                            args.distintos, args.itens, args.semente))
+    if args.json:
+        print(json.dumps(relatorio, indent=2, ensure_ascii=False))
+        return
+    latencia, servico = relatorio["latencia_ms"], relatorio["servico"]
+    print(f"{relatorio['requisicoes']} requisições em {relatorio['duracao_s']:.2f} s com {relatorio['conexoes']} conexões: "
+          f"{relatorio['vazao_rps']:.0f} req/s")
+    print(f"latência (ms): p50 {latencia['p50']:.2f}  p90 {latencia['p90']:.2f}  p99 {latencia['p99']:.2f}  "
+          f"max {latencia['max']:.2f}")
+    print(f"status: {relatorio['status']}")
+    print(f"serviço: {servico['calculos']} cálculos em {servico['lotes']} lotes "
+          f"(média {servico['tamanho_lote']['media']:.1f}), {servico['coalescidas']} coalescidas")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""Custos de inicialização: importar o núcleo e carregar os sprites, com e sem o cache em disco."""
+import atexit
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+
+from travessia.layout import SPRITES
+
+from .suite import benchmark
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+# Mede só o import, num interpretador novo, e diz se alguma dependência pesada veio junto.
+_IMPORTAR_NUCLEO = """
+import json, sys, time
+inicio = time.perf_counter()
+import travessia
+print(json.dumps({"importacao_ms": (time.perf_counter() - inicio) * 1000,
+                  "modulos_pesados": [m for m in ("tkinter", "PIL", "numpy") if m in sys.modules]}))
+"""
+
+
+def _interpretador(codigo):
+    def operacao():
+        saida = subprocess.run([sys.executable, "-c", codigo], cwd=RAIZ, capture_output=True, text=True, check=True)
+        return json.loads(saida.stdout) if saida.stdout.strip() else None
+    return operacao
+
+
+@benchmark("inicio.interpretador_vazio", "inicio")
+def interpretador_vazio():
+    return _interpretador("pass")
+
+
+@benchmark("inicio.importar_nucleo", "inicio")
+def importar_nucleo():
+    """Processo inteiro; o tempo do import em si fica em ``importacao_ms``."""
+    return _interpretador(_IMPORTAR_NUCLEO)
+
+
+def _carregador():
+    try:
+        from travessia.sprites import carregar_sprite
+    except ImportError as erro:
+        raise RuntimeError(f"PIL indisponível ({erro})")
+    return carregar_sprite
+
+
+def _carregar_todos(carregar_sprite, diretorio):
+    for arquivo, tamanho in SPRITES.values():
+        carregar_sprite(os.path.join(RAIZ, arquivo), tamanho, diretorio)
+
+
+@benchmark("inicio.sprites_sem_cache", "inicio")
+def sem_cache():
+    carregar_sprite = _carregador()
+    base = tempfile.mkdtemp(prefix="travessia-bench-")
+    atexit.register(shutil.rmtree, base, True)
+
+    def operacao():
+        # Diretório vazio a cada chamada: decodifica o PNG e reamostra tudo.
+        diretorio = tempfile.mkdtemp(dir=base)
+        _carregar_todos(carregar_sprite, diretorio)
+        shutil.rmtree(diretorio)
+    return operacao
+
+
+@benchmark("inicio.sprites_com_cache", "inicio")
+def com_cache():
+    carregar_sprite = _carregador()
+    diretorio = tempfile.mkdtemp(prefix="travessia-bench-")
+    atexit.register(shutil.rmtree, diretorio, True)
+    _carregar_todos(carregar_sprite, diretorio)
+    return lambda: _carregar_todos(carregar_sprite, diretorio)
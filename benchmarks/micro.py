@@ -0,0 +1,96 @@
+"""Micro-benchmarks do solucionador no problema clássico e em variantes sintéticas."""
+from travessia import AutomatoTravessia, RegrasTravessia
+
+from .suite import benchmark
+
+VARIANTES = {"classico": None, "sintetico8": 8, "sintetico12": 12}
+
+
+def _automato(num_itens):
+    regras = RegrasTravessia.classica() if num_itens is None else RegrasTravessia.sintetica(num_itens)
+    return AutomatoTravessia(regras=regras)
+
+
+def _estados_validos(automato, limite=64):
+    regras = automato.regras
+    estados = []
+    for codigo in range(regras.num_estados):
+        if regras.valido(codigo) and regras.consistente(codigo):
+            estados.append(regras.decodificar(codigo))
+            if len(estados) >= limite: break
+    return estados
+
+
+def _registrar(variante, num_itens):
+    @benchmark(f"solver.is_valid_state[{variante}]", "solver")
+    def is_valid_state():
+        automato = _automato(num_itens)
+        estados = [automato.regras.decodificar(codigo) for codigo in range(min(automato.regras.num_estados, 64))]
+        return lambda: [automato.is_valid_state(estado) for estado in estados]
+
+    @benchmark(f"solver.transition[{variante}]", "solver")
+    def transition():
+        automato = _automato(num_itens)
+        pares = [(estado, acao) for estado in _estados_validos(automato, 16) for acao in automato.alfabeto[:8]]
+        return lambda: [automato.transition(estado, acao) for estado, acao in pares]
+
+    @benchmark(f"solver.resolver_bfs[{variante}]", "solver")
+    def resolver_bfs():
+        automato = _automato(num_itens)
+        return automato.resolver_bfs
+
+
+for _variante, _num_itens in VARIANTES.items():
+    _registrar(_variante, _num_itens)
+
+
+def _fitas_aleatorias(quantidade=4096, comprimento=7, semente=0):
+    import random
+    gerador = random.Random(semente)
+    return ["".join(gerador.choice("abcd") for _ in range(comprimento)) for _ in range(quantidade)]
+
+
+@benchmark("automato.aceita[classico]", "automato")
+def automato_aceita():
+    afd = _automato(None).afd()
+    fitas = _fitas_aleatorias()
+    return lambda: [afd.aceita(fita) for fita in fitas]
+
+
+@benchmark("automato.aceita_lote[classico]", "automato")
+def automato_aceita_lote():
+    afd = _automato(None).afd()
+    try:
+        matriz = afd.codificar_fitas(_fitas_aleatorias())
+    except ImportError as erro:
+        raise RuntimeError(str(erro))
+    return lambda: afd.aceita_lote(matriz)
+
+
+def _registrar_simetria(estrategia):
+    @benchmark(f"solver.resolver[generalizada3,{estrategia}]", "solver")
+    def resolver_generalizada():
+        from travessia import resolver
+        regras = RegrasTravessia.generalizada(3, 3, 3, capacidade=4)
+        return lambda: resolver(regras, 0, estrategia)
+
+
+for _estrategia in ("bfs", "simetria"):
+    _registrar_simetria(_estrategia)
+
+
+def _registrar_memoria_externa(estrategia):
+    # Mesma expansão em blocos; a diferença é o custo dos mapas em disco e das camadas em arquivo.
+    @benchmark(f"solver.resolver[sintetico16,{estrategia}]", "solver")
+    def resolver_sintetico():
+        from travessia import resolver
+        regras = RegrasTravessia.sintetica(16)
+        try:
+            resolver(regras, 0, estrategia)
+        except ImportError as erro:
+            raise RuntimeError(str(erro))
+        return lambda: resolver(regras, 0, estrategia)
+
+
+for _estrategia in ("vetorizado", "externo"):
+    _registrar_memoria_externa(_estrategia)
@@ -0,0 +1,168 @@
+"""Benchmarks das rotinas de desenho contra um canvas falso, sem janela."""
+from .suite import benchmark
+
+LARGURA, ALTURA = 960, 640
+
+
+class CanvasFalso:
+    """Imita a parte da API do ``tk.Canvas`` usada pelo app e conta os itens criados."""
+
+    def __init__(self, largura=LARGURA, altura=ALTURA):
+        self.largura, self.altura = largura, altura
+        self.itens = {}
+        self.criados = 0
+        self._proximo_id = 1
+
+    def winfo_width(self): return self.largura
+    def winfo_height(self): return self.altura
+
+    def _criar(self, tipo, coords, opcoes):
+        item_id = self._proximo_id
+        self._proximo_id += 1
+        self.criados += 1
+        tags = opcoes.get("tags", ())
+        self.itens[item_id] = {"tipo": tipo, "coords": list(coords), "tags": (tags,) if isinstance(tags, str) else tuple(tags)}
+        return item_id
+
+    def create_line(self, *coords, **opcoes): return self._criar("line", coords, opcoes)
+    def create_oval(self, *coords, **opcoes): return self._criar("oval", coords, opcoes)
+    def create_rectangle(self, *coords, **opcoes):
+        if len(coords) == 1: coords = coords[0]
+        return self._criar("rectangle", coords, opcoes)
+    def create_text(self, *coords, **opcoes): return self._criar("text", coords, opcoes)
+    def create_image(self, *coords, **opcoes): return self._criar("image", coords, opcoes)
+
+    def _selecionar(self, alvo):
+        if alvo == "all": return list(self.itens)
+        if isinstance(alvo, int): return [alvo] if alvo in self.itens else []
+        return [i for i, item in self.itens.items() if alvo in item["tags"]]
+
+    def delete(self, *alvos):
+        for alvo in alvos:
+            for item_id in self._selecionar(alvo): del self.itens[item_id]
+
+    def coords(self, alvo, *novas):
+        ids = self._selecionar(alvo)
+        if not ids: return []
+        if novas:
+            if len(novas) == 1: novas = novas[0]
+            self.itens[ids[0]]["coords"] = list(novas)
+        return self.itens[ids[0]]["coords"]
+
+    def move(self, alvo, dx, dy):
+        for item_id in self._selecionar(alvo):
+            coords = self.itens[item_id]["coords"]
+            self.itens[item_id]["coords"] = [c + (dx if i % 2 == 0 else dy) for i, c in enumerate(coords)]
+
+    def scale(self, alvo, x0, y0, fx, fy):
+        for item_id in self._selecionar(alvo):
+            coords = self.itens[item_id]["coords"]
+            self.itens[item_id]["coords"] = [x0 + fx * (c - x0) if i % 2 == 0 else y0 + fy * (c - y0)
+                                             for i, c in enumerate(coords)]
+
+    def bbox(self, alvo):
+        ids = self._selecionar(alvo)
+        if not ids: return None
+        x, y = self.itens[ids[0]]["coords"][:2]
+        return (x - 40, y - 8, x + 40, y + 8)
+
+    def addtag_withtag(self, nova, alvo):
+        for item_id in self._selecionar(alvo):
+            if nova not in self.itens[item_id]["tags"]: self.itens[item_id]["tags"] += (nova,)
+
+    def dtag(self, alvo, tag=None):
+        tag = alvo if tag is None else tag
+        for item_id in self._selecionar(alvo):
+            self.itens[item_id]["tags"] = tuple(t for t in self.itens[item_id]["tags"] if t != tag)
+
+    def tag_raise(self, *args): pass
+    def tag_lower(self, *args): pass
+    def itemconfig(self, *args, **opcoes): pass
+
+
+def _app_falso():
+    try:
+        from travessia import app as interface
+        interface.importar_imagens()
+    except ImportError as erro:
+        raise RuntimeError(f"não foi possível importar a interface ({erro})")
+    from collections import OrderedDict
+    from types import SimpleNamespace
+    from travessia import RegrasTravessia, resolver
+
+    # Sem janela não há PhotoImage: as imagens PIL vão direto para o canvas falso.
+    interface.ImageTk = SimpleNamespace(PhotoImage=lambda imagem: imagem)
+
+    # Instância sem __init__: só os atributos usados pelas rotinas de desenho.
+    app = interface.TravessiaApp.__new__(interface.TravessiaApp)
+    app._cache_cenario = OrderedDict()
+    regras = RegrasTravessia.classica()
+    caminho = [regras.decodificar(estado) for estado in resolver(regras, 0).caminho]
+    app.regras = regras
+    app.caminho_solucao = caminho
+    app.grafo_caminho_data = caminho
+    app.grafo_item_map_data = regras.itens
+    app.canvas_grafo = CanvasFalso()
+    app.visuais_por_canvas = {}
+    app.loaded_images = {chave: f"imagem-{chave}" for chave in ("fazendeiro", "lobo", "cabra", "repolho", "barco")}
+    return app
+
+
+def _medir_itens(desenhar, canvas):
+    def operacao():
+        canvas.delete("all")
+        antes = canvas.criados
+        desenhar()
+        return {"itens_canvas": canvas.criados - antes}
+    return operacao
+
+
+@benchmark("render._desenhar_cenario_animacao", "render")
+def cenario():
+    app, canvas = _app_falso(), CanvasFalso()
+    return _medir_itens(lambda: app._desenhar_cenario_animacao(canvas), canvas)
+
+
+@benchmark("render.renderizar_cenario", "render")
+def cenario_sem_cache():
+    try:
+        from travessia.cenario import renderizar_cenario
+    except ImportError as erro:
+        raise RuntimeError(f"PIL indisponível ({erro})")
+    return lambda: renderizar_cenario(LARGURA, ALTURA)
+
+
+@benchmark("render._desenhar_solucao_grafo", "render")
+def grafo():
+    app = _app_falso()
+    return _medir_itens(app._desenhar_solucao_grafo, app.canvas_grafo)
+
+
+@benchmark("render.desenhar_estado_animacao", "render")
+def estado():
+    # Percorre a solução inteira no mesmo canvas, como a animação faz passo a passo.
+    app, canvas = _app_falso(), CanvasFalso()
+    estados = app.caminho_solucao
+
+    def operacao():
+        antes = canvas.criados
+        for estado in estados: app.desenhar_estado_animacao(estado, canvas)
+        return {"itens_canvas": canvas.criados - antes}
+    return operacao
+
+
+@benchmark("render.exportar_quadro_gif", "render")
+def quadro_gif():
+    """Um quadro da exportação com o barco no meio do rio: composição e quantização na paleta do GIF."""
+    try:
+        from travessia import exportar
+    except ImportError as erro:
+        raise RuntimeError(f"PIL indisponível ({erro})")
+    from travessia import RegrasTravessia, resolver
+    from travessia.rotulos import rotulos_caminho
+
+    regras = RegrasTravessia.classica()
+    caminho = resolver(regras, 0).caminho
+    tarefa = (tuple(regras.entidades), [regras.decodificar(estado) for estado in caminho], rotulos_caminho(regras, caminho),
+              [(0, 0.5, 1)], LARGURA, ALTURA, "gif", exportar.paleta_gif(regras.entidades, LARGURA, ALTURA))
+    return lambda: exportar.renderizar_tarefa(tarefa)
@@ -0,0 +1,109 @@
+"""Infraestrutura do conjunto de benchmarks: registro, medição e comparação."""
+import json
+import platform
+import statistics
+import sys
+import time
+
+BENCHMARKS = {}
+
+
+def benchmark(nome, grupo):
+    """Registra ``funcao`` como benchmark.
+
+    A função recebe nada e devolve um chamável sem argumentos que executa a
+    operação medida uma vez. Se esse chamável devolver um dicionário, ele é
+    guardado junto com o tempo (por exemplo, itens criados no canvas).
+    """
+    def registrar(funcao):
+        BENCHMARKS[nome] = (grupo, funcao)
+        return funcao
+    return registrar
+
+
+def _calibrar(operacao, alvo_s):
+    numero = 1
+    while True:
+        inicio = time.perf_counter()
+        for _ in range(numero): operacao()
+        decorrido = time.perf_counter() - inicio
+        if decorrido >= alvo_s or numero >= 1 << 20:
+            return numero
+        numero *= 2
+
+
+def medir(operacao, repeticoes=5, alvo_s=0.05):
+    extras = operacao()
+    numero = _calibrar(operacao, alvo_s)
+    amostras = []
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        for _ in range(numero): operacao()
+        amostras.append((time.perf_counter() - inicio) / numero)
+    resultado = {
+        "mediana_us": statistics.median(amostras) * 1e6,
+        "min_us": min(amostras) * 1e6,
+        "chamadas": numero * repeticoes,
+    }
+    if isinstance(extras, dict): resultado.update(extras)
+    return resultado
+
+
+def executar(filtro=None, repeticoes=5, alvo_s=0.05, saida=sys.stderr):
+    # Os módulos registram seus benchmarks ao serem importados.
+    from . import inicializacao, micro, renderizacao  # noqa: F401
+
+    resultados = {}
+    for nome, (grupo, preparar) in BENCHMARKS.items():
+        if filtro and filtro not in nome and filtro != grupo: continue
+        try:
+            operacao = preparar()
+        except RuntimeError as erro:
+            print(f"{nome:<45} ignorado: {erro}", file=saida)
+            continue
+        resultados[nome] = medir(operacao, repeticoes, alvo_s)
+        print(f"{nome:<45} {resultados[nome]['mediana_us']:>12.2f} us", file=saida)
+    return {
+        "python": platform.python_version(),
+        "plataforma": platform.platform(),
+        "resultados": resultados,
+    }
+
+
+def comparar(base, atual, limite=0.25):
+    """Compara duas execuções e devolve as linhas do relatório e as regressões.
+
+    Usa o menor tempo de cada benchmark, que é o mais estável entre execuções.
+    Há regressão quando ele cresce mais que ``limite`` (fração) ou quando
+    qualquer contagem de itens cresce.
+    """
+    linhas, regressoes = [], []
+    for nome, novo in atual["resultados"].items():
+        antigo = base["resultados"].get(nome)
+        if antigo is None:
+            linhas.append(f"{nome:<45} novo")
+            continue
+        razao = novo["min_us"] / antigo["min_us"] if antigo["min_us"] else 1.0
+        marca = ""
+        if razao > 1 + limite:
+            marca = "  REGRESSÃO"
+            regressoes.append(nome)
+        elif razao < 1 - limite:
+            marca = "  melhora"
+        for chave in ("itens_canvas",):
+            if chave in novo and chave in antigo and novo[chave] > antigo[chave]:
+                marca += f"  REGRESSÃO ({chave}: {antigo[chave]} -> {novo[chave]})"
+                if nome not in regressoes: regressoes.append(nome)
+        linhas.append(f"{nome:<45} {antigo['min_us']:>12.2f} -> {novo['min_us']:>12.2f} us ({razao:5.2f}x){marca}")
+    return linhas, regressoes
+
+
+def salvar(resultado, caminho):
+    with open(caminho, "w", encoding="utf-8") as arquivo:
+        json.dump(resultado, arquivo, indent=2, sort_keys=True)
+        arquivo.write("\n")
+
+
+def carregar(caminho):
+    with open(caminho, encoding="utf-8") as arquivo:
+        return json.load(arquivo)
@@ -0,0 +1,74 @@
+import pytest
+
+from travessia.animacao import AgendadorAnimacao
+
+
+class _Relogio:
+    def __init__(self):
+        self.agora = 0.0
+
+    def __call__(self):
+        return self.agora
+
+
+class _Widget:
+    """Só guarda os ``after``; o teste dispara os quadros quando quer."""
+
+    def __init__(self):
+        self.agendados = []
+
+    def after(self, ms, callback):
+        self.agendados.append((ms, callback))
+        return len(self.agendados)
+
+    def after_cancel(self, _job):
+        self.agendados.clear()
+
+    def disparar(self, relogio, segundos):
+        relogio.agora += segundos
+        _ms, callback = self.agendados.pop(0)
+        callback()
+
+
+@pytest.fixture
+def montagem():
+    relogio, widget = _Relogio(), _Widget()
+    return relogio, widget, AgendadorAnimacao(widget, fps=10, relogio=relogio)
+
+
+def test_progresso_vem_do_tempo_decorrido(montagem):
+    relogio, widget, agendador = montagem
+    progressos, terminou = [], []
+    agendador.animar(1.0, progressos.append, lambda: terminou.append(True))
+    for segundos in (0.0, 0.25, 0.5, 0.5):
+        assert not terminou
+        widget.disparar(relogio, segundos)
+    assert progressos == [0.0, 0.25, 0.75, 1.0] and terminou == [True]
+    assert widget.agendados == []
+
+
+def test_velocidade_escala_o_que_falta(montagem):
+    relogio, widget, agendador = montagem
+    progressos = []
+    agendador.velocidade = 2.0
+    agendador.animar(1.0, progressos.append)
+    widget.disparar(relogio, 0.0)
+    widget.disparar(relogio, 0.25)
+    agendador.velocidade = 0.5
+    widget.disparar(relogio, 0.5)
+    assert progressos == [0.0, 0.5, 0.75]
+    agendador.esperar(1.0, lambda: None)
+    assert widget.agendados[-1][0] == 2000
+
+
+def test_quadro_atrasado_conta_descartados(montagem):
+    relogio, widget, agendador = montagem
+    agendador.animar(10.0, lambda _progresso: None)
+    for segundos in (0.0, 0.1, 0.1, 0.35):
+        widget.disparar(relogio, segundos)
+    estatisticas = agendador.estatisticas()
+    # O primeiro quadro não tem intervalo; 0,35 s a 10 fps são três quadros perdidos.
+    assert estatisticas["quadros"] == 3 and estatisticas["quadros_descartados"] == 3
+    assert estatisticas["intervalo_max_ms"] == pytest.approx(350)
+    agendador.cancelar_tudo()
+    assert widget.agendados == []
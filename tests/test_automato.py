@@ -0,0 +1,100 @@
+import random
+from itertools import product
+
+import pytest
+
+from travessia import AutomatoTravessia, RegrasTravessia, resolver
+from travessia.automato import AFD, AFN, afd_travessia
+from travessia.rotulos import SIMBOLOS_ACOES, acoes_caminho
+
+
+def _afd_aleatorio(gerador, n, alfabeto="ab"):
+    transicoes = [gerador.choice([-1, *range(n)]) for _ in range(n * len(alfabeto))]
+    finais = [q for q in range(n) if gerador.random() < 0.4]
+    return AFD(alfabeto, transicoes, gerador.randrange(n), finais)
+
+
+def _fitas(alfabeto, tamanho_maximo):
+    for tamanho in range(tamanho_maximo + 1):
+        yield from ("".join(fita) for fita in product(alfabeto, repeat=tamanho))
+
+
+def _alcancaveis(afd):
+    vistos, pilha = {afd.inicial}, [afd.inicial]
+    while pilha:
+        q = pilha.pop()
+        for simbolo in afd.alfabeto:
+            destino = afd.delta(q, simbolo)
+            if destino >= 0 and destino not in vistos:
+                vistos.add(destino)
+                pilha.append(destino)
+    return vistos
+
+
+@pytest.mark.parametrize("semente", range(200))
+def test_minimizar_bate_com_forca_bruta(semente):
+    gerador = random.Random(semente)
+    afd = _afd_aleatorio(gerador, gerador.randint(1, 7))
+    minimo = afd.minimizar()
+    for fita in _fitas(afd.alfabeto, 8):
+        assert minimo.aceita(fita) == afd.aceita(fita), fita
+
+    # Dois estados distintos se separam por uma fita de tamanho menor que o número de estados.
+    fitas = list(_fitas(afd.alfabeto, len(afd)))
+    vazia = tuple(False for _ in fitas)
+
+    def linguagem(q):
+        resultado = []
+        for fita in fitas:
+            estado = q
+            for simbolo in fita:
+                estado = afd.delta(estado, simbolo)
+                if estado < 0: break
+            resultado.append(estado >= 0 and estado in afd.finais)
+        return tuple(resultado)
+
+    classes = {linguagem(q) for q in _alcancaveis(afd)} - {vazia}
+    assert len(minimo) == max(1, len(classes))
+
+
+def test_minimizar_o_afd_da_travessia_preserva_as_solucoes():
+    regras = RegrasTravessia.classica()
+    afd = afd_travessia(regras)
+    minimo = afd.minimizar()
+    assert len(minimo) <= len(afd)
+    solucao = "".join(SIMBOLOS_ACOES[a] for a in acoes_caminho(regras, resolver(regras, 0).caminho))
+    assert len(solucao) == 7
+    assert afd.aceita(solucao) and minimo.aceita(solucao)
+    assert not minimo.aceita(solucao[:-1]) and not minimo.aceita("b")
+
+
+def test_determinizar_preserva_a_linguagem():
+    gerador = random.Random(1)
+    for _ in range(50):
+        afd = _afd_aleatorio(gerador, 5)
+        afn = AFN.de_afd(afd)
+        # Uma transição ε extra do inicial para um estado qualquer.
+        afn.epsilon[afd.inicial] |= 1 << gerador.randrange(5)
+        deterministico = afn.determinizar()
+        for fita in _fitas("ab", 6):
+            assert deterministico.aceita(fita) == afn.aceita(fita)
+
+
+def test_aceita_lote_bate_com_aceita():
+    pytest.importorskip("numpy")
+    gerador = random.Random(2)
+    for _ in range(20):
+        afd = _afd_aleatorio(gerador, 6)
+        fitas = list(_fitas("ab", 6)) + ["ax", "x", ""]
+        assert afd.aceita_lote(fitas).tolist() == [afd.aceita(fita) for fita in fitas]
+        listas = [list(fita) for fita in fitas]
+        assert afd.aceita_lote(listas).tolist() == [afd.aceita(fita) for fita in fitas]
+
+
+def test_automato_travessia_rejeita_inicio_invalido():
+    with pytest.raises(ValueError, match="inválido"):
+        AutomatoTravessia(("D", "E", "E", "D"))
+    with pytest.raises(ValueError, match="inválido"):
+        # O barco na esquerda com o fazendeiro na direita.
+        AutomatoTravessia(("D", "E", "D", "E", "E"))
+    assert AutomatoTravessia().resolver_bfs()[-1] == ("D", "D", "D", "D")
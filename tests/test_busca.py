@@ -0,0 +1,75 @@
+import random
+
+import pytest
+
+from travessia import ESTRATEGIAS, BuscaCancelada, RegrasTravessia, resolver
+
+_COM_NUMPY = {"vetorizado", "externo", "paralelo"}
+
+REGRAS = {
+    "classica": RegrasTravessia.classica(),
+    "sintetica6": RegrasTravessia.sintetica(6),
+    "sintetica7_cap3": RegrasTravessia.sintetica(7, capacidade=3),
+    "generalizada": RegrasTravessia.generalizada(2, 2, 1),
+}
+
+
+def _inicios(regras, quantidade=8, semente=0):
+    gerador = random.Random(semente)
+    inicios = [0]
+    while len(inicios) < quantidade:
+        estado = gerador.randrange(regras.num_estados)
+        if regras.valido(estado) and regras.consistente(estado): inicios.append(estado)
+    return inicios
+
+
+def _caminho_valido(regras, caminho, inicio):
+    assert caminho[0] == inicio and caminho[-1] == regras.estado_final
+    for estado, proximo in zip(caminho, caminho[1:]):
+        assert proximo in {destino for _i, destino in regras.sucessores(estado)}
+
+
+@pytest.fixture(params=ESTRATEGIAS)
+def estrategia(request):
+    if request.param in _COM_NUMPY: pytest.importorskip("numpy")
+    return request.param
+
+
+@pytest.mark.parametrize("nome", REGRAS)
+def test_comprimento_igual_ao_da_bfs(estrategia, nome):
+    regras = REGRAS[nome]
+    for inicio in _inicios(regras):
+        referencia = resolver(regras, inicio, "bfs")
+        resultado = resolver(regras, inicio, estrategia)
+        assert resultado.comprimento == referencia.comprimento, (estrategia, nome, inicio)
+        if resultado.caminho: _caminho_valido(regras, resultado.caminho, inicio)
+
+
+def test_classica_tem_sete_travessias(estrategia):
+    assert resolver(RegrasTravessia.classica(), 0, estrategia).comprimento == 7
+
+
+def test_sem_solucao(estrategia):
+    # O barco só leva o remador: lobo e cabra nunca saem da margem.
+    regras = RegrasTravessia(["fazendeiro", "lobo", "cabra"], [("lobo", "cabra")], capacidade=1)
+    resultado = resolver(regras, 0, estrategia)
+    assert resultado.caminho is None and resultado.comprimento is None
+
+
+def test_inicio_igual_ao_final(estrategia):
+    regras = RegrasTravessia.classica()
+    assert resolver(regras, regras.estado_final, estrategia).caminho == [regras.estado_final]
+
+
+def test_progresso_pode_cancelar(estrategia):
+    # Grande o bastante para que até o grafo quociente da simetria passe de um intervalo de progresso.
+    def cancelar(*_args):
+        raise BuscaCancelada()
+
+    with pytest.raises(BuscaCancelada):
+        resolver(RegrasTravessia.sintetica(20), 0, estrategia, progresso=cancelar)
+
+
+def test_estrategia_desconhecida():
+    with pytest.raises(ValueError, match="desconhecida"):
+        resolver(RegrasTravessia.classica(), 0, "dfs")
@@ -0,0 +1,119 @@
+import itertools
+import sqlite3
+
+import pytest
+
+from travessia import RegrasTravessia
+from travessia import cache as modulo_cache
+from travessia.cache import CacheSolucoes, chave_regras
+
+
+@pytest.fixture
+def relogio(monkeypatch):
+    # Um instante diferente a cada chamada: a ordem de uso não depende da resolução do relógio.
+    instantes = itertools.count(1000)
+    monkeypatch.setattr(modulo_cache.time, "time", lambda: float(next(instantes)))
+
+
+@pytest.fixture
+def regras():
+    return RegrasTravessia.classica()
+
+
+def test_acerto_falha_e_ausencia_de_solucao(tmp_path, regras):
+    with CacheSolucoes(str(tmp_path / "c.sqlite3")) as cache:
+        assert cache.obter(regras, 0) == (False, None)
+        cache.guardar(regras, 0, [0, 21, 31])
+        cache.guardar(regras, 5, None)
+        assert cache.obter(regras, 0) == (True, [0, 21, 31])
+        assert cache.obter(regras, 5) == (True, None)
+        estatisticas = cache.estatisticas()
+        assert (estatisticas["acertos"], estatisticas["falhas"], estatisticas["entradas"]) == (2, 1, 2)
+
+
+def test_remove_as_usadas_ha_mais_tempo(tmp_path, regras, relogio):
+    with CacheSolucoes(str(tmp_path / "c.sqlite3"), max_entradas=3, intervalo_uso=0) as cache:
+        for inicio in (1, 2, 3):
+            cache.guardar(regras, inicio, [inicio])
+        # Usar a 1 a torna a mais recente; a 2 passa a ser a mais antiga.
+        assert cache.obter(regras, 1)[0]
+        cache.guardar(regras, 4, [4])
+        assert cache.estatisticas()["entradas"] == 3
+        assert [cache.obter(regras, inicio)[0] for inicio in (1, 2, 3, 4)] == [True, False, True, True]
+        for inicio in (5, 6, 7):
+            cache.guardar(regras, inicio, [inicio])
+        assert [cache.obter(regras, inicio)[0] for inicio in (1, 3, 4, 5, 6, 7)] == [False] * 3 + [True] * 3
+
+
+def test_uso_so_e_regravado_depois_do_intervalo(tmp_path, regras, monkeypatch):
+    agora = [1000.0]
+    monkeypatch.setattr(modulo_cache.time, "time", lambda: agora[0])
+    with CacheSolucoes(str(tmp_path / "c.sqlite3"), intervalo_uso=60) as cache:
+        cache.guardar(regras, 1, [1])
+        usado = lambda: cache._conexao.execute("SELECT usado FROM solucoes").fetchone()[0]
+        agora[0] = 1030.0
+        assert cache.obter(regras, 1)[0] and usado() == 1000.0
+        agora[0] = 1061.0
+        assert cache.obter(regras, 1)[0] and usado() == 1061.0
+
+
+def test_leitura_nao_espera_quem_escreve(tmp_path, regras):
+    arquivo = str(tmp_path / "c.sqlite3")
+    with CacheSolucoes(arquivo, timeout=0.1) as cache:
+        cache.guardar(regras, 0, [0, 31])
+        escritor = sqlite3.connect(arquivo, isolation_level=None)
+        escritor.execute("BEGIN IMMEDIATE")
+        try:
+            assert cache.obter(regras, 0) == (True, [0, 31])
+            assert cache.obter(regras, 5) == (False, None)
+        finally:
+            escritor.execute("ROLLBACK")
+            escritor.close()
+
+
+def test_contadores_do_banco_sao_gravados_em_lote(tmp_path, regras):
+    arquivo = str(tmp_path / "c.sqlite3")
+    with CacheSolucoes(arquivo) as leitor, CacheSolucoes(arquivo) as outro:
+        for _ in range(3):
+            leitor.obter(regras, 0)
+        assert outro.estatisticas()["falhas_total"] == 0
+        leitor.guardar(regras, 0, [0, 31])
+        assert outro.estatisticas()["falhas_total"] == 3
+        for _ in range(modulo_cache.LOTE_CONTADORES):
+            leitor.obter(regras, 0)
+        assert outro.estatisticas()["acertos_total"] == modulo_cache.LOTE_CONTADORES
+
+
+def test_persiste_entre_instancias_e_soma_contadores(tmp_path, regras):
+    arquivo = str(tmp_path / "c.sqlite3")
+    with CacheSolucoes(arquivo) as primeiro:
+        primeiro.obter(regras, 0)
+        primeiro.guardar(regras, 0, [0, 31])
+    with CacheSolucoes(arquivo) as segundo:
+        assert segundo.obter(regras, 0) == (True, [0, 31])
+        estatisticas = segundo.estatisticas()
+        assert (estatisticas["acertos_total"], estatisticas["falhas_total"]) == (1, 1)
+        segundo.limpar()
+        assert segundo.estatisticas()["entradas"] == 0
+
+
+def test_obter_ou_calcular_so_calcula_uma_vez(regras):
+    chamadas = []
+
+    def calcular():
+        chamadas.append(1)
+        return [0, 31]
+
+    with CacheSolucoes(":memory:") as cache:
+        assert cache.obter_ou_calcular(regras, 0, calcular) == [0, 31]
+        assert cache.obter_ou_calcular(regras, 0, calcular) == [0, 31]
+    assert len(chamadas) == 1
+
+
+def test_chave_nao_depende_da_ordem_dos_grupos():
+    a = RegrasTravessia(["f", "x", "y", "z"], [("x", "y"), ("z", "y")], guardioes=["f"])
+    b = RegrasTravessia(["f", "x", "y", "z"], [("y", "z"), ("y", "x")], guardioes=["f"])
+    c = RegrasTravessia(["f", "y", "x", "z"], [("x", "y"), ("z", "y")], guardioes=["f"])
+    assert chave_regras(a) == chave_regras(b)
+    # A ordem das entidades define a codificação dos estados, então muda a chave.
+    assert chave_regras(a) != chave_regras(c)
@@ -0,0 +1,48 @@
+import pytest
+
+from travessia import RegrasTravessia, TabelaCompilada, resolver
+
+
+@pytest.mark.parametrize("regras", [RegrasTravessia.classica(), RegrasTravessia.sintetica(5),
+                                    RegrasTravessia.generalizada(2, 1, 2)])
+def test_distancias_e_caminhos_batem_com_a_bfs(regras):
+    tabela = TabelaCompilada.compilar(regras)
+    for estado in tabela.estados:
+        bfs = resolver(regras, estado, "bfs")
+        assert tabela.distancia_ate_final(estado) == bfs.comprimento
+        caminho = tabela.caminho(estado)
+        if caminho is None:
+            assert bfs.caminho is None
+            continue
+        assert len(caminho) == len(bfs.caminho) and caminho[-1] == regras.estado_final
+        for origem, destino in zip(caminho, caminho[1:]):
+            assert destino in {proximo for _m, proximo in tabela.vizinhos(origem)}
+
+
+def test_estados_invalidos_ficam_fora():
+    regras = RegrasTravessia.classica()
+    tabela = TabelaCompilada.compilar(regras)
+    invalido = regras.codificar(("D", "E", "E", "D"))
+    assert not tabela.valido(invalido)
+    assert tabela.caminho(invalido) is None and tabela.distancia_ate_final(invalido) is None
+    assert len(tabela) == sum(1 for e in range(regras.num_estados) if regras.valido(e) and regras.consistente(e))
+
+
+def test_salvar_e_carregar(tmp_path):
+    regras = RegrasTravessia.sintetica(4)
+    tabela = TabelaCompilada.compilar(regras)
+    arquivo = tmp_path / "tabela.bin"
+    tabela.salvar(arquivo)
+    carregada = TabelaCompilada.carregar(arquivo, regras)
+    assert carregada.regras == regras and carregada.final == tabela.final
+    for nome in ("estados", "transicoes", "proximo", "distancia"):
+        assert getattr(carregada, nome) == getattr(tabela, nome)
+    with pytest.raises(ValueError, match="outras regras"):
+        TabelaCompilada.carregar(arquivo, RegrasTravessia.classica())
+
+
+def test_carregar_rejeita_arquivo_estranho(tmp_path):
+    arquivo = tmp_path / "lixo.bin"
+    arquivo.write_bytes(b"nada a ver\n")
+    with pytest.raises(ValueError, match="não é uma tabela"):
+        TabelaCompilada.carregar(arquivo)
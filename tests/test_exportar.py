@@ -0,0 +1,83 @@
+import shutil
+
+import pytest
+
+pytest.importorskip("PIL")
+
+from PIL import Image
+
+from travessia import RegrasTravessia, resolver
+from travessia.exportar import exportar_animacao, exportar_lote, formato_destino, quadros_travessia
+from travessia.layout import DURACAO_TRAVESSIA
+from travessia.rotulos import rotulos_caminho
+
+LARGURA, ALTURA, FPS = 160, 100, 4
+
+
+@pytest.fixture(scope="module")
+def instancia():
+    regras = RegrasTravessia.classica()
+    caminho = resolver(regras, 0).caminho
+    return {"entidades": regras.entidades, "caminho": [regras.decodificar(estado) for estado in caminho],
+            "rotulos": rotulos_caminho(regras, caminho)}
+
+
+def _opcoes(**extras):
+    return dict(largura=LARGURA, altura=ALTURA, fps=FPS, **extras)
+
+
+def test_formato_destino():
+    assert [formato_destino(d) for d in ("a.gif", "A.GIF", "quadros", "q.png", "a.mp4", "a.webm")] == \
+        ["gif", "gif", "png", "png", "video", "video"]
+
+
+def test_quadros_cobrem_cada_travessia(instancia):
+    quadros = list(quadros_travessia(instancia["caminho"], FPS))
+    travessias = len(instancia["caminho"]) - 1
+    em_movimento = [q for q in quadros if q[1] is not None]
+    assert len(em_movimento) == travessias * round(DURACAO_TRAVESSIA * FPS)
+    assert [q[0] for q in quadros if q[1] is None] == list(range(travessias + 1))
+    assert all(0 < progresso <= 1 for _p, progresso, _r in em_movimento)
+
+
+def test_gif_tem_um_quadro_por_quadro_gerado(tmp_path, instancia):
+    destino = str(tmp_path / "t.gif")
+    resumo = exportar_animacao(instancia["entidades"], instancia["caminho"], instancia["rotulos"], destino,
+                               **_opcoes(processos=0))
+    quadros = list(quadros_travessia(instancia["caminho"], FPS))
+    assert resumo["quadros"] == sum(repeticoes for _p, _q, repeticoes in quadros)
+    with Image.open(destino) as imagem:
+        assert imagem.size == (LARGURA, ALTURA)
+        assert imagem.n_frames == len(quadros) and imagem.info["loop"] == 0
+        duracoes = []
+        for i in range(imagem.n_frames):
+            imagem.seek(i)
+            duracoes.append(imagem.info["duration"])
+    assert duracoes == [round(100 * repeticoes / FPS) * 10 for _p, _q, repeticoes in quadros]
+
+
+def test_sequencia_png_repete_as_pausas(tmp_path, instancia):
+    destino = tmp_path / "quadros"
+    resumo = exportar_animacao(instancia["entidades"], instancia["caminho"], instancia["rotulos"], str(destino),
+                               **_opcoes(processos=0))
+    arquivos = sorted(destino.iterdir())
+    assert len(arquivos) == resumo["quadros"]
+    with Image.open(arquivos[0]) as primeiro:
+        assert primeiro.size == (LARGURA, ALTURA)
+
+
+def test_pool_gera_os_mesmos_bytes(tmp_path, instancia):
+    instancias = [dict(instancia, id=i, destino=str(tmp_path / f"{modo}_{i}.gif"))
+                  for modo in ("serial", "pool") for i in range(2)]
+    resumos = list(exportar_lote(instancias[:2], **_opcoes(processos=0)))
+    resumos += list(exportar_lote(instancias[2:], **_opcoes(processos=2, max_pendentes=2)))
+    assert [r["id"] for r in resumos] == [0, 1, 0, 1]
+    for i in range(2):
+        assert (tmp_path / f"serial_{i}.gif").read_bytes() == (tmp_path / f"pool_{i}.gif").read_bytes()
+
+
+@pytest.mark.skipif(shutil.which("ffmpeg") is not None, reason="o ffmpeg está instalado")
+def test_video_sem_ffmpeg_e_erro_claro(tmp_path, instancia):
+    with pytest.raises(RuntimeError, match="ffmpeg"):
+        exportar_animacao(instancia["entidades"], instancia["caminho"], instancia["rotulos"], str(tmp_path / "t.mp4"),
+                          **_opcoes(processos=0))
@@ -0,0 +1,37 @@
+import pytest
+
+pytest.importorskip("numpy")
+
+from travessia import RegrasTravessia
+from travessia import externo
+from travessia.busca import buscar_bfs
+
+
+@pytest.mark.parametrize("memoria_mb, mapas_grandes", [(0.0001, True), (0.05, False)])
+def test_memoria_minima_le_em_blocos_e_bate_com_a_bfs(monkeypatch, memoria_mb, mapas_grandes):
+    chamadas = {"expandir": 0, "liberar_paginas": 0}
+
+    def contando(nome, funcao):
+        def envolvida(*args, **kwargs):
+            chamadas[nome] += 1
+            return funcao(*args, **kwargs)
+        return envolvida
+
+    monkeypatch.setattr(externo, "expandir", contando("expandir", externo.expandir))
+    monkeypatch.setattr(externo._Mapa, "liberar_paginas", contando("liberar_paginas", externo._Mapa.liberar_paginas))
+    regras = RegrasTravessia.generalizada(3, 3, 3, capacidade=4)
+    referencia = buscar_bfs(regras, 0, regras.estado_final)
+    resultado = externo.buscar_externo(regras, 0, memoria_mb=memoria_mb)
+    assert resultado.caminho == referencia.caminho
+    assert resultado.nos_expandidos == referencia.nos_expandidos
+    # Mais blocos que camadas; mapas maiores que o limite devolvem as páginas depois de cada bloco,
+    # menos o bloco em que o final aparece.
+    assert chamadas["expandir"] > referencia.comprimento
+    assert chamadas["liberar_paginas"] == (2 * (chamadas["expandir"] - 1) if mapas_grandes else 0)
+
+
+def test_sem_solucao_apaga_os_temporarios(tmp_path):
+    regras = RegrasTravessia.generalizada(3, 3, 3)
+    resultado = externo.buscar_externo(regras, 0, diretorio=str(tmp_path), memoria_mb=0.001)
+    assert resultado.caminho is None
+    assert list(tmp_path.iterdir()) == []
@@ -0,0 +1,53 @@
+import pytest
+
+from travessia import RegrasTravessia
+from travessia.grafo import explorar, layout_camadas
+
+
+def _profundidades_bfs(regras, inicio):
+    profundidade, camada = {inicio: 0}, [inicio]
+    while camada:
+        seguinte = []
+        for estado in camada:
+            for _movimento, proximo in regras.sucessores(estado):
+                if proximo not in profundidade:
+                    profundidade[proximo] = profundidade[estado] + 1
+                    seguinte.append(proximo)
+        camada = seguinte
+    return profundidade
+
+
+@pytest.mark.parametrize("regras", [RegrasTravessia.classica(), RegrasTravessia.sintetica(6)])
+def test_explorar_alcanca_o_mesmo_que_a_bfs(regras):
+    esperado = _profundidades_bfs(regras, 0)
+    espaco = explorar(regras, 0)
+    assert dict(zip(espaco.estados, espaco.profundidades)) == esperado
+    assert all(espaco.indice[estado] == i for i, estado in enumerate(espaco.estados))
+    for i, j, movimento in espaco.arestas:
+        assert i < j and regras.transicao(espaco.estados[i], movimento) == espaco.estados[j]
+
+
+def test_explorar_respeita_o_limite():
+    regras = RegrasTravessia.sintetica(6)
+    esperado = _profundidades_bfs(regras, 0)
+    espaco = explorar(regras, 0, limite=20)
+    assert len(espaco) == 20
+    assert all(esperado[estado] == d for estado, d in zip(espaco.estados, espaco.profundidades))
+    assert espaco.profundidades == sorted(espaco.profundidades)
+    assert all(j < 20 for _i, j, _movimento in espaco.arestas)
+
+
+def test_layout_poe_cada_estado_na_camada_da_sua_profundidade():
+    pytest.importorskip("numpy")
+    regras = RegrasTravessia.sintetica(6)
+    esperado = _profundidades_bfs(regras, 0)
+    espaco = explorar(regras, 0)
+    posicoes = layout_camadas(espaco.profundidades, espaco.arestas)
+    maior = max(esperado.values())
+    assert posicoes.shape == (len(espaco), 2)
+    assert [round(y * maior) for y in posicoes[:, 1]] == [esperado[estado] for estado in espaco.estados]
+    assert ((posicoes[:, 0] > 0) & (posicoes[:, 0] < 1)).all()
+    # Dentro de uma camada os nós não se sobrepõem.
+    for d in range(maior + 1):
+        xs = posicoes[[i for i, estado in enumerate(espaco.estados) if esperado[estado] == d], 0]
+        assert len(set(xs.round(9))) == len(xs)
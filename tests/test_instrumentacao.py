@@ -0,0 +1,67 @@
+import csv
+import json
+import pickle
+
+import pytest
+
+from travessia import RegrasTravessia, instrumentacao, resolver
+
+
+@pytest.fixture
+def instrumentado():
+    estava = instrumentacao.ATIVA
+    instrumentacao.ativar()
+    instrumentacao.reiniciar()
+    yield
+    instrumentacao.ativar(estava)
+    instrumentacao.reiniciar()
+
+
+def test_busca_conta_transicoes(instrumentado):
+    regras = RegrasTravessia.classica()
+    resultado = resolver(regras, 0, "bfs")
+    contadores = instrumentacao.resumo()["contadores"]
+    assert contadores["busca.estados_expandidos"] == resultado.nos_expandidos
+    assert contadores["busca.transicoes_tentadas"] > contadores["busca.transicoes_rejeitadas"] > 0
+    assert instrumentacao.resumo()["medidas"]["busca.bfs.tempo_ms"]["n"] == 1
+
+
+def test_estrategias_do_numpy_nao_inventam_contadores_de_transicao(instrumentado):
+    pytest.importorskip("numpy")
+    resultado = resolver(RegrasTravessia.classica(), 0, "vetorizado")
+    contadores = instrumentacao.resumo()["contadores"]
+    assert contadores == {"busca.estados_expandidos": resultado.nos_expandidos}
+
+
+def test_regras_contadas_sobrevivem_a_pickle():
+    contadas = instrumentacao.RegrasContadas(RegrasTravessia.classica())
+    list(contadas.sucessores(0))
+    copia = pickle.loads(pickle.dumps(contadas))
+    assert copia.tentadas == contadas.tentadas and copia.movimentos == contadas.movimentos
+    with pytest.raises(AttributeError):
+        instrumentacao.RegrasContadas.__new__(instrumentacao.RegrasContadas).movimentos
+
+
+def test_desligada_nao_registra():
+    estava = instrumentacao.ATIVA
+    instrumentacao.ativar(False)
+    try:
+        instrumentacao.reiniciar()
+        instrumentacao.contar("x")
+        instrumentacao.registrar("y_ms", 1.0)
+        assert instrumentacao.resumo() == {"contadores": {}, "medidas": {}}
+    finally:
+        instrumentacao.ativar(estava)
+
+
+def test_exporta_json_e_csv(instrumentado, tmp_path):
+    instrumentacao.contar("quadros", 3)
+    for valor in (0.5, 3.0, 40.0):
+        instrumentacao.registrar("quadro_ms", valor)
+    instrumentacao.exportar_json(tmp_path / "m.json")
+    dados = json.loads((tmp_path / "m.json").read_text(encoding="utf-8"))
+    assert dados["contadores"] == {"quadros": 3}
+    assert dados["medidas"]["quadro_ms"]["max"] == 40.0
+    instrumentacao.exportar_csv(tmp_path / "m.csv")
+    linhas = list(csv.reader((tmp_path / "m.csv").open(encoding="utf-8")))
+    assert [linha[0] for linha in linhas[1:]] == ["quadros", "quadro_ms"]
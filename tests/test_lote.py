@@ -0,0 +1,49 @@
+import json
+
+from travessia.lote import ler_pedidos, processar, resolver_pedido
+
+
+def test_ler_pedidos_aceita_estados_e_objetos():
+    linhas = ['"E E E E"', "# comentário", "", '{"id": "x", "estado": ["E", "D", "E", "D"]}', "D E D E"]
+    pedidos = list(ler_pedidos(linhas))
+    assert pedidos == [{"estado": "E E E E", "id": 1}, {"id": "x", "estado": ["E", "D", "E", "D"]},
+                       {"estado": "D E D E", "id": 5}]
+
+
+def test_resolve_o_classico():
+    resposta = resolver_pedido({"id": 1, "estado": "e e e e"})
+    assert resposta["comprimento"] == 7 and "erro" not in resposta
+    assert resposta["caminho"][0] == "E E E E" and resposta["caminho"][-1] == "D D D D"
+    assert len(resposta["acoes"]) == len(resposta["rotulos"]) == 7
+
+
+def test_estado_invalido_e_erro():
+    assert "viola" in resolver_pedido({"id": 1, "estado": "D E E D"})["erro"]
+
+
+def test_estado_inconsistente_e_erro():
+    # Fazendeiro e cabra na margem direita, mas o barco na esquerda.
+    resposta = resolver_pedido({"id": 1, "estado": "D E D E E"})
+    assert "inconsistente" in resposta["erro"]
+    assert "caminho" not in resposta
+
+
+def test_pedidos_malformados_viram_erros():
+    for pedido in ({"estado": "E E E"}, {"estado": "E X E E"}, {"estado": 42}, {"estado": "E E E E", "regras": {}},
+                   {"estado": "E E E E", "estrategia": "dfs"}):
+        assert "erro" in resolver_pedido(dict(pedido, id=1))
+
+
+def test_regras_personalizadas_e_tabela():
+    regras = {"entidades": ["f", "a", "b"], "grupos_proibidos": [["a", "b"]], "capacidade": 2}
+    resposta = resolver_pedido({"id": 1, "estado": "E E E", "regras": regras}, estrategia="tabela")
+    assert resposta["comprimento"] == 3
+
+
+def test_processar_no_proprio_processo_e_no_pool():
+    pedidos = [{"id": i, "estado": estado} for i, estado in enumerate(["E E E E", "D E D E", "D E E D", "E D E D"])]
+    seriais = list(processar(pedidos, processos=0))
+    assert [r["id"] for r in seriais] == [0, 1, 2, 3]
+    paralelos = sorted(processar(pedidos, processos=2, tamanho_bloco=1), key=lambda r: r["id"])
+    sem_tempo = lambda respostas: [json.dumps({k: v for k, v in r.items() if k != "tempo_ms"}) for r in respostas]
+    assert sem_tempo(paralelos) == sem_tempo(seriais)
@@ -0,0 +1,49 @@
+import multiprocessing
+import os
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from travessia import RegrasTravessia, instrumentacao, resolver
+from travessia.paralelo import buscar_paralelo, particao
+
+
+def _segmentos():
+    return set(os.listdir("/dev/shm")) if os.path.isdir("/dev/shm") else set()
+
+
+@pytest.mark.parametrize("processos", [0, 1, 3])
+def test_comprimento_igual_ao_serial(processos):
+    regras = RegrasTravessia.sintetica(9)
+    for inicio in range(0, regras.num_estados, 97):
+        if not (regras.valido(inicio) and regras.consistente(inicio)): continue
+        resultado = buscar_paralelo(regras, inicio, processos=processos)
+        assert resultado.comprimento == resolver(regras, inicio, "bfs").comprimento
+
+
+def test_spawn_com_regras_instrumentadas():
+    # No spawn as regras vão por pickle para cada processo, como no macOS e no Windows.
+    regras = RegrasTravessia.sintetica(10)
+    antes = _segmentos()
+    contadas = instrumentacao.RegrasContadas(regras)
+    resultado = buscar_paralelo(contadas, 0, processos=2, contexto=multiprocessing.get_context("spawn"))
+    assert resultado.comprimento == resolver(regras, 0, "bfs").comprimento
+    assert _segmentos() == antes
+
+
+def test_resolver_instrumentado():
+    estava = instrumentacao.ATIVA
+    instrumentacao.ativar()
+    try:
+        assert resolver(RegrasTravessia.classica(), 0, "paralelo").comprimento == 7
+    finally:
+        instrumentacao.ativar(estava)
+        instrumentacao.reiniciar()
+
+
+def test_particoes_cobrem_todos_os_donos():
+    import numpy as np
+    donos = particao(np.arange(1 << 12, dtype=np.uint64), 4)
+    assert set(donos.tolist()) == {0, 1, 2, 3}
+    assert np.bincount(donos.astype(np.int64)).min() > (1 << 12) // 8
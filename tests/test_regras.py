@@ -0,0 +1,68 @@
+import pytest
+
+from travessia import DIREITA, ESQUERDA, RegrasTravessia
+
+
+@pytest.fixture
+def classica():
+    return RegrasTravessia.classica()
+
+
+def test_classica_codifica_e_decodifica(classica):
+    assert classica.codificar(("E", "E", "E", "E")) == 0
+    assert classica.codificar(("D", "D", "D", "D")) == classica.estado_final
+    for codigo in range(classica.num_estados):
+        if not classica.consistente(codigo): continue
+        assert classica.codificar(classica.decodificar(codigo)) == codigo
+
+
+def test_classica_movimentos_na_ordem_do_jogo(classica):
+    assert classica.nomes_movimentos == ["lobo", "cabra", "repolho", "sozinho"]
+
+
+def test_classica_validade(classica):
+    assert classica.valido(classica.codificar(("E", "D", "E", "D")))
+    # Lobo e cabra sozinhos na margem esquerda.
+    assert not classica.valido(classica.codificar(("D", "E", "E", "D")))
+    # Cabra e repolho sozinhos na margem direita.
+    assert not classica.valido(classica.codificar(("E", "E", "D", "D")))
+
+
+def test_consistencia_do_barco(classica):
+    assert classica.consistente(classica.codificar(("D", "E", "E", "E")))
+    assert not classica.consistente(classica.codificar(("D", "E", "E", "E"), barco=ESQUERDA))
+
+
+def test_sucessores_batem_com_transicao():
+    for regras in (RegrasTravessia.classica(), RegrasTravessia.sintetica(4), RegrasTravessia.generalizada(2, 1, 2)):
+        for estado in range(regras.num_estados):
+            esperados = {(i, regras.transicao(estado, i)) for i in range(len(regras.movimentos))
+                         if regras.transicao(estado, i) is not None}
+            assert set(regras.sucessores(estado)) == esperados
+            for i, proximo in esperados:
+                assert regras.movimento_entre(estado, proximo) == i
+
+
+def test_dict_ida_e_volta():
+    regras = RegrasTravessia.sintetica(5, capacidade=3)
+    assert RegrasTravessia.de_dict(regras.para_dict()) == regras
+    assert hash(RegrasTravessia.de_dict(regras.para_dict())) == hash(regras)
+
+
+@pytest.mark.parametrize("argumentos, mensagem", [
+    ((["a", "a"], []), "únicos"),
+    ((["a", "b"], [("a", "c")]), "desconhecida"),
+    ((["a", "b"], [], None, [], 2), "remador"),
+    ((["a", "b"], [], None, None, 0), "passageiro"),
+])
+def test_regras_invalidas(argumentos, mensagem):
+    with pytest.raises(ValueError, match=mensagem):
+        RegrasTravessia(*argumentos)
+
+
+def test_codificar_rejeita_posicoes_invalidas(classica):
+    with pytest.raises(ValueError):
+        classica.codificar(("E", "E", "E"))
+    with pytest.raises(ValueError):
+        classica.codificar(("E", "X", "E", "E"))
+    assert classica.decodificar(classica.bit_barco | 1, com_barco=True) == (DIREITA, ESQUERDA, ESQUERDA, ESQUERDA, DIREITA)
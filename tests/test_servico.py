@@ -0,0 +1,115 @@
+import asyncio
+import json
+
+from travessia.servico import MAX_CORPO, ServicoTravessia, chave_pedido
+
+
+async def _enviar(host, porta, bruto):
+    """Envia uma requisição crua e devolve ``(status, corpo JSON)``."""
+    leitor, escritor = await asyncio.open_connection(host, porta)
+    try:
+        escritor.write(bruto)
+        await escritor.drain()
+        status = int((await leitor.readline()).split()[1])
+        tamanho = 0
+        while True:
+            linha = await leitor.readline()
+            if linha in (b"\r\n", b""): break
+            nome, _, valor = linha.decode("latin-1").partition(":")
+            if nome.strip().lower() == "content-length": tamanho = int(valor)
+        return status, json.loads(await leitor.readexactly(tamanho))
+    finally:
+        escritor.close()
+
+
+def _post(corpo, caminho="/resolver", content_length=None):
+    tamanho = len(corpo) if content_length is None else content_length
+    return f"POST {caminho} HTTP/1.1\r\nHost: t\r\nContent-Length: {tamanho}\r\n\r\n".encode("latin-1") + corpo
+
+
+def _com_servico(teste, **opcoes):
+    async def principal():
+        opcoes.setdefault("processos", 0)
+        async with await ServicoTravessia(**opcoes).iniciar("127.0.0.1", 0) as servico:
+            return await teste(servico, *servico.endereco)
+    return asyncio.run(principal())
+
+
+def test_resolve_e_mede():
+    async def teste(servico, host, porta):
+        status, resposta = await _enviar(host, porta, _post(b'{"id": 7, "estado": "E E E E"}'))
+        assert (status, resposta["id"], resposta["comprimento"]) == (200, 7, 7)
+        status, metricas = await _enviar(host, porta, b"GET /metricas HTTP/1.1\r\n\r\n")
+        assert status == 200 and metricas["calculos"] == 1 and metricas["respostas"]["200"] == 1
+        return await _enviar(host, porta, b"GET /saude HTTP/1.1\r\n\r\n")
+    assert _com_servico(teste) == (200, {"ok": True})
+
+
+def test_entradas_malformadas_respondem_400():
+    async def teste(_servico, host, porta):
+        return [
+            await _enviar(host, porta, _post(b"{nao e json")),
+            await _enviar(host, porta, _post(b"\xff\xfe")),
+            await _enviar(host, porta, b"LIXO\r\n\r\n"),
+            await _enviar(host, porta, _post(b"", content_length="abc")),
+            await _enviar(host, porta, _post(b"", content_length=-5)),
+        ]
+    for status, resposta in _com_servico(teste):
+        assert status == 400 and resposta["erro"]
+
+
+def test_cabecalhos_malformados():
+    async def teste(_servico, host, porta):
+        longa = "a" * (70 * 1024)
+        return [
+            (await _enviar(host, porta, b"GET /saude HTTP/1.1\r\nSem dois pontos\r\n\r\n"))[0],
+            (await _enviar(host, porta, f"GET /saude HTTP/1.1\r\nX-Longo: {longa}\r\n\r\n".encode()))[0],
+            (await _enviar(host, porta, f"GET /{longa} HTTP/1.1\r\n\r\n".encode()))[0],
+        ]
+    assert _com_servico(teste) == [400, 431, 414]
+
+
+def test_estado_invalido_volta_como_erro_do_pedido():
+    async def teste(_servico, host, porta):
+        return await _enviar(host, porta, _post(b'"D E E D"'))
+    status, resposta = _com_servico(teste)
+    assert status == 200 and "viola" in resposta["erro"]
+
+
+def test_caminho_e_metodo_errados():
+    async def teste(_servico, host, porta):
+        return (await _enviar(host, porta, b"GET /resolver HTTP/1.1\r\n\r\n"))[0], \
+            (await _enviar(host, porta, b"GET /outro HTTP/1.1\r\n\r\n"))[0]
+    assert _com_servico(teste) == (405, 404)
+
+
+def test_corpo_grande_demais_responde_413():
+    async def teste(_servico, host, porta):
+        # Só o cabeçalho: o serviço recusa antes de ler o corpo.
+        return await _enviar(host, porta, _post(b"", content_length=MAX_CORPO + 1))
+    status, resposta = _com_servico(teste)
+    assert status == 413 and str(MAX_CORPO) in resposta["erro"]
+
+
+def test_excesso_de_pendentes_responde_503():
+    async def teste(_servico, host, porta):
+        # A janela longa segura o primeiro cálculo pendente enquanto o segundo chega.
+        primeiro = asyncio.create_task(_enviar(host, porta, _post(b'"E E E E"')))
+        await asyncio.sleep(0.05)
+        segundo = await _enviar(host, porta, _post(b'"D E D E"'))
+        return (await primeiro)[0], segundo[0]
+    assert _com_servico(teste, max_pendentes=1, janela_ms=300) == (200, 503)
+
+
+def test_pedidos_identicos_sao_coalescidos():
+    async def teste(servico, host, porta):
+        respostas = await asyncio.gather(*(_enviar(host, porta, _post(json.dumps({"id": i, "estado": "E E E E"}).encode()))
+                                           for i in range(5)))
+        return [r["id"] for _s, r in respostas], servico.calculos, servico.coalescidas
+    ids, calculos, coalescidas = _com_servico(teste, janela_ms=100)
+    assert sorted(ids) == list(range(5)) and (calculos, coalescidas) == (1, 4)
+
+
+def test_chave_ignora_id_e_normaliza_o_estado():
+    assert chave_pedido({"id": 1, "estado": "e e e e"}, "bfs") == chave_pedido({"estado": ["E", "E", "E", "E"]}, "bfs")
+    assert chave_pedido({"estado": "E E E E"}, "bfs") != chave_pedido({"estado": "E E E E"}, "astar")
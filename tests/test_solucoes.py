@@ -0,0 +1,66 @@
+import pytest
+
+from travessia import BuscaCancelada, RegrasTravessia, SolucoesMinimas, contar_solucoes, enumerar_solucoes, resolver
+
+
+def _todas_por_forca_bruta(regras, inicio, comprimento):
+    caminhos = [[inicio]]
+    for _ in range(comprimento):
+        caminhos = [caminho + [proximo] for caminho in caminhos for _m, proximo in regras.sucessores(caminho[-1])]
+    return sorted(caminho for caminho in caminhos if caminho[-1] == regras.estado_final)
+
+
+@pytest.mark.parametrize("regras", [RegrasTravessia.classica(), RegrasTravessia.sintetica(3),
+                                    RegrasTravessia.generalizada(1, 2, 1, capacidade=3)])
+def test_enumeracao_bate_com_forca_bruta(regras):
+    solucoes = SolucoesMinimas(regras, 0)
+    assert solucoes.comprimento == resolver(regras, 0).comprimento
+    todas = list(solucoes)
+    assert len(todas) == solucoes.total == contar_solucoes(regras, 0)
+    assert sorted(todas) == _todas_por_forca_bruta(regras, 0, solucoes.comprimento)
+    assert list(enumerar_solucoes(regras, 0)) == todas
+
+
+def test_classica_tem_duas_solucoes():
+    assert contar_solucoes(RegrasTravessia.classica(), 0) == 2
+
+
+def test_caminho_e_posicao_sao_inversos():
+    solucoes = SolucoesMinimas(RegrasTravessia.sintetica(4), 0)
+    assert solucoes.total > 1
+    for i, caminho in enumerate(solucoes):
+        assert solucoes.caminho(i) == caminho
+        assert solucoes.posicao(caminho) == i
+        assert solucoes.caminho(solucoes.posicao(caminho)) == caminho
+
+
+def test_posicao_rejeita_caminhos_que_nao_sao_minimos():
+    regras = RegrasTravessia.classica()
+    solucoes = SolucoesMinimas(regras, 0)
+    caminho = solucoes.caminho(0)
+    with pytest.raises(ValueError):
+        solucoes.posicao(caminho[:-1])
+    with pytest.raises(ValueError):
+        solucoes.posicao([caminho[0], caminho[0], *caminho[2:]])
+    with pytest.raises(IndexError):
+        solucoes.caminho(solucoes.total)
+
+
+def test_sem_solucao_e_inicio_no_final():
+    regras = RegrasTravessia(["fazendeiro", "lobo", "cabra"], [("lobo", "cabra")], capacidade=1)
+    vazia = SolucoesMinimas(regras, 0)
+    assert (vazia.comprimento, vazia.total, list(vazia)) == (None, 0, [])
+    classica = RegrasTravessia.classica()
+    assert list(SolucoesMinimas(classica, classica.estado_final)) == [[classica.estado_final]]
+
+
+def test_progresso_pode_cancelar_a_contagem():
+    chamadas = []
+
+    def cancelar(*argumentos):
+        chamadas.append(argumentos)
+        raise BuscaCancelada()
+
+    with pytest.raises(BuscaCancelada):
+        SolucoesMinimas(RegrasTravessia.sintetica(12), 0, progresso=cancelar)
+    assert len(chamadas) == 1
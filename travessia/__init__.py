@@ -0,0 +1,8 @@
+from .regras import RegrasTravessia, ESQUERDA, DIREITA
+from .busca import BuscaCancelada, ResultadoBusca, ESTRATEGIAS, resolver
+from .compilado import TabelaCompilada
+from .automato import AutomatoTravessia
+from .solucoes import SolucoesMinimas, contar_solucoes, enumerar_solucoes
+
+__all__ = ["RegrasTravessia", "ESQUERDA", "DIREITA", "BuscaCancelada", "ResultadoBusca", "ESTRATEGIAS", "resolver", "TabelaCompilada", "AutomatoTravessia",
+           "SolucoesMinimas", "contar_solucoes", "enumerar_solucoes"]
@@ -0,0 +1,112 @@
+"""Relógio de quadros para animações no laço de eventos do Tk.
+
+As animações recebem o progresso calculado a partir do tempo decorrido, não
+do número de quadros: se o Tk atrasar, quadros são descartados e o movimento
+termina no tempo previsto.
+"""
+import math
+import time
+
+
+class _Animacao:
+    def __init__(self, duracao, atualizar, ao_terminar):
+        self.duracao = duracao
+        self.atualizar = atualizar
+        self.ao_terminar = ao_terminar
+        self.decorrido = 0.0
+        self.cancelada = False
+
+    def cancelar(self):
+        self.cancelada = True
+
+
+class AgendadorAnimacao:
+    def __init__(self, widget, fps=60, velocidade=1.0, relogio=time.perf_counter):
+        self.widget = widget
+        self.fps = fps
+        self.velocidade = velocidade
+        self.relogio = relogio
+        self._animacoes = []
+        self._job = None
+        self._ultimo_quadro = None
+        self.reiniciar_estatisticas()
+
+    @property
+    def intervalo(self):
+        return 1.0 / self.fps
+
+    def animar(self, duracao, atualizar, ao_terminar=None):
+        """Chama ``atualizar(progresso)`` a cada quadro até o progresso chegar a 1.
+
+        A duração é em segundos na velocidade 1; mudar ``velocidade`` no meio
+        da animação acelera ou desacelera o que falta.
+        """
+        animacao = _Animacao(duracao, atualizar, ao_terminar)
+        self._animacoes.append(animacao)
+        if self._job is None:
+            self._ultimo_quadro = self.relogio()
+            self._job = self.widget.after(0, self._quadro)
+        return animacao
+
+    def esperar(self, segundos, callback):
+        """Pausa entre etapas, também ajustada pela velocidade de reprodução."""
+        return self.widget.after(max(1, int(segundos * 1000 / self.velocidade)), callback)
+
+    def cancelar_tudo(self):
+        for animacao in self._animacoes: animacao.cancelar()
+        self._animacoes.clear()
+        if self._job is not None:
+            self.widget.after_cancel(self._job)
+            self._job = None
+
+    def _quadro(self):
+        agora = self.relogio()
+        delta = agora - self._ultimo_quadro
+        self._ultimo_quadro = agora
+        self._registrar_quadro(delta)
+
+        terminadas = []
+        for animacao in list(self._animacoes):
+            if animacao.cancelada: continue
+            animacao.decorrido += delta * self.velocidade
+            progresso = 1.0 if animacao.duracao <= 0 else min(1.0, animacao.decorrido / animacao.duracao)
+            animacao.atualizar(progresso)
+            if progresso >= 1.0: terminadas.append(animacao)
+
+        for animacao in terminadas:
+            if animacao in self._animacoes: self._animacoes.remove(animacao)
+        self._animacoes = [a for a in self._animacoes if not a.cancelada]
+
+        if self._animacoes:
+            # Desconta o tempo gasto neste quadro para manter o ritmo alvo.
+            gasto = self.relogio() - agora
+            self._job = self.widget.after(max(1, int((self.intervalo - gasto) * 1000)), self._quadro)
+        else:
+            self._job = None
+
+        for animacao in terminadas:
+            if animacao.ao_terminar: animacao.ao_terminar()
+
+    def reiniciar_estatisticas(self):
+        self._intervalos = []
+        self.quadros_descartados = 0
+
+    def _registrar_quadro(self, delta):
+        if delta <= 0: return
+        self._intervalos.append(delta)
+        # Um intervalo de cerca de N quadros indica N - 1 quadros descartados.
+        self.quadros_descartados += max(0, int(delta / self.intervalo + 0.5) - 1)
+
+    def estatisticas(self):
+        if not self._intervalos:
+            return {"quadros": 0, "quadros_descartados": 0}
+        ordenados = sorted(self._intervalos)
+        media = sum(ordenados) / len(ordenados)
+        return {
+            "quadros": len(ordenados),
+            "quadros_descartados": self.quadros_descartados,
+            "fps_medio": 1.0 / media,
+            "intervalo_medio_ms": media * 1000,
+            "intervalo_p95_ms": ordenados[min(len(ordenados) - 1, math.ceil(0.95 * len(ordenados)) - 1)] * 1000,
+            "intervalo_max_ms": ordenados[-1] * 1000,
+        }
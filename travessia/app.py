@@ -0,0 +1,1031 @@
+"""Interface gráfica em Tk do problema da travessia.
+
+Este módulo importa tkinter; Pillow e NumPy só são carregados quando a
+aplicação abre (``main``) ou quando uma visualização precisa deles, então o
+núcleo do pacote continua importável num servidor sem interface.
+"""
+import tkinter as tk
+from tkinter import ttk, messagebox, filedialog
+import os
+import sys
+import math
+import queue
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+from . import BuscaCancelada, RegrasTravessia, ESTRATEGIAS, TabelaCompilada, instrumentacao, layout, resolver
+from .animacao import AgendadorAnimacao
+from .automato import AutomatoTravessia
+from .cache import CacheSolucoes
+from .grafo import explorar, layout_camadas
+from .rotulos import nome_margem, rotulo_acao
+from .solucoes import SolucoesMinimas
+
+DIRETORIO_BASE = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# Estratégias de memória limitada: depois delas as soluções alternativas não são contadas.
+_SEM_CONTAGEM = ("externo", "paralelo")
+
+# Preenchidos por importar_imagens() quando a aplicação abre.
+ImageTk = renderizar_cenario = carregar_sprite = None
+
+
+def importar_imagens():
+    """Carrega o Pillow e os módulos que dependem dele; lança ImportError se faltar."""
+    global ImageTk, renderizar_cenario, carregar_sprite
+    from PIL import ImageTk
+    from .cenario import renderizar_cenario
+    from .sprites import carregar_sprite
+
+
+class _ImagensPreguicosas(dict):
+    def __init__(self, carregar):
+        super().__init__()
+        self._carregar = carregar
+
+    def __missing__(self, key):
+        imagem = self[key] = self._carregar(key)
+        return imagem
+
+
+class TravessiaApp(tk.Tk):
+    TAMANHO_CACHE_CENARIO = 4
+    LIMITE_ESTADOS_GRAFO = 20000
+    LIMITE_ROTULOS_GRAFO = 300
+    FPS_ANIMACAO = 60
+    DURACAO_TRAVESSIA = layout.DURACAO_TRAVESSIA
+
+    def __init__(self):
+        super().__init__()
+        self.title("Problema da Travessia e Simulação de Autômatos")
+        self.geometry("1000x850")
+        self.resizable(False, False)
+
+        self.regras = RegrasTravessia.classica()
+        self._tabela = None
+        self.caminho_solucao = None
+        self.passo_atual_animacao = 0
+        self.animacao_em_curso = False
+        
+        self._cache_cenario = OrderedDict()
+        self.agendador = AgendadorAnimacao(self, fps=self.FPS_ANIMACAO)
+        self.velocidade_var = tk.DoubleVar(value=1.0)
+        self._job_id_grafo = None
+        self._espaco = None
+        self._geracao_espaco = 0
+        self._fila_espaco = queue.Queue()
+        self._job_espaco = None
+        self._job_rotulos_espaco = None
+        self._geracao_busca = 0
+        self._fila_busca = queue.Queue()
+        self._job_busca = None
+        self._busca_cancelada = None
+        self._cache_solucoes = None
+        self._solucoes = None
+        self._indice_solucao = 0
+        self._caminho_codificado = None
+        self._job_id_animacao = None
+        self.grafo_caminho_data = None
+        self.grafo_item_map_data = None
+
+        main_frame = ttk.Frame(self, padding="10")
+        main_frame.pack(expand=True, fill="both")
+
+        self.notebook = ttk.Notebook(main_frame)
+        self.notebook.pack(expand=True, fill="both", padx=5, pady=5)
+        
+        tab_resolucao = ttk.Frame(self.notebook)
+        self.notebook.add(tab_resolucao, text="Solucionador do Problema")
+        
+        control_frame = ttk.Frame(tab_resolucao, padding="10")
+        control_frame.pack(fill=tk.X)
+        
+        ttk.Label(control_frame, text="Estado Inicial (F L C R):").pack(side=tk.LEFT, padx=(0, 5))
+        self.estado_entry = ttk.Entry(control_frame, width=20)
+        self.estado_entry.insert(0, "E E E E")
+        self.estado_entry.pack(side=tk.LEFT, padx=5)
+
+        ttk.Label(control_frame, text="Busca:").pack(side=tk.LEFT, padx=(10, 5))
+        self.estrategia_combo = ttk.Combobox(control_frame, values=["tabela", *ESTRATEGIAS], width=12, state="readonly")
+        self.estrategia_combo.set("tabela")
+        self.estrategia_combo.pack(side=tk.LEFT, padx=5)
+
+        self.solve_button = ttk.Button(control_frame, text="Resolver e Preparar Visualizações", command=self.resolver_e_preparar)
+        self.solve_button.pack(side=tk.LEFT, padx=5)
+        self.cancel_button = ttk.Button(control_frame, text="Cancelar", command=self._cancelar_busca, state="disabled")
+        self.cancel_button.pack(side=tk.LEFT, padx=5)
+
+        self.label_busca = ttk.Label(control_frame, text="")
+        self.label_busca.pack(side=tk.LEFT, padx=5)
+
+        solucoes_frame = ttk.Frame(tab_resolucao, padding=(10, 0))
+        solucoes_frame.pack(fill=tk.X)
+        self.solucao_anterior_button = ttk.Button(solucoes_frame, text="◀", width=3, state="disabled",
+                                                  command=lambda: self._mostrar_solucao(self._indice_solucao - 1))
+        self.solucao_anterior_button.pack(side=tk.LEFT, padx=5)
+        self.label_solucao = ttk.Label(solucoes_frame, text="")
+        self.label_solucao.pack(side=tk.LEFT, padx=5)
+        self.solucao_proxima_button = ttk.Button(solucoes_frame, text="▶", width=3, state="disabled",
+                                                 command=lambda: self._mostrar_solucao(self._indice_solucao + 1))
+        self.solucao_proxima_button.pack(side=tk.LEFT, padx=5)
+
+        self.notebook_visualizacao = ttk.Notebook(tab_resolucao)
+        self.notebook_visualizacao.pack(expand=True, fill="both", padx=10, pady=10)
+
+        tab_grafo = ttk.Frame(self.notebook_visualizacao)
+        self.notebook_visualizacao.add(tab_grafo, text="Grafo da Solução")
+        self.canvas_grafo = tk.Canvas(tab_grafo, bg="white", highlightthickness=0)
+        self.canvas_grafo.pack(fill=tk.BOTH, expand=True)
+        self.canvas_grafo.bind("<Configure>", self._on_resize_grafo)
+
+        self.tab_animacao = ttk.Frame(self.notebook_visualizacao)
+        self.notebook_visualizacao.add(self.tab_animacao, text="Animação da Travessia", state="disabled")
+        
+        anim_control_frame = ttk.Frame(self.tab_animacao, padding=(0, 10))
+        anim_control_frame.pack(fill=tk.X)
+        self.start_anim_button = ttk.Button(anim_control_frame, text="Iniciar Animação", command=self.iniciar_animacao, state="disabled")
+        self.start_anim_button.pack(side=tk.LEFT, padx=5)
+        self.reset_anim_button = ttk.Button(anim_control_frame, text="Resetar", command=self.preparar_animacao, state="disabled")
+        self.reset_anim_button.pack(side=tk.LEFT, padx=5)
+        self.label_velocidade, self.label_quadros = self._criar_controle_velocidade(anim_control_frame)
+
+        self.canvas_animacao = tk.Canvas(self.tab_animacao, highlightthickness=0)
+        self.canvas_animacao.pack(fill=tk.BOTH, expand=True)
+        self.canvas_animacao.bind("<Configure>", self._on_resize_animacao)
+
+        tab_espaco = ttk.Frame(self.notebook_visualizacao)
+        self.notebook_visualizacao.add(tab_espaco, text="Espaço de Estados")
+        self.canvas_espaco = tk.Canvas(tab_espaco, bg="white", highlightthickness=0)
+        self.canvas_espaco.pack(fill=tk.BOTH, expand=True)
+        self.canvas_espaco.bind("<Configure>", self._on_resize_espaco)
+        self.canvas_espaco.bind("<MouseWheel>", self._zoom_espaco)
+        self.canvas_espaco.bind("<Button-4>", self._zoom_espaco)
+        self.canvas_espaco.bind("<Button-5>", self._zoom_espaco)
+        self.canvas_espaco.bind("<ButtonPress-1>", self._iniciar_arrasto_espaco)
+        self.canvas_espaco.bind("<B1-Motion>", self._arrastar_espaco)
+        self.canvas_espaco.bind("<Double-Button-1>", lambda e: self._desenhar_espaco_estados())
+        
+        self.setup_automato_fixo_tab()
+
+        self.visuais_por_canvas = {}
+        self.sprites = dict(layout.SPRITES)
+        self.tempos_sprites = {}
+        self._load_images()
+        self._criar_sobreposicao_depuracao()
+
+    def _criar_sobreposicao_depuracao(self):
+        # F12 mostra as métricas de instrumentação por cima da janela (e liga a coleta).
+        self._job_depuracao = None
+        self.sobreposicao_depuracao = tk.Frame(self, bg="black", padx=6, pady=4)
+        self.label_depuracao = tk.Label(self.sobreposicao_depuracao, bg="black", fg="#00FF66", justify=tk.LEFT,
+                                        font=("Consolas", 9), anchor="w")
+        self.label_depuracao.pack(fill=tk.X)
+        botoes = tk.Frame(self.sobreposicao_depuracao, bg="black")
+        botoes.pack(fill=tk.X, pady=(4, 0))
+        for texto, comando in (("Exportar JSON", lambda: self._exportar_metricas("json")),
+                               ("Exportar CSV", lambda: self._exportar_metricas("csv")),
+                               ("Zerar", instrumentacao.reiniciar)):
+            ttk.Button(botoes, text=texto, command=comando).pack(side=tk.LEFT, padx=2)
+        self.bind("<F12>", lambda e: self._alternar_depuracao())
+
+    def _alternar_depuracao(self):
+        if self._job_depuracao is not None:
+            self.after_cancel(self._job_depuracao)
+            self._job_depuracao = None
+            self.sobreposicao_depuracao.place_forget()
+            instrumentacao.ativar(self._instrumentacao_antes)
+            return
+        # Volta ao estado anterior ao esconder (ligada se veio de TRAVESSIA_INSTRUMENTAR).
+        self._instrumentacao_antes = instrumentacao.ATIVA
+        instrumentacao.ativar()
+        self.sobreposicao_depuracao.place(relx=1.0, rely=0.0, x=-12, y=12, anchor="ne")
+        self._atualizar_depuracao()
+
+    def _atualizar_depuracao(self):
+        self.label_depuracao.config(text=instrumentacao.texto_resumo())
+        self.sobreposicao_depuracao.lift()
+        self._job_depuracao = self.after(500, self._atualizar_depuracao)
+
+    def _exportar_metricas(self, formato):
+        arquivo = filedialog.asksaveasfilename(defaultextension=f".{formato}", initialfile=f"metricas.{formato}",
+                                               filetypes=[(formato.upper(), f"*.{formato}")])
+        if not arquivo: return
+        try:
+            (instrumentacao.exportar_json if formato == "json" else instrumentacao.exportar_csv)(arquivo)
+        except OSError as erro:
+            messagebox.showerror("Erro ao Exportar", str(erro))
+
+    def _criar_controle_velocidade(self, frame):
+        ttk.Label(frame, text="Velocidade:").pack(side=tk.LEFT, padx=(15, 5))
+        ttk.Scale(frame, from_=0.25, to=4.0, variable=self.velocidade_var, command=self._on_velocidade,
+                  length=120).pack(side=tk.LEFT)
+        label_velocidade = ttk.Label(frame, text="1.00x", width=6)
+        label_velocidade.pack(side=tk.LEFT, padx=5)
+        label_quadros = ttk.Label(frame, text="", foreground="gray")
+        label_quadros.pack(side=tk.LEFT, padx=10)
+        return label_velocidade, label_quadros
+
+    def setup_automato_fixo_tab(self):
+        self.tab_automato_fixo = ttk.Frame(self.notebook, padding="10")
+        self.notebook.add(self.tab_automato_fixo, text="Simulação de Autômato (Fixo)")
+
+        # O controle é o AFD da travessia: a fita digitada é lida pelo motor e
+        # a animação segue os estados que ele visita.
+        self.automato_afd = AutomatoTravessia(regras=self.regras).afd()
+        self.automato_fita = []
+        self.automato_estados = []
+        self.automato_caminho_puzzle = []
+        self.automato_trajetoria = []
+        self.automato_passo_atual = 0
+        self.automato_animacao_em_curso = False
+
+        control_frame = ttk.Frame(self.tab_automato_fixo)
+        control_frame.pack(fill=tk.X, pady=(0, 10))
+        ttk.Label(control_frame, text="Fita:").pack(side=tk.LEFT, padx=(0, 5))
+        self.fita_entry = ttk.Entry(control_frame, width=24)
+        self.fita_entry.insert(0, "a b c a d b a")
+        self.fita_entry.pack(side=tk.LEFT, padx=5)
+        self.fita_entry.bind("<Return>", lambda e: self.iniciar_simulacao_fixa())
+        self.automato_start_button = ttk.Button(control_frame, text="Iniciar Simulação", command=self.iniciar_simulacao_fixa)
+        self.automato_start_button.pack(side=tk.LEFT, padx=5)
+        self.automato_reset_button = ttk.Button(control_frame, text="Resetar", command=self.resetar_simulacao_fixa, state="disabled")
+        self.automato_reset_button.pack(side=tk.LEFT, padx=5)
+        self.label_velocidade_automato, self.label_quadros_automato = self._criar_controle_velocidade(control_frame)
+
+        info_frame = ttk.Frame(self.tab_automato_fixo, borderwidth=2, relief="groove")
+        info_frame.pack(fill=tk.X, pady=5, padx=5)
+        
+        self.label_fita = ttk.Label(info_frame, text="Fita:", font=("Consolas", 12, "bold"))
+        self.label_fita.pack(pady=2, padx=10, anchor="w")
+        self.label_cabecote = ttk.Label(info_frame, text="Cabeçote:", font=("Consolas", 12))
+        self.label_cabecote.pack(pady=2, padx=10, anchor="w")
+        self.label_controle = ttk.Label(info_frame, text="Controle:", font=("Consolas", 14, "bold"))
+        self.label_controle.pack(pady=5, padx=10, anchor="w")
+        
+        self.label_transicao = ttk.Label(info_frame, text="Transição:", font=("Consolas", 14, "bold"), foreground="blue")
+        self.label_transicao.pack(pady=5, padx=10, anchor="w")
+
+        paned_window = ttk.PanedWindow(self.tab_automato_fixo, orient=tk.VERTICAL)
+        paned_window.pack(expand=True, fill=tk.BOTH)
+
+        self.canvas_diagrama_automato = tk.Canvas(paned_window, bg="ivory", highlightthickness=0, height=250)
+        paned_window.add(self.canvas_diagrama_automato, weight=2)
+        
+        self.canvas_animacao_automato = tk.Canvas(paned_window, highlightthickness=0)
+        paned_window.add(self.canvas_animacao_automato, weight=3)
+        
+        self.canvas_diagrama_automato.bind("<Configure>", lambda e: self.desenhar_diagrama_automato_fixo())
+        self.canvas_animacao_automato.bind("<Configure>", lambda e: self.resetar_simulacao_fixa() if not self.automato_animacao_em_curso else None)
+        
+        self.after(50, self.resetar_simulacao_fixa)
+    
+    def iniciar_simulacao_fixa(self):
+        if self.automato_animacao_em_curso: return
+        self.resetar_simulacao_fixa()
+        self.automato_animacao_em_curso = True
+        self.agendador.reiniciar_estatisticas()
+        self.automato_start_button.config(state="disabled")
+        self.automato_reset_button.config(state="disabled")
+        self.notebook.tab(0, state="disabled")
+        self.executar_passo_automato_fixo()
+
+    def _ler_fita_automato(self):
+        afd = self.automato_afd
+        self.automato_fita = afd.ler_fita(self.fita_entry.get())
+        trajetoria = self.automato_trajetoria = afd.percorrer(self.automato_fita)
+        self.automato_estados = [f"q{estado}" for estado in trajetoria]
+        self.automato_caminho_puzzle = [self.regras.decodificar(afd.nomes[estado]) for estado in trajetoria]
+
+    def resetar_simulacao_fixa(self):
+        self.automato_animacao_em_curso = False
+        self.automato_passo_atual = 0
+        self._ler_fita_automato()
+        self.automato_start_button.config(state="normal")
+        self.automato_reset_button.config(state="disabled")
+        self.notebook.tab(0, state="normal")
+        self._limpar_canvas_animacao(self.canvas_animacao_automato)
+        self._desenhar_cenario_animacao(self.canvas_animacao_automato)
+        self.desenhar_estado_animacao(self.automato_caminho_puzzle[0], self.canvas_animacao_automato)
+        self.atualizar_info_automato_fixo()
+        self.desenhar_diagrama_automato_fixo()
+
+    def executar_passo_automato_fixo(self):
+        if self.automato_passo_atual >= len(self.automato_estados) - 1:
+            self.atualizar_info_automato_fixo()
+            self.desenhar_diagrama_automato_fixo()
+            
+            # CORREÇÃO: Apaga o texto da ação anterior antes de mostrar a mensagem final
+            self.canvas_animacao_automato.delete("acao_texto")
+            
+            passo, estado = self.automato_passo_atual, self.automato_estados[-1]
+            if passo < len(self.automato_fita):
+                texto, cor = f"Fita rejeitada: δ({estado}, {self.automato_fita[passo]}) indefinida.", "red"
+            elif self.automato_trajetoria[-1] in self.automato_afd.finais:
+                texto, cor = "Fita aceita. Simulação Concluída!", "#32CD32"
+            else:
+                texto, cor = f"Fita rejeitada: {estado} não é final.", "red"
+            self.canvas_animacao_automato.create_text(
+                self.canvas_animacao_automato.winfo_width() / 2, 50,
+                text=texto, font=("Arial", 22, "bold"), fill=cor, tags="fim_msg"
+            )
+            self.automato_animacao_em_curso = False
+            self.automato_reset_button.config(state="normal")
+            self.notebook.tab(0, state="normal")
+            return
+
+        self.atualizar_info_automato_fixo()
+        self.desenhar_diagrama_automato_fixo()
+        
+        estado_anterior = self.automato_caminho_puzzle[self.automato_passo_atual]
+        estado_seguinte = self.automato_caminho_puzzle[self.automato_passo_atual + 1]
+        
+        def proximo_passo_callback():
+            self.automato_passo_atual += 1
+            self.executar_passo_automato_fixo()
+
+        self.animar_passo_generico(
+            estado_anterior, estado_seguinte,
+            canvas=self.canvas_animacao_automato,
+            callback=proximo_passo_callback
+        )
+
+    def atualizar_info_automato_fixo(self):
+        passo = self.automato_passo_atual
+        
+        fita_texto = " ".join(self.automato_fita)
+        self.label_fita.config(text=f"Fita:       {fita_texto}")
+
+        if passo < len(self.automato_fita):
+            cabecote_pos = sum(len(simbolo) + 1 for simbolo in self.automato_fita[:passo])
+            cabecote_texto = (" " * cabecote_pos) + "↑"
+            self.label_cabecote.config(text=f"Cabeçote:   {cabecote_texto}")
+        else:
+            self.label_cabecote.config(text="Cabeçote:")
+
+        estado_atual = self.automato_estados[passo]
+        self.label_controle.config(text=f"Controle:   {estado_atual}")
+
+        if self.automato_animacao_em_curso and passo < len(self.automato_estados) - 1:
+            simbolo_lido = self.automato_fita[passo]
+            proximo_estado = self.automato_estados[passo + 1]
+            transicao_texto = f"δ({estado_atual}, {simbolo_lido}) = {proximo_estado}"
+            self.label_transicao.config(text=f"Transição: {transicao_texto}")
+        else:
+            self.label_transicao.config(text="Transição: -")
+
+    @instrumentacao.itens_canvas("canvas.diagrama_automato.itens_criados")
+    def desenhar_diagrama_automato_fixo(self):
+        canvas = self.canvas_diagrama_automato
+        canvas.delete("all")
+        
+        width, height = canvas.winfo_width(), canvas.winfo_height()
+        if width < 50 or height < 50: return
+
+        num_nodes = len(self.automato_estados)
+        padding_x, padding_y = width * 0.10, height * 0.5
+        x_step = (width - 2 * padding_x) / max(1, num_nodes - 1)
+        node_radius = min(width * 0.035, height * 0.15, 25, x_step * 0.35)
+
+        # Posição por passo: o mesmo estado pode aparecer mais de uma vez na trajetória.
+        posicoes = [(padding_x + i * x_step, padding_y) for i in range(num_nodes)]
+
+        for i in range(num_nodes - 1):
+            simbolo = self.automato_fita[i]
+            x1, y1 = posicoes[i]
+            x2, y2 = posicoes[i + 1]
+            
+            is_active_transition = (i == self.automato_passo_atual) and self.automato_animacao_em_curso
+            cor = "red" if is_active_transition else "darkgreen"
+            largura = 3 if is_active_transition else 1.5
+
+            canvas.create_line(x1 + node_radius, y1, x2 - node_radius, y2, arrow=tk.LAST, fill=cor, width=largura)
+            canvas.create_text((x1+x2)/2, y1 - 25, text=simbolo, font=("Arial", 12, "italic"), fill=cor)
+
+        for i, estado in enumerate(self.automato_estados):
+            x, y = posicoes[i]
+            is_active_state = (i == self.automato_passo_atual) or \
+                                (self.automato_animacao_em_curso and i == self.automato_passo_atual + 1)
+            
+            cor_borda = "red" if is_active_state else "black"
+            cor_fundo = "gold" if is_active_state else "lightblue"
+            largura = 3 if is_active_state else 2
+
+            canvas.create_oval(x - node_radius, y - node_radius, x + node_radius, y + node_radius, 
+                                    fill=cor_fundo, outline=cor_borda, width=largura)
+            canvas.create_text(x, y, text=estado, font=("Arial", 14, "bold"))
+
+    def _load_images(self):
+        # Os sprites só são lidos quando algum canvas visível os desenha pela
+        # primeira vez; as versões redimensionadas ficam em cache no disco.
+        self.loaded_images = _ImagensPreguicosas(self._carregar_sprite)
+
+    def _carregar_sprite(self, key):
+        arquivo, tamanho = self.sprites[key]
+        inicio = time.perf_counter()
+        imagem = ImageTk.PhotoImage(carregar_sprite(os.path.join(DIRETORIO_BASE, arquivo), tamanho))
+        self.tempos_sprites[key] = time.perf_counter() - inicio
+        instrumentacao.registrar("imagens.carregar_sprite_ms", self.tempos_sprites[key] * 1000)
+        return imagem
+
+    def _get_movimento_label(self, estado_anterior, estado_atual, item_map):
+        destino = nome_margem(estado_atual[0])
+        item_movido = "sozinho"
+        for item, index in item_map.items():
+            if estado_anterior[index] != estado_atual[index]:
+                item_movido = item
+                break
+        return rotulo_acao(item_movido, destino)
+
+    def resolver_e_preparar(self):
+        self.canvas_grafo.delete("all")
+        self.notebook_visualizacao.tab(1, state="disabled")
+        self.start_anim_button.config(state="disabled")
+        self.reset_anim_button.config(state="disabled")
+
+        entrada = self.estado_entry.get().strip().upper()
+        partes = entrada.split()
+
+        if len(partes) != 4 or not all(p in ['E', 'D'] for p in partes):
+            messagebox.showerror("Erro de Formato", "Formato inválido. Insira 4 valores ('E' ou 'D') separados por espaço.\nExemplo: E E E E")
+            return
+            
+        estado_inicial_usuario = tuple(partes)
+
+        inicio = self.regras.codificar(estado_inicial_usuario)
+        if not self.regras.valido(inicio):
+            messagebox.showerror("Estado Inválido", "O estado inicial viola as regras do problema.\n(Lobo/Cabra ou Cabra/Repolho não podem ficar sozinhos).")
+            return
+
+        self._iniciar_busca(inicio, self.estrategia_combo.get())
+
+    def _iniciar_busca(self, inicio, estrategia):
+        # A busca roda numa thread para a interface e as animações continuarem
+        # respondendo; progresso e resultado voltam pela fila e só são usados
+        # se ainda forem da busca mais recente.
+        self._cancelar_busca()
+        self._geracao_busca += 1
+        geracao, regras, tabela = self._geracao_busca, self.regras, self._tabela
+        cache = self._abrir_cache_solucoes()
+        cancelada = self._busca_cancelada = threading.Event()
+        self.cancel_button.config(state="normal")
+        self.label_busca.config(text="Buscando...")
+
+        def progresso(expandidos, fronteira, profundidade):
+            if cancelada.is_set(): raise BuscaCancelada()
+            self._fila_busca.put((geracao, "progresso", (expandidos, fronteira, profundidade)))
+
+        def calcular():
+            comeco = time.perf_counter()
+            try:
+                encontrado, caminho = cache.obter(regras, inicio) if cache else (False, None)
+                tabela_calculada = None
+                if encontrado:
+                    estatisticas = cache.estatisticas()
+                    texto = f"Solução do cache ({estatisticas['acertos']} acertos, {estatisticas['falhas']} falhas)"
+                elif estrategia == "tabela":
+                    tabela_calculada = tabela or TabelaCompilada.compilar(regras)
+                    caminho = tabela_calculada.caminho(inicio)
+                    texto = f"Distância: {tabela_calculada.distancia_ate_final(inicio)}" if caminho else ""
+                else:
+                    resultado = resolver(regras, inicio, estrategia, progresso=progresso)
+                    caminho = resultado.caminho
+                    texto = f"Nós expandidos: {resultado.nos_expandidos}"
+                if cache and not encontrado: cache.guardar(regras, inicio, caminho)
+                # Conta as soluções mínimas alternativas para a navegação entre elas. Essa
+                # contagem guarda todas as camadas em memória, então fica de fora das
+                # estratégias escolhidas justamente para espaços que não cabem nela.
+                solucoes = None
+                if caminho and estrategia not in _SEM_CONTAGEM:
+                    solucoes = SolucoesMinimas(regras, inicio, progresso=progresso)
+            except BuscaCancelada:
+                self._fila_busca.put((geracao, "cancelada", None))
+                return
+            except ImportError as erro:
+                self._fila_busca.put((geracao, "erro", ("Biblioteca Faltando", erro)))
+                return
+            except sqlite3.Error as erro:
+                self._fila_busca.put((geracao, "erro", ("Erro no Cache de Soluções", erro)))
+                return
+            instrumentacao.registrar("resolucao.tempo_total_ms", (time.perf_counter() - comeco) * 1000)
+            # A compilação da tabela não consulta o callback; o cancelamento vale no fim.
+            if cancelada.is_set(): self._fila_busca.put((geracao, "cancelada", None))
+            else: self._fila_busca.put((geracao, "resultado", (inicio, caminho, texto, tabela_calculada, solucoes)))
+
+        threading.Thread(target=calcular, daemon=True).start()
+        if self._job_busca is None:
+            self._job_busca = self.after(50, self._verificar_busca)
+
+    def _abrir_cache_solucoes(self):
+        # Sem acesso ao banco (disco somente leitura, por exemplo) a busca segue sem cache.
+        if self._cache_solucoes is None:
+            try:
+                self._cache_solucoes = CacheSolucoes()
+            except (sqlite3.Error, OSError) as erro:
+                print(f"Aviso: cache de soluções desativado: {erro}", file=sys.stderr)
+                self._cache_solucoes = False
+        return self._cache_solucoes
+
+    def _cancelar_busca(self):
+        if self._busca_cancelada is not None: self._busca_cancelada.set()
+        self._busca_cancelada = None
+        self.cancel_button.config(state="disabled")
+
+    def _verificar_busca(self):
+        self._job_busca = None
+        while True:
+            try:
+                geracao, tipo, dados = self._fila_busca.get_nowait()
+            except queue.Empty:
+                break
+            if geracao != self._geracao_busca: continue
+            if tipo == "progresso":
+                expandidos, fronteira, profundidade = dados
+                self.label_busca.config(text=f"Buscando... {expandidos} expandidos, fronteira {fronteira}, profundidade {profundidade}")
+                continue
+            self._busca_cancelada = None
+            self.cancel_button.config(state="disabled")
+            if tipo == "cancelada":
+                self.label_busca.config(text="Busca cancelada.")
+            elif tipo == "erro":
+                self.label_busca.config(text="")
+                titulo, erro = dados
+                messagebox.showerror(titulo, str(erro))
+            else:
+                self._concluir_busca(*dados)
+            return
+        self._job_busca = self.after(50, self._verificar_busca)
+
+    def _concluir_busca(self, inicio, caminho, texto, tabela, solucoes):
+        # O espaço de estados não muda entre cliques: a tabela é compilada uma vez e reutilizada.
+        if tabela is not None: self._tabela = tabela
+        self.label_busca.config(text=texto)
+        self._solucoes = solucoes
+        self._caminho_codificado = caminho
+        self.caminho_solucao = [self.regras.decodificar(estado) for estado in caminho] if caminho else None
+
+        if not self.caminho_solucao:
+            self._atualizar_navegacao_solucoes()
+            messagebox.showinfo("Sem Solução", "Não foi encontrada uma solução a partir do estado fornecido.")
+            return
+
+        self._indice_solucao = solucoes.posicao(caminho) if solucoes else 0
+        self._atualizar_navegacao_solucoes()
+        self.grafo_caminho_data = self.caminho_solucao
+        self.grafo_item_map_data = self.regras.itens
+        self._desenhar_solucao_grafo()
+        self._iniciar_layout_espaco(inicio)
+
+        self.preparar_animacao()
+        self.notebook_visualizacao.tab(1, state="normal")
+        self.notebook_visualizacao.select(1)
+        self.start_anim_button.config(state="normal")
+        self.reset_anim_button.config(state="normal")
+
+    def _mostrar_solucao(self, indice):
+        """Troca a solução exibida no grafo, na animação e no espaço de estados."""
+        solucoes = self._solucoes
+        if solucoes is None or self.animacao_em_curso or not 0 <= indice < solucoes.total: return
+        self._indice_solucao = indice
+        self._caminho_codificado = solucoes.caminho(indice)
+        self.caminho_solucao = [self.regras.decodificar(estado) for estado in self._caminho_codificado]
+        self.grafo_caminho_data = self.caminho_solucao
+        self._atualizar_navegacao_solucoes()
+        self._desenhar_solucao_grafo()
+        if self._espaco is not None:
+            self._marcar_caminho_espaco()
+            self._desenhar_espaco_estados()
+        self.preparar_animacao()
+
+    def _atualizar_navegacao_solucoes(self):
+        solucoes, indice = self._solucoes, self._indice_solucao
+        if solucoes is None or not solucoes.total:
+            self.label_solucao.config(text="")
+            self.solucao_anterior_button.config(state="disabled")
+            self.solucao_proxima_button.config(state="disabled")
+            return
+        livre = not self.animacao_em_curso
+        self.label_solucao.config(text=f"Solução mínima {indice + 1} de {solucoes.total} ({solucoes.comprimento} travessias)")
+        self.solucao_anterior_button.config(state="normal" if livre and indice > 0 else "disabled")
+        self.solucao_proxima_button.config(state="normal" if livre and indice + 1 < solucoes.total else "disabled")
+
+    def _on_resize_grafo(self, event):
+        if self._job_id_grafo:
+            self.after_cancel(self._job_id_grafo)
+        self._job_id_grafo = self.after(150, self._desenhar_solucao_grafo)
+
+    @instrumentacao.itens_canvas("canvas.grafo.itens_criados")
+    def _desenhar_solucao_grafo(self):
+        self.canvas_grafo.delete("all")
+        if not self.grafo_caminho_data: return
+
+        caminho = self.grafo_caminho_data
+        item_map, width, height = self.grafo_item_map_data, self.canvas_grafo.winfo_width(), self.canvas_grafo.winfo_height()
+        if width < 50 or height < 50: return
+
+        nodes_per_row = 4
+        padding_x, padding_y = width * 0.12, height * 0.15
+        
+        num_rows = math.ceil(len(caminho) / nodes_per_row)
+        x_step = (width - 2 * padding_x) / (nodes_per_row - 1) if nodes_per_row > 1 else 0
+        y_step = (height - 2 * padding_y) / (num_rows - 1) if num_rows > 1 else height / 2
+        node_radius = min(width * 0.03, height * 0.04, 30)
+        posicoes_nos = {} 
+
+        for i, estado in enumerate(caminho):
+            row, col = i // nodes_per_row, i % nodes_per_row
+            x = (padding_x + col * x_step) if row % 2 == 0 else (width - padding_x - col * x_step)
+            y = (padding_y + row * y_step) if num_rows > 1 else padding_y
+            posicoes_nos[i] = (x, y)
+
+        for i, estado in enumerate(caminho):
+            if i > 0:
+                px, py = posicoes_nos[i-1]
+                x, y = posicoes_nos[i]
+                self.canvas_grafo.create_line(px, py, x, y, arrow=tk.LAST, fill="darkgreen", width=1.5)
+                label_x, label_y = (px + x) / 2, (py + y) / 2 - 15
+                movimento = self._get_movimento_label(caminho[i-1], estado, item_map).split(" para")[0]
+                text_id = self.canvas_grafo.create_text(label_x, label_y, text=movimento, font=("Arial", 10, "italic"), fill="darkgreen")
+                bbox = self.canvas_grafo.bbox(text_id)
+                self.canvas_grafo.create_rectangle(bbox, fill="white", outline="")
+                self.canvas_grafo.tag_raise(text_id)
+
+        for i, estado in enumerate(caminho):
+            x, y = posicoes_nos[i]
+            self.canvas_grafo.create_oval(x-node_radius, y-node_radius, x+node_radius, y+node_radius, fill="lightblue", outline="black", width=2)
+            self.canvas_grafo.create_text(x, y - node_radius - 15, text=f"q{i}", font=("Arial", 14, "bold"))
+            self.canvas_grafo.create_text(x, y + node_radius + 20, text=str(estado), font=("Arial", 10), fill="black")
+
+    def _iniciar_layout_espaco(self, inicio):
+        # A exploração e o layout rodam numa thread; o resultado volta pela fila
+        # e só é desenhado se ainda for o da busca mais recente.
+        self._geracao_espaco += 1
+        geracao, regras = self._geracao_espaco, self.regras
+        self._espaco = None
+        self.canvas_espaco.delete("all")
+        self.canvas_espaco.create_text(20, 20, anchor="nw", text="Calculando o espaço de estados...", fill="gray")
+
+        def calcular():
+            try:
+                espaco = explorar(regras, inicio, self.LIMITE_ESTADOS_GRAFO)
+                posicoes = layout_camadas(espaco.profundidades, espaco.arestas)
+            except ImportError as erro:
+                self._fila_espaco.put((geracao, None, None, erro))
+                return
+            self._fila_espaco.put((geracao, espaco, posicoes, None))
+
+        threading.Thread(target=calcular, daemon=True).start()
+        if self._job_espaco is None:
+            self._job_espaco = self.after(50, self._verificar_layout_espaco)
+
+    def _verificar_layout_espaco(self):
+        self._job_espaco = None
+        while True:
+            try:
+                geracao, espaco, posicoes, erro = self._fila_espaco.get_nowait()
+            except queue.Empty:
+                break
+            if geracao != self._geracao_espaco: continue
+            if erro is not None:
+                self.canvas_espaco.delete("all")
+                self.canvas_espaco.create_text(20, 20, anchor="nw", text=str(erro), fill="red")
+                return
+            self._espaco = {"espaco": espaco, "posicoes": posicoes}
+            self._marcar_caminho_espaco()
+            self._desenhar_espaco_estados()
+            return
+        self._job_espaco = self.after(50, self._verificar_layout_espaco)
+
+    def _marcar_caminho_espaco(self):
+        # Usa a solução exibida no momento, que pode ter mudado durante o layout.
+        import numpy
+        dados = self._espaco
+        espaco = dados["espaco"]
+        indices_caminho = [espaco.indice[estado] for estado in self._caminho_codificado or () if estado in espaco.indice]
+        em_caminho = numpy.zeros(len(espaco), dtype=bool)
+        em_caminho[indices_caminho] = True
+        dados["caminho"], dados["em_caminho"] = indices_caminho, em_caminho
+
+    @instrumentacao.itens_canvas("canvas.espaco.itens_criados")
+    def _desenhar_espaco_estados(self):
+        import numpy
+        canvas, dados = self.canvas_espaco, self._espaco
+        if dados is None: return
+        canvas.delete("all")
+        w, h = canvas.winfo_width(), canvas.winfo_height()
+        if w < 50 or h < 50: return
+
+        espaco, posicoes = dados["espaco"], dados["posicoes"]
+        margem = 40
+        escala = numpy.array([w - 2 * margem, h - 2 * margem], dtype=float)
+        deslocamento = numpy.array([margem, margem], dtype=float)
+        tela = posicoes * escala + deslocamento
+
+        maior_camada = max(numpy.bincount(numpy.asarray(espaco.profundidades)).max(), 1)
+        num_camadas = max(espaco.profundidades) + 1
+        raio = max(2.0, min(12.0, 0.3 * min(escala[0] / maior_camada, escala[1] / num_camadas)))
+
+        arestas_caminho = set(zip(dados["caminho"], dados["caminho"][1:]))
+        for i, j, _movimento in espaco.arestas:
+            no_caminho = (i, j) in arestas_caminho or (j, i) in arestas_caminho
+            canvas.create_line(*tela[i], *tela[j], fill="red" if no_caminho else "#c8c8c8",
+                               width=2.5 if no_caminho else 1, tags=("grafo", "caminho" if no_caminho else "aresta"))
+        canvas.tag_raise("caminho")
+
+        for i, (x, y) in enumerate(tela):
+            cor = "gold" if dados["em_caminho"][i] else "lightblue"
+            canvas.create_oval(x - raio, y - raio, x + raio, y + raio, fill=cor, outline="black", tags=("grafo", "no"))
+
+        canvas.create_text(10, 10, anchor="nw", fill="gray", tags="legenda",
+                           text=f"{len(espaco)} estados, {len(espaco.arestas)} transições  |  "
+                                "roda do mouse: zoom, arrastar: mover, duplo clique: reenquadrar")
+        dados.update(escala=escala, deslocamento=deslocamento, raio=raio, tamanho=(w, h), rotulos={}, visiveis=set())
+        self._atualizar_rotulos_espaco()
+
+    def _on_resize_espaco(self, event):
+        import numpy
+        dados = self._espaco
+        if dados is None or "tamanho" not in dados:
+            self._desenhar_espaco_estados()
+            return
+        # Reaproveita os itens: só reescala o desenho para o novo tamanho.
+        w0, h0 = dados["tamanho"]
+        if event.width < 50 or event.height < 50 or (event.width, event.height) == (w0, h0): return
+        fator = numpy.array([event.width / w0, event.height / h0])
+        self.canvas_espaco.scale("grafo", 0, 0, *fator)
+        dados["escala"] = dados["escala"] * fator
+        dados["deslocamento"] = dados["deslocamento"] * fator
+        dados["tamanho"] = (event.width, event.height)
+        self._agendar_rotulos_espaco()
+
+    def _zoom_espaco(self, event):
+        import numpy
+        dados = self._espaco
+        if dados is None or "escala" not in dados: return
+        fator = 1.25 if event.num == 4 or getattr(event, "delta", 0) > 0 else 0.8
+        self.canvas_espaco.scale("grafo", event.x, event.y, fator, fator)
+        centro = numpy.array([event.x, event.y], dtype=float)
+        dados["escala"] = dados["escala"] * fator
+        dados["deslocamento"] = centro + fator * (dados["deslocamento"] - centro)
+        dados["raio"] *= fator
+        self._agendar_rotulos_espaco()
+
+    def _iniciar_arrasto_espaco(self, event):
+        self._arrasto_espaco = (event.x, event.y)
+
+    def _arrastar_espaco(self, event):
+        dados = self._espaco
+        if dados is None or "escala" not in dados: return
+        dx, dy = event.x - self._arrasto_espaco[0], event.y - self._arrasto_espaco[1]
+        self._arrasto_espaco = (event.x, event.y)
+        self.canvas_espaco.move("grafo", dx, dy)
+        dados["deslocamento"] = dados["deslocamento"] + (dx, dy)
+        self._agendar_rotulos_espaco()
+
+    def _agendar_rotulos_espaco(self):
+        if self._job_rotulos_espaco:
+            self.after_cancel(self._job_rotulos_espaco)
+        self._job_rotulos_espaco = self.after(80, self._atualizar_rotulos_espaco)
+
+    @instrumentacao.itens_canvas("canvas.espaco_rotulos.itens_criados")
+    def _atualizar_rotulos_espaco(self):
+        # Nível de detalhe: só recebem rótulo os nós visíveis cujo texto não
+        # sobrepõe outro já aceito; os do caminho da solução têm prioridade.
+        import numpy
+        self._job_rotulos_espaco = None
+        canvas, dados = self.canvas_espaco, self._espaco
+        if dados is None or "escala" not in dados: return
+        w, h = dados["tamanho"]
+        tela = dados["posicoes"] * dados["escala"] + dados["deslocamento"]
+        dentro = numpy.flatnonzero((tela[:, 0] >= 0) & (tela[:, 0] <= w) & (tela[:, 1] >= 0) & (tela[:, 1] <= h))
+        candidatos = dentro[numpy.argsort(~dados["em_caminho"][dentro], kind="stable")]
+
+        estados = dados["espaco"].estados
+        largura_rotulo, altura_rotulo = 9 * (self.regras.num_entidades + 1), 16
+        deslocamento_y = dados["raio"] + 9
+        ocupadas, aceitos = {}, set()
+        for i in candidatos:
+            x, y = tela[i, 0], tela[i, 1] - deslocamento_y
+            celula = (int(x // largura_rotulo), int(y // altura_rotulo))
+            livre = True
+            for cx in (celula[0] - 1, celula[0], celula[0] + 1):
+                for cy in (celula[1] - 1, celula[1], celula[1] + 1):
+                    outro = ocupadas.get((cx, cy))
+                    if outro and abs(outro[0] - x) < largura_rotulo and abs(outro[1] - y) < altura_rotulo:
+                        livre = False
+            if not livre: continue
+            ocupadas[celula] = (x, y)
+            aceitos.add(int(i))
+            if len(aceitos) >= self.LIMITE_ROTULOS_GRAFO: break
+
+        rotulos = dados["rotulos"]
+        for i in dados["visiveis"] - aceitos:
+            canvas.itemconfig(rotulos[i], state="hidden")
+        # O zoom escala também a distância dos rótulos já visíveis até o nó, mas o
+        # texto não cresce: todos os aceitos voltam para 9 px acima do círculo.
+        for i in aceitos:
+            x, y = tela[i, 0], tela[i, 1] - deslocamento_y
+            if i in rotulos:
+                canvas.coords(rotulos[i], x, y)
+                if i not in dados["visiveis"]: canvas.itemconfig(rotulos[i], state="normal")
+            else:
+                texto = "".join(self.regras.decodificar(estados[i]))
+                rotulos[i] = canvas.create_text(x, y, text=texto, font=("Consolas", 9), tags=("grafo", "rotulo"))
+        dados["visiveis"] = aceitos
+
+    def _on_resize_animacao(self, event):
+        if self.animacao_em_curso: return
+        if self._job_id_animacao:
+            self.after_cancel(self._job_id_animacao)
+        self._job_id_animacao = self.after(150, self._redraw_canvas_animacao)
+
+    @instrumentacao.itens_canvas("canvas.animacao.itens_criados")
+    def _redraw_canvas_animacao(self):
+        if not self.caminho_solucao: return
+        self._limpar_canvas_animacao(self.canvas_animacao)
+        self._desenhar_cenario_animacao(self.canvas_animacao)
+        self.desenhar_estado_animacao(self.caminho_solucao[self.passo_atual_animacao], self.canvas_animacao)
+
+    def _desenhar_cenario_animacao(self, canvas):
+        w, h = canvas.winfo_width(), canvas.winfo_height()
+        if w < 2 or h < 2: return
+        canvas.create_image(0, 0, image=self._imagem_cenario(w, h), anchor="nw", tags="cenario")
+
+    def _imagem_cenario(self, w, h):
+        # O cenário é renderizado uma única vez por tamanho de canvas; as duas
+        # abas de animação e os redimensionamentos reutilizam a mesma imagem.
+        chave = (w, h)
+        if chave in self._cache_cenario:
+            self._cache_cenario.move_to_end(chave)
+            return self._cache_cenario[chave]
+        with instrumentacao.medir("imagens.renderizar_cenario_ms"):
+            imagem = ImageTk.PhotoImage(renderizar_cenario(w, h))
+        self._cache_cenario[chave] = imagem
+        if len(self._cache_cenario) > self.TAMANHO_CACHE_CENARIO:
+            self._cache_cenario.popitem(last=False)
+        return imagem
+    
+    def preparar_animacao(self):
+        if self.animacao_em_curso: return
+        self.passo_atual_animacao = 0
+        self._redraw_canvas_animacao()
+        self.start_anim_button.config(state="normal")
+
+    def _visuais(self, canvas):
+        # Cada canvas de animação guarda os próprios itens: a aba do solucionador
+        # e a do autômato fixo nunca mexem nos sprites uma da outra.
+        if canvas not in self.visuais_por_canvas:
+            self.visuais_por_canvas[canvas] = {"ids": {}, "posicoes": {}, "estado": None, "tamanho": None, "barco": None}
+        return self.visuais_por_canvas[canvas]
+
+    def _limpar_canvas_animacao(self, canvas):
+        canvas.delete("all")
+        self.visuais_por_canvas.pop(canvas, None)
+
+    def _posicoes_personagens(self, estado, w, h):
+        return layout.posicoes_personagens(zip(self.regras.entidades, estado), w, h)
+
+    @instrumentacao.itens_canvas("canvas.estado_animacao.itens_criados")
+    def desenhar_estado_animacao(self, estado, canvas):
+        w, h = canvas.winfo_width(), canvas.winfo_height()
+        if w < 2 or h < 2: return
+
+        visuais = self._visuais(canvas)
+        if visuais["estado"] == estado and visuais["tamanho"] == (w, h): return
+
+        # Só os sprites cuja posição mudou recebem coords; os que faltam são criados uma vez.
+        for key, posicao in self._posicoes_personagens(estado, w, h).items():
+            item_id = visuais["ids"].get(key)
+            if item_id is None:
+                visuais["ids"][key] = canvas.create_image(*posicao, image=self.loaded_images[key], tags="personagem")
+            elif visuais["posicoes"].get(key) != posicao:
+                canvas.coords(item_id, *posicao)
+            visuais["posicoes"][key] = posicao
+        visuais["estado"], visuais["tamanho"] = estado, (w, h)
+
+    def iniciar_animacao(self):
+        if self.animacao_em_curso: return
+        self.animacao_em_curso = True
+        self.agendador.reiniciar_estatisticas()
+        self._atualizar_navegacao_solucoes()
+        self.solve_button.config(state="disabled")
+        self.start_anim_button.config(state="disabled")
+        self.reset_anim_button.config(state="disabled")
+        self.animar_passo()
+
+    def animar_passo(self):
+        if self.passo_atual_animacao >= len(self.caminho_solucao) - 1:
+            self.canvas_animacao.delete("acao_texto") 
+            
+            self.canvas_animacao.create_text(
+                self.winfo_width() / 2, 50, 
+                text="Travessia Concluída! Parabéns!", 
+                font=("Arial", 22, "bold"), 
+                fill="#32CD32", 
+                tags="fim_msg"
+            )
+            self.animacao_em_curso = False
+            self._atualizar_navegacao_solucoes()
+            self.solve_button.config(state="normal")
+            self.reset_anim_button.config(state="normal")
+            return
+
+        estado_anterior = self.caminho_solucao[self.passo_atual_animacao]
+        estado_seguinte = self.caminho_solucao[self.passo_atual_animacao + 1]
+        
+        def proximo_passo_callback():
+            self.passo_atual_animacao += 1
+            self.agendador.esperar(0.8, self.animar_passo)
+
+        self.animar_passo_generico(estado_anterior, estado_seguinte, self.canvas_animacao, proximo_passo_callback)
+
+    def animar_passo_generico(self, estado_anterior, estado_seguinte, canvas, callback):
+        canvas.delete("acao_texto", "fim_msg")
+        
+        passageiro_key = next((item for item, index in self.regras.itens.items() if estado_anterior[index] != estado_seguinte[index]), None)
+        
+        w, h = canvas.winfo_width(), canvas.winfo_height()
+        x_partida, x_chegada, y_barco = layout.trajeto_barco(estado_anterior[0], w, h)
+
+        label_movimento = self._get_movimento_label(estado_anterior, estado_seguinte, self.regras.itens)
+        canvas.create_text(w/2, 50, text=label_movimento, font=("Arial", 16, "italic"), fill="black", tags="acao_texto")
+
+        visuais = self._visuais(canvas)
+        if visuais["barco"] is None:
+            visuais["barco"] = canvas.create_image(x_partida, y_barco, image=self.loaded_images["barco"], tags="barco")
+        else:
+            canvas.coords(visuais["barco"], x_partida, y_barco)
+            canvas.itemconfig(visuais["barco"], state="normal")
+        canvas.addtag_withtag("grupo_barco", visuais["barco"])
+        canvas.tag_raise(visuais["barco"])
+        
+        no_barco = ["fazendeiro", passageiro_key]
+        for key, lugar in zip(no_barco, layout.lugares_no_barco(x_partida, y_barco, len(no_barco))):
+            item_id = visuais["ids"].get(key) if key else None
+            if item_id is None: continue
+            canvas.coords(item_id, *lugar)
+            canvas.addtag_withtag("grupo_barco", item_id)
+            canvas.tag_raise(item_id)
+            # A posição real agora é a do barco; o próximo desenho precisa reposicioná-lo.
+            visuais["posicoes"][key] = None
+
+        self.movimento_suave_generico(canvas, x_chegada - x_partida, 0, passageiro_key, estado_seguinte, callback)
+
+    def movimento_suave_generico(self, canvas, dx, dy, passageiro_key, estado_final, callback):
+        # Barco, fazendeiro e passageiro compartilham a tag "grupo_barco" e
+        # andam juntos com um único move por quadro, calculado pelo tempo decorrido.
+        deslocamento = [0.0, 0.0]
+        ultimo_quadro = [time.perf_counter()]
+
+        def atualizar(progresso):
+            if instrumentacao.ATIVA:
+                agora = time.perf_counter()
+                instrumentacao.registrar("animacao.travessia.intervalo_quadro_ms", (agora - ultimo_quadro[0]) * 1000)
+                ultimo_quadro[0] = agora
+            alvo_x, ondulacao = layout.deslocamento_barco(dx, progresso)
+            alvo_y = dy * progresso + ondulacao
+            canvas.move("grupo_barco", alvo_x - deslocamento[0], alvo_y - deslocamento[1])
+            deslocamento[0], deslocamento[1] = alvo_x, alvo_y
+
+        def terminar():
+            canvas.dtag("grupo_barco", "grupo_barco")
+            canvas.itemconfig("barco", state="hidden")
+            self.desenhar_estado_animacao(estado_final, canvas)
+            self._atualizar_label_quadros()
+            self.agendador.esperar(0.5, callback)
+
+        self.agendador.animar(self.DURACAO_TRAVESSIA, atualizar, terminar)
+
+    def _atualizar_label_quadros(self):
+        estatisticas = self.agendador.estatisticas()
+        if not estatisticas["quadros"]: return
+        texto = (f"{estatisticas['fps_medio']:.0f} fps, quadro médio {estatisticas['intervalo_medio_ms']:.1f} ms, "
+                 f"p95 {estatisticas['intervalo_p95_ms']:.1f} ms, descartados {estatisticas['quadros_descartados']}")
+        for label in (self.label_quadros, self.label_quadros_automato):
+            label.config(text=texto)
+
+    def _on_velocidade(self, _valor=None):
+        self.agendador.velocidade = self.velocidade_var.get()
+        texto = f"{self.agendador.velocidade:.2f}x"
+        for label in (self.label_velocidade, self.label_velocidade_automato):
+            label.config(text=texto)
+
+
+def main():
+    inicio = time.perf_counter()
+    try:
+        importar_imagens()
+    except ImportError:
+        raiz = tk.Tk()
+        raiz.withdraw()
+        messagebox.showerror("Biblioteca Faltando", "A biblioteca Pillow (PIL) está faltando. Instale com: pip install pillow")
+        raiz.destroy()
+        return 1
+    app = TravessiaApp()
+    if os.environ.get("TRAVESSIA_MEDIR_INICIO"):
+        def _relatar_inicio():
+            print(f"Janela pronta em {(time.perf_counter() - inicio) * 1000:.1f} ms "
+                  f"(sprites carregados: {len(app.loaded_images)})", file=sys.stderr)
+        app.after_idle(_relatar_inicio)
+    app.mainloop()
+    return 0
@@ -0,0 +1,331 @@
+"""Autômatos finitos (AFD e AFN) com tabelas de transição densas.
+
+A tabela de um AFD é um ``array("i")`` com ``transicoes[q * k + s]`` para o
+estado ``q`` e o símbolo de índice ``s`` (``k`` símbolos); -1 indica transição
+indefinida, que rejeita a fita. Num AFN cada posição guarda a máscara de bits
+dos destinos. A aceitação em lote precisa do NumPy.
+"""
+from array import array
+from collections import deque
+
+from .busca import resolver
+from .regras import RegrasTravessia
+from .rotulos import SIMBOLOS_ACOES
+
+
+def _numpy():
+    try:
+        import numpy as np
+    except ImportError as erro:
+        raise ImportError("A aceitação em lote precisa do NumPy. Instale com: pip install numpy") from erro
+    return np
+
+
+class AFD:
+    def __init__(self, alfabeto, transicoes, inicial=0, finais=(), nomes=None):
+        self.alfabeto = tuple(alfabeto)
+        self.simbolo = {simbolo: i for i, simbolo in enumerate(self.alfabeto)}
+        self.transicoes = array("i", transicoes)
+        self.num_estados = len(self.transicoes) // max(1, len(self.alfabeto))
+        self.inicial = inicial
+        self.finais = frozenset(finais)
+        # Rótulo opcional de cada estado (no AFD da travessia, o estado codificado).
+        self.nomes = nomes
+
+    def __len__(self):
+        return self.num_estados
+
+    def delta(self, estado, simbolo):
+        s = self.simbolo.get(simbolo)
+        if s is None or estado < 0: return -1
+        return self.transicoes[estado * len(self.alfabeto) + s]
+
+    def ler_fita(self, texto):
+        """Fita digitada: símbolos separados por espaço ou, se forem de um caractere, colados."""
+        partes = texto.split()
+        if all(parte in self.simbolo for parte in partes): return partes
+        return list("".join(partes))
+
+    def percorrer(self, fita):
+        """Estados visitados lendo ``fita``; para antes do primeiro símbolo sem transição."""
+        estados = [self.inicial]
+        for simbolo in fita:
+            proximo = self.delta(estados[-1], simbolo)
+            if proximo < 0: break
+            estados.append(proximo)
+        return estados
+
+    def aceita(self, fita):
+        estado = self.inicial
+        for simbolo in fita:
+            estado = self.delta(estado, simbolo)
+            if estado < 0: return False
+        return estado in self.finais
+
+    def codificar_fitas(self, fitas):
+        """Matriz (fitas x maior comprimento) com os índices dos símbolos.
+
+        O índice ``k`` completa as fitas mais curtas e ``k + 1`` marca símbolos
+        fora do alfabeto.
+        """
+        np = _numpy()
+        fitas = list(fitas)
+        k = len(self.alfabeto)
+        tamanhos = np.fromiter((len(fita) for fita in fitas), dtype=np.int64, count=len(fitas))
+        matriz = np.full((len(fitas), int(tamanhos.max(initial=0))), k, dtype=np.int32)
+        simbolos = None
+        if all(isinstance(fita, str) for fita in fitas) and all(len(s) == 1 and ord(s) < 256 for s in self.alfabeto):
+            # Fitas de texto com alfabeto de um byte: traduz tudo de uma vez por tabela.
+            try:
+                dados = np.frombuffer("".join(fitas).encode("latin-1"), dtype=np.uint8)
+            except UnicodeEncodeError:
+                dados = None
+            if dados is not None:
+                traducao = np.full(256, k + 1, dtype=np.int32)
+                for i, s in enumerate(self.alfabeto): traducao[ord(s)] = i
+                simbolos = traducao[dados]
+        if simbolos is None:
+            simbolos = np.fromiter((self.simbolo.get(s, k + 1) for fita in fitas for s in fita),
+                                   dtype=np.int32, count=int(tamanhos.sum()))
+        linhas = np.repeat(np.arange(len(fitas)), tamanhos)
+        colunas = np.arange(simbolos.size) - np.repeat(np.cumsum(tamanhos) - tamanhos, tamanhos)
+        matriz[linhas, colunas] = simbolos
+        return matriz
+
+    def aceita_lote(self, fitas):
+        """Vetor booleano com a aceitação de cada fita, lendo uma coluna por vez.
+
+        ``fitas`` pode ser uma sequência de fitas ou a matriz de ``codificar_fitas``.
+        """
+        np = _numpy()
+        matriz = fitas if isinstance(fitas, np.ndarray) else self.codificar_fitas(fitas)
+        n, k = self.num_estados, len(self.alfabeto)
+        # Tabela completa com um estado morto extra (n), uma coluna que mantém o
+        # estado (fim da fita) e outra que leva ao estado morto (símbolo desconhecido).
+        tabela = np.full((n + 1, k + 2), n, dtype=np.int32)
+        if n:
+            tabela[:n, :k] = np.asarray(self.transicoes, dtype=np.int32).reshape(n, k)
+            tabela[tabela < 0] = n
+        tabela[:, k] = np.arange(n + 1)
+        finais = np.zeros(n + 1, dtype=bool)
+        finais[list(self.finais)] = True
+
+        estados = np.full(matriz.shape[0], self.inicial, dtype=np.int32)
+        for coluna in matriz.T:
+            estados = tabela[estados, coluna]
+        return finais[estados]
+
+    def acessivel(self):
+        """O mesmo AFD só com os estados alcançáveis, numerados na ordem da BFS."""
+        k = len(self.alfabeto)
+        ordem, novo = [self.inicial], {self.inicial: 0}
+        fila = deque(ordem)
+        while fila:
+            estado = fila.popleft()
+            for destino in self.transicoes[estado * k:(estado + 1) * k]:
+                if destino >= 0 and destino not in novo:
+                    novo[destino] = len(ordem)
+                    ordem.append(destino)
+                    fila.append(destino)
+        transicoes = array("i", [-1]) * (len(ordem) * k)
+        for i, estado in enumerate(ordem):
+            for s, destino in enumerate(self.transicoes[estado * k:(estado + 1) * k]):
+                if destino >= 0: transicoes[i * k + s] = novo[destino]
+        nomes = [self.nomes[estado] for estado in ordem] if self.nomes is not None else None
+        return AFD(self.alfabeto, transicoes, 0, (novo[f] for f in self.finais if f in novo), nomes)
+
+    def minimizar(self):
+        """AFD mínimo equivalente pelo algoritmo de Hopcroft.
+
+        Estados inalcançáveis são descartados antes e o estado morto, se houver,
+        volta a ser representado por transições indefinidas.
+        """
+        afd = self.acessivel()
+        n, k = afd.num_estados, len(afd.alfabeto)
+        # Completa com um estado morto (n) para o refinamento ver todas as transições.
+        inversa = [[[] for _ in range(n + 1)] for _ in range(k)]
+        for q in range(n + 1):
+            for s in range(k):
+                destino = afd.transicoes[q * k + s] if q < n else n
+                inversa[s][n if destino < 0 else destino].append(q)
+
+        finais = set(afd.finais)
+        nao_finais = set(range(n + 1)) - finais
+        particao = [bloco for bloco in (finais, nao_finais) if bloco]
+        bloco_de = [0] * (n + 1)
+        for b, bloco in enumerate(particao):
+            for q in bloco: bloco_de[q] = b
+        menor = min(range(len(particao)), key=lambda b: len(particao[b]))
+        pendentes = {(menor, s) for s in range(k)}
+
+        while pendentes:
+            divisor, s = pendentes.pop()
+            afetados = {}
+            for q in list(particao[divisor]):
+                for p in inversa[s][q]:
+                    afetados.setdefault(bloco_de[p], set()).add(p)
+            for b, dentro in afetados.items():
+                if len(dentro) == len(particao[b]): continue
+                fora = particao[b] - dentro
+                particao[b] = dentro
+                novo = len(particao)
+                particao.append(fora)
+                for q in fora: bloco_de[q] = novo
+                for t in range(k):
+                    if (b, t) in pendentes: pendentes.add((novo, t))
+                    else: pendentes.add((b if len(dentro) <= len(fora) else novo, t))
+
+        # Um bloco de quociente por estado; o bloco do estado morto vira -1.
+        morto = bloco_de[n]
+        indice = {}
+        for b in sorted(set(bloco_de[:n]) - {morto}, key=lambda b: min(particao[b])):
+            indice[b] = len(indice)
+        transicoes = array("i", [-1]) * (len(indice) * k)
+        for b, i in indice.items():
+            q = min(particao[b])
+            for s in range(k):
+                destino = afd.transicoes[q * k + s]
+                if destino >= 0 and bloco_de[destino] in indice:
+                    transicoes[i * k + s] = indice[bloco_de[destino]]
+        if bloco_de[afd.inicial] not in indice:
+            # Linguagem vazia: um único estado inicial que rejeita tudo.
+            return AFD(afd.alfabeto, array("i", [-1]) * k, 0, ())
+        minimo = AFD(afd.alfabeto, transicoes, indice[bloco_de[afd.inicial]],
+                     {indice[bloco_de[f]] for f in afd.finais if bloco_de[f] in indice})
+        return minimo.acessivel()
+
+
+class AFN:
+    """AFN com ``transicoes[q * k + s]`` e ``epsilon[q]`` como máscaras de bits de destinos."""
+
+    def __init__(self, alfabeto, transicoes, iniciais=1, finais=0, epsilon=None):
+        self.alfabeto = tuple(alfabeto)
+        self.simbolo = {simbolo: i for i, simbolo in enumerate(self.alfabeto)}
+        self.transicoes = list(transicoes)
+        self.num_estados = len(self.transicoes) // max(1, len(self.alfabeto))
+        self.iniciais = iniciais
+        self.finais = finais
+        self.epsilon = list(epsilon) if epsilon is not None else [0] * self.num_estados
+
+    @classmethod
+    def de_afd(cls, afd):
+        transicoes = [1 << destino if destino >= 0 else 0 for destino in afd.transicoes]
+        return cls(afd.alfabeto, transicoes, 1 << afd.inicial, sum(1 << f for f in afd.finais))
+
+    def fecho(self, mascara):
+        """Fecho-ε de um conjunto de estados."""
+        pendentes = mascara
+        while pendentes:
+            q = (pendentes & -pendentes).bit_length() - 1
+            pendentes &= pendentes - 1
+            novos = self.epsilon[q] & ~mascara
+            mascara |= novos
+            pendentes |= novos
+        return mascara
+
+    def mover(self, mascara, s):
+        k, destinos = len(self.alfabeto), 0
+        while mascara:
+            q = (mascara & -mascara).bit_length() - 1
+            mascara &= mascara - 1
+            destinos |= self.transicoes[q * k + s]
+        return self.fecho(destinos)
+
+    def aceita(self, fita):
+        atual = self.fecho(self.iniciais)
+        for simbolo in fita:
+            s = self.simbolo.get(simbolo)
+            if s is None: return False
+            atual = self.mover(atual, s)
+            if not atual: return False
+        return bool(atual & self.finais)
+
+    def determinizar(self):
+        """Construção de subconjuntos; o conjunto vazio fica como transição indefinida.
+
+        ``nomes`` do AFD resultante guarda a máscara de estados de cada subconjunto.
+        """
+        k = len(self.alfabeto)
+        inicial = self.fecho(self.iniciais)
+        conjuntos, indice = [inicial], {inicial: 0}
+        transicoes = array("i")
+        fila = deque(conjuntos)
+        while fila:
+            conjunto = fila.popleft()
+            for s in range(k):
+                destino = self.mover(conjunto, s)
+                if not destino:
+                    transicoes.append(-1)
+                    continue
+                if destino not in indice:
+                    indice[destino] = len(conjuntos)
+                    conjuntos.append(destino)
+                    fila.append(destino)
+                transicoes.append(indice[destino])
+        finais = [i for i, conjunto in enumerate(conjuntos) if conjunto & self.finais]
+        return AFD(self.alfabeto, transicoes, 0, finais, conjuntos)
+
+
+def afd_travessia(regras, inicio=0, simbolos=SIMBOLOS_ACOES):
+    """AFD das sequências de ações válidas a partir do estado inteiro ``inicio``.
+
+    Os estados são os alcançáveis, na ordem da BFS, com o estado codificado em
+    ``nomes``; o único estado final é ``regras.estado_final``. Movimentos sem
+    símbolo em ``simbolos`` usam o próprio nome.
+    """
+    por_movimento = [simbolos.get(nome, nome) for nome in regras.nomes_movimentos]
+    alfabeto = sorted(por_movimento)
+    coluna = [alfabeto.index(simbolo) for simbolo in por_movimento]
+    k = len(alfabeto)
+
+    estados, indice = [inicio], {inicio: 0}
+    transicoes = array("i", [-1]) * k
+    fila = deque(estados)
+    while fila:
+        estado = fila.popleft()
+        base = indice[estado] * k
+        for movimento, proximo in regras.sucessores(estado):
+            if proximo not in indice:
+                indice[proximo] = len(estados)
+                estados.append(proximo)
+                transicoes.extend([-1] * k)
+                fila.append(proximo)
+            transicoes[base + coluna[movimento]] = indice[proximo]
+    finais = [indice[regras.estado_final]] if regras.estado_final in indice else []
+    return AFD(alfabeto, transicoes, 0, finais, estados)
+
+
+class AutomatoTravessia:
+    def __init__(self, estado_inicial=None, regras=None):
+        self.regras = regras if regras is not None else RegrasTravessia.classica()
+        if estado_inicial is None:
+            estado_inicial = self.regras.decodificar(0)
+        if not self.is_valid_state(estado_inicial):
+            raise ValueError(f"O estado inicial fornecido {estado_inicial} é inválido e viola as regras.")
+
+        self.estado_inicial = tuple(estado_inicial)
+        self.estado_final = self.regras.decodificar(self.regras.estado_final)
+        self.alfabeto = list(self.regras.nomes_movimentos)
+        self.item_map = dict(self.regras.itens)
+
+    def is_valid_state(self, estado):
+        codigo = self.regras.codificar(estado)
+        return self.regras.valido(codigo) and self.regras.consistente(codigo)
+
+    def transition(self, estado_atual, acao):
+        proximo = self.regras.transicao(self.regras.codificar(estado_atual), self.regras.indice_movimento[acao])
+        return self.regras.decodificar(proximo) if proximo is not None else None
+
+    def resolver(self, estrategia="bfs"):
+        regras = self.regras
+        resultado = resolver(regras, regras.codificar(self.estado_inicial), estrategia)
+        if resultado.caminho is not None:
+            resultado.caminho = [regras.decodificar(estado) for estado in resultado.caminho]
+        return resultado
+
+    def resolver_bfs(self):
+        return self.resolver("bfs").caminho
+
+    def afd(self):
+        """AFD das fitas de ações (a/b/c/d) a partir do estado inicial."""
+        return afd_travessia(self.regras, self.regras.codificar(self.estado_inicial))
@@ -0,0 +1,213 @@
+import heapq
+from collections import deque
+
+from . import instrumentacao
+
+# A cada quantos estados expandidos o callback de progresso é chamado.
+INTERVALO_PROGRESSO = 1024
+
+
+class BuscaCancelada(Exception):
+    """Lançada pelo callback de progresso para interromper uma busca."""
+
+
+class ResultadoBusca:
+    # Classe simples em vez de dataclass: dataclasses e typing dobram o tempo de importar o pacote.
+    __slots__ = ("caminho", "nos_expandidos", "estrategia")
+
+    def __init__(self, caminho, nos_expandidos, estrategia):
+        self.caminho = caminho
+        self.nos_expandidos = nos_expandidos
+        self.estrategia = estrategia
+
+    def __repr__(self):
+        return f"ResultadoBusca(caminho={self.caminho!r}, nos_expandidos={self.nos_expandidos!r}, estrategia={self.estrategia!r})"
+
+    def __eq__(self, outro):
+        if not isinstance(outro, ResultadoBusca): return NotImplemented
+        return (self.caminho, self.nos_expandidos, self.estrategia) == (outro.caminho, outro.nos_expandidos, outro.estrategia)
+
+    @property
+    def comprimento(self):
+        return len(self.caminho) - 1 if self.caminho else None
+
+
+def reconstruir_caminho(pais, estado):
+    caminho = [estado]
+    while pais[estado] is not None:
+        estado = pais[estado]
+        caminho.append(estado)
+    caminho.reverse()
+    return caminho
+
+
+def buscar_bfs(regras, inicio, final, progresso=None):
+    pais = {inicio: None}
+    if inicio == final: return ResultadoBusca([inicio], 0, "bfs")
+    fila = deque([inicio])
+    expandidos = 0
+    # Contadores da camada atual, para saber a profundidade sem guardá-la por estado.
+    profundidade, restantes_camada, proxima_camada = 0, 1, 0
+    while fila:
+        estado = fila.popleft()
+        expandidos += 1
+        if progresso and expandidos % INTERVALO_PROGRESSO == 0:
+            progresso(expandidos, len(fila), profundidade)
+        for _movimento, proximo in regras.sucessores(estado):
+            if proximo in pais: continue
+            pais[proximo] = estado
+            if proximo == final:
+                return ResultadoBusca(reconstruir_caminho(pais, proximo), expandidos, "bfs")
+            fila.append(proximo)
+            proxima_camada += 1
+        restantes_camada -= 1
+        if restantes_camada == 0:
+            profundidade, restantes_camada, proxima_camada = profundidade + 1, proxima_camada, 0
+    return ResultadoBusca(None, expandidos, "bfs")
+
+
+def buscar_bidirecional(regras, inicio, final, progresso=None):
+    # As travessias são reversíveis (o mesmo grupo pode voltar no barco), então
+    # os predecessores de um estado válido são exatamente os seus sucessores.
+    if inicio == final: return ResultadoBusca([inicio], 0, "bidirecional")
+    pais_ida, pais_volta = {inicio: None}, {final: None}
+    dist_ida, dist_volta = {inicio: 0}, {final: 0}
+    fronteira_ida, fronteira_volta = [inicio], [final]
+    expandidos = 0
+
+    while fronteira_ida and fronteira_volta:
+        # Expande sempre a camada menor; a camada é processada inteira para que
+        # o melhor ponto de encontro dela seja também o caminho mínimo global.
+        if len(fronteira_ida) <= len(fronteira_volta):
+            fronteira, pais, dist, dist_outro = fronteira_ida, pais_ida, dist_ida, dist_volta
+        else:
+            fronteira, pais, dist, dist_outro = fronteira_volta, pais_volta, dist_volta, dist_ida
+
+        proxima, encontro, melhor = [], None, None
+        for estado in fronteira:
+            expandidos += 1
+            if progresso and expandidos % INTERVALO_PROGRESSO == 0:
+                progresso(expandidos, len(fronteira_ida) + len(fronteira_volta), dist[estado])
+            for _movimento, proximo in regras.sucessores(estado):
+                if proximo in dist: continue
+                pais[proximo] = estado
+                dist[proximo] = dist[estado] + 1
+                proxima.append(proximo)
+                if proximo in dist_outro:
+                    total = dist[proximo] + dist_outro[proximo]
+                    if melhor is None or total < melhor:
+                        encontro, melhor = proximo, total
+
+        if encontro is not None:
+            ida = reconstruir_caminho(pais_ida, encontro)
+            volta = reconstruir_caminho(pais_volta, encontro)
+            return ResultadoBusca(ida + volta[-2::-1], expandidos, "bidirecional")
+
+        if fronteira is fronteira_ida: fronteira_ida = proxima
+        else: fronteira_volta = proxima
+
+    return ResultadoBusca(None, expandidos, "bidirecional")
+
+
+def heuristica_margem(regras, final):
+    """Entidades fora da margem de destino divididas pela capacidade do barco.
+
+    Cada travessia muda no máximo ``capacidade`` entidades de margem, então a
+    estimativa nunca passa do custo real e varia no máximo 1 por movimento.
+    """
+    capacidade, todos = regras.capacidade, regras.todos
+
+    def h(estado):
+        return -(-bin((estado ^ final) & todos).count("1") // capacidade)
+    return h
+
+
+def buscar_astar(regras, inicio, final, progresso=None):
+    h = heuristica_margem(regras, final)
+    pais = {inicio: None}
+    custo = {inicio: 0}
+    # O contador desempata pela ordem de inserção e deixa a busca determinística.
+    heap = [(h(inicio), 0, 0, inicio)]
+    contador = 1
+    fechados = set()
+    expandidos = 0
+
+    while heap:
+        _f, g, _ordem, estado = heapq.heappop(heap)
+        if estado in fechados: continue
+        if estado == final:
+            return ResultadoBusca(reconstruir_caminho(pais, estado), expandidos, "astar")
+        fechados.add(estado)
+        expandidos += 1
+        if progresso and expandidos % INTERVALO_PROGRESSO == 0:
+            progresso(expandidos, len(heap), g)
+        for _movimento, proximo in regras.sucessores(estado):
+            novo_custo = g + 1
+            if proximo in fechados or novo_custo >= custo.get(proximo, novo_custo + 1): continue
+            custo[proximo] = novo_custo
+            pais[proximo] = estado
+            heapq.heappush(heap, (novo_custo + h(proximo), novo_custo, contador, proximo))
+            contador += 1
+    return ResultadoBusca(None, expandidos, "astar")
+
+
+def buscar_vetorizado(regras, inicio, final, progresso=None):
+    # Importado só quando pedido: o NumPy é uma dependência opcional.
+    from .vetorizado import buscar_vetorizado
+    return buscar_vetorizado(regras, inicio, final, progresso=progresso)
+
+
+def buscar_simetria(regras, inicio, final, progresso=None):
+    from .simetria import buscar_simetria
+    return buscar_simetria(regras, inicio, final, progresso)
+
+
+def buscar_externo(regras, inicio, final, progresso=None):
+    from .externo import buscar_externo
+    return buscar_externo(regras, inicio, final, progresso)
+
+
+def buscar_paralelo(regras, inicio, final, progresso=None):
+    from .paralelo import buscar_paralelo
+    return buscar_paralelo(regras, inicio, final, progresso)
+
+
+_BUSCAS = {
+    "bfs": buscar_bfs,
+    "bidirecional": buscar_bidirecional,
+    "astar": buscar_astar,
+    "vetorizado": buscar_vetorizado,
+    "simetria": buscar_simetria,
+    "externo": buscar_externo,
+    "paralelo": buscar_paralelo,
+}
+ESTRATEGIAS = tuple(_BUSCAS)
+# Expandem camadas inteiras com o NumPy, sem ``sucessores``: não há transições a contar.
+_SEM_SUCESSORES = ("vetorizado", "externo", "paralelo")
+
+
+def resolver(regras, inicio, estrategia="bfs", final=None, progresso=None):
+    """Resolve a partir do estado inteiro ``inicio`` com a estratégia pedida.
+
+    Todas as estratégias devolvem um caminho mínimo (mesmo comprimento) e o
+    número de estados expandidos. Se dado, ``progresso(expandidos, fronteira,
+    profundidade)`` é chamado periodicamente e pode lançar ``BuscaCancelada``.
+    """
+    if estrategia not in _BUSCAS:
+        raise ValueError(f"Estratégia desconhecida: {estrategia!r}. Use uma de {', '.join(ESTRATEGIAS)}.")
+    if final is None: final = regras.estado_final
+    if not instrumentacao.ATIVA: return _BUSCAS[estrategia](regras, inicio, final, progresso)
+
+    if estrategia in _SEM_SUCESSORES:
+        with instrumentacao.medir(f"busca.{estrategia}.tempo_ms"):
+            resultado = _BUSCAS[estrategia](regras, inicio, final, progresso)
+        instrumentacao.contar("busca.estados_expandidos", resultado.nos_expandidos)
+        return resultado
+
+    contadas = instrumentacao.RegrasContadas(regras)
+    with instrumentacao.medir(f"busca.{estrategia}.tempo_ms"):
+        resultado = _BUSCAS[estrategia](contadas, inicio, final, progresso)
+    instrumentacao.contar("busca.estados_expandidos", resultado.nos_expandidos)
+    instrumentacao.contar("busca.transicoes_tentadas", contadas.tentadas)
+    instrumentacao.contar("busca.transicoes_rejeitadas", contadas.rejeitadas)
+    return resultado
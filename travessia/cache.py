@@ -0,0 +1,177 @@
+"""Cache persistente de soluções em SQLite.
+
+A chave é um hash canônico das regras mais os estados inicial e final; o
+valor é o caminho mínimo (ou a ausência de solução). O banco usa WAL e
+``busy_timeout``, então vários processos podem ler e gravar ao mesmo tempo.
+Ao passar de ``max_entradas`` as soluções usadas há mais tempo são removidas.
+
+As leituras não escrevem: o instante de uso de uma entrada só é regravado
+se tiver mais de ``intervalo_uso`` segundos, e os contadores de acertos e
+falhas do banco são acumulados em memória e gravados junto com a próxima
+escrita (ou a cada ``LOTE_CONTADORES`` leituras).
+"""
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+
+_ESQUEMA = """
+CREATE TABLE IF NOT EXISTS solucoes (
+    regras TEXT NOT NULL,
+    inicio INTEGER NOT NULL,
+    final INTEGER NOT NULL,
+    caminho TEXT,
+    usado REAL NOT NULL,
+    PRIMARY KEY (regras, inicio, final)
+);
+CREATE INDEX IF NOT EXISTS solucoes_usado ON solucoes (usado);
+CREATE TABLE IF NOT EXISTS contadores (nome TEXT PRIMARY KEY, valor INTEGER NOT NULL);
+"""
+LOTE_CONTADORES = 64
+
+
+def diretorio_cache():
+    if os.environ.get("TRAVESSIA_CACHE"):
+        return os.environ["TRAVESSIA_CACHE"]
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "travessia")
+
+
+def arquivo_padrao():
+    return os.path.join(diretorio_cache(), "solucoes.sqlite3")
+
+
+def chave_regras(regras):
+    """Hash das regras que não depende da ordem dos grupos, guardiões e remadores.
+
+    A ordem das entidades entra na chave porque define a codificação dos estados.
+    """
+    ordenar = lambda nomes: sorted(set(nomes), key=regras.indice.__getitem__)
+    canonica = {
+        "entidades": list(regras.entidades),
+        "grupos_proibidos": sorted({tuple(ordenar(grupo)) for grupo in regras.grupos_proibidos}),
+        "guardioes": ordenar(regras.guardioes),
+        "remadores": ordenar(regras.remadores),
+        "capacidade": regras.capacidade,
+    }
+    texto = json.dumps(canonica, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(texto.encode("utf-8")).hexdigest()
+
+
+class CacheSolucoes:
+    def __init__(self, arquivo=None, max_entradas=100000, timeout=30.0, intervalo_uso=60.0):
+        self.arquivo = arquivo or arquivo_padrao()
+        self.max_entradas = max_entradas
+        self.intervalo_uso = intervalo_uso
+        if self.arquivo != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(self.arquivo)), exist_ok=True)
+        # Transações explícitas; a trava permite usar a conexão de threads de trabalho.
+        self._conexao = sqlite3.connect(self.arquivo, timeout=timeout, isolation_level=None, check_same_thread=False)
+        self._trava = threading.Lock()
+        self._conexao.execute(f"PRAGMA busy_timeout = {int(timeout * 1000)}")
+        self._conexao.execute("PRAGMA journal_mode = WAL")
+        self._conexao.execute("PRAGMA synchronous = NORMAL")
+        self._conexao.executescript(_ESQUEMA)
+        self._chaves = {}
+        self.acertos = 0
+        self.falhas = 0
+        self._pendentes = {"acertos": 0, "falhas": 0}
+
+    def _chave(self, regras, inicio, final):
+        if regras not in self._chaves: self._chaves[regras] = chave_regras(regras)
+        return self._chaves[regras], inicio, regras.estado_final if final is None else final
+
+    @contextmanager
+    def _escrita(self):
+        # Chamado com a trava. Leva junto os contadores acumulados pelas leituras.
+        self._conexao.execute("BEGIN IMMEDIATE")
+        try:
+            yield
+            for nome, valor in self._pendentes.items():
+                if not valor: continue
+                self._conexao.execute("INSERT INTO contadores VALUES (?, ?) "
+                                      "ON CONFLICT(nome) DO UPDATE SET valor = valor + excluded.valor", (nome, valor))
+            self._conexao.execute("COMMIT")
+        except BaseException:
+            self._conexao.execute("ROLLBACK")
+            raise
+        self._pendentes = dict.fromkeys(self._pendentes, 0)
+
+    def _gravar_contadores(self):
+        if any(self._pendentes.values()):
+            with self._escrita(): pass
+
+    def obter(self, regras, inicio, final=None):
+        """Devolve ``(encontrado, caminho)``; ``caminho`` é None quando não há solução."""
+        chave = self._chave(regras, inicio, final)
+        with self._trava:
+            # Fora de transação explícita: a leitura não disputa a trava de escrita do banco.
+            linha = self._conexao.execute(
+                "SELECT caminho, usado FROM solucoes WHERE regras = ? AND inicio = ? AND final = ?", chave).fetchone()
+            self._pendentes["falhas" if linha is None else "acertos"] += 1
+            agora = time.time()
+            if linha is not None and agora - linha[1] >= self.intervalo_uso:
+                with self._escrita():
+                    self._conexao.execute("UPDATE solucoes SET usado = ? WHERE regras = ? AND inicio = ? AND final = ?",
+                                          (agora, *chave))
+            elif sum(self._pendentes.values()) >= LOTE_CONTADORES:
+                self._gravar_contadores()
+        if linha is None:
+            self.falhas += 1
+            return False, None
+        self.acertos += 1
+        return True, None if linha[0] is None else json.loads(linha[0])
+
+    def guardar(self, regras, inicio, caminho, final=None):
+        chave = self._chave(regras, inicio, final)
+        valor = None if caminho is None else json.dumps(list(caminho), separators=(",", ":"))
+        with self._trava, self._escrita():
+            self._conexao.execute("INSERT OR REPLACE INTO solucoes VALUES (?, ?, ?, ?, ?)", (*chave, valor, time.time()))
+            excesso = self._conexao.execute("SELECT COUNT(*) FROM solucoes").fetchone()[0] - self.max_entradas
+            if excesso > 0:
+                self._conexao.execute(
+                    "DELETE FROM solucoes WHERE rowid IN (SELECT rowid FROM solucoes ORDER BY usado LIMIT ?)",
+                    (excesso,))
+
+    def obter_ou_calcular(self, regras, inicio, calcular, final=None):
+        """Caminho do cache ou, na falta dele, ``calcular()`` guardado para a próxima vez."""
+        encontrado, caminho = self.obter(regras, inicio, final)
+        if encontrado: return caminho
+        caminho = calcular()
+        self.guardar(regras, inicio, caminho, final)
+        return caminho
+
+    def estatisticas(self):
+        """Contadores desta instância e os acumulados no banco por todos os processos."""
+        with self._trava:
+            self._gravar_contadores()
+            entradas = self._conexao.execute("SELECT COUNT(*) FROM solucoes").fetchone()[0]
+            totais = dict(self._conexao.execute("SELECT nome, valor FROM contadores"))
+        return {
+            "acertos": self.acertos,
+            "falhas": self.falhas,
+            "acertos_total": totais.get("acertos", 0),
+            "falhas_total": totais.get("falhas", 0),
+            "entradas": entradas,
+            "max_entradas": self.max_entradas,
+        }
+
+    def limpar(self):
+        with self._trava:
+            self._conexao.execute("DELETE FROM solucoes")
+            self._conexao.execute("DELETE FROM contadores")
+            self._pendentes = dict.fromkeys(self._pendentes, 0)
+
+    def fechar(self):
+        with self._trava:
+            self._gravar_contadores()
+            self._conexao.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_erro):
+        self.fechar()
@@ -0,0 +1,56 @@
+"""Renderização do cenário da travessia (céu, rio, sol, nuvens e margens) com PIL.
+
+As proporções são as mesmas usadas pelo canvas da animação, então a imagem
+pode substituir os itens desenhados um a um.
+"""
+from PIL import Image, ImageDraw, ImageFont
+
+from .layout import geometria_margens
+
+FONTES_NEGRITO = ("arialbd.ttf", "Arial Bold.ttf", "DejaVuSans-Bold.ttf")
+FONTES_ITALICO = ("ariali.ttf", "Arial Italic.ttf", "DejaVuSans-Oblique.ttf", "DejaVuSans.ttf")
+
+
+def carregar_fonte(tamanho, nomes=FONTES_NEGRITO):
+    for nome in nomes:
+        try:
+            return ImageFont.truetype(nome, tamanho)
+        except OSError:
+            continue
+    return ImageFont.load_default()
+
+
+def _gradiente(largura, altura):
+    # Uma coluna de 1 pixel com as cores de cada linha, esticada na horizontal.
+    limite_ceu = altura * 0.7
+    cores = []
+    for i in range(altura):
+        if i < int(limite_ceu):
+            cores.append((135 + int(90 * i / limite_ceu), 206 + int(40 * i / limite_ceu), 250))
+        else:
+            cores.append((0x46, 0x82, 180 - int(90 * (i - limite_ceu) / (altura * 0.3))))
+    coluna = Image.new("RGB", (1, altura))
+    coluna.putdata(cores)
+    return coluna.resize((largura, altura), Image.Resampling.NEAREST)
+
+
+def renderizar_cenario(largura, altura):
+    w, h = largura, altura
+    imagem = _gradiente(w, h)
+    desenho = ImageDraw.Draw(imagem)
+
+    desenho.ellipse((w * 0.8, h * 0.1, w * 0.9, h * 0.25), fill="#FFD700", outline="#FFA500")
+    desenho.ellipse((w * 0.1, h * 0.15, w * 0.25, h * 0.3), fill="white")
+    desenho.ellipse((w * 0.18, h * 0.1, w * 0.3, h * 0.25), fill="white")
+
+    margem_esq_x_fim, margem_dir_x_inicio, nivel_grama = geometria_margens(w, h)
+    desenho.rectangle((0, nivel_grama, margem_esq_x_fim, h), fill="#A0522D", outline="#6B4226", width=2)
+    desenho.rectangle((margem_dir_x_inicio, nivel_grama, w, h), fill="#A0522D", outline="#6B4226", width=2)
+    desenho.rectangle((0, nivel_grama, margem_esq_x_fim, nivel_grama + 10), fill="#228B22")
+    desenho.rectangle((margem_dir_x_inicio, nivel_grama, w, nivel_grama + 10), fill="#228B22")
+
+    fonte = carregar_fonte(16)
+    desenho.text((margem_esq_x_fim / 2, nivel_grama + 40), "MARGEM ESQUERDA", font=fonte, fill="white", anchor="mm")
+    desenho.text((margem_dir_x_inicio + (w - margem_dir_x_inicio) / 2, nivel_grama + 40), "MARGEM DIREITA",
+                 font=fonte, fill="white", anchor="mm")
+    return imagem
@@ -0,0 +1,141 @@
+"""Interface de linha de comando: python -m travessia <comando> ..."""
+import argparse
+import json
+import os
+import sys
+
+from .busca import ESTRATEGIAS
+
+
+def _abrir_entrada(caminho):
+    return sys.stdin if caminho in (None, "-") else open(caminho, encoding="utf-8")
+
+
+def _abrir_saida(caminho):
+    return sys.stdout if caminho in (None, "-") else open(caminho, "w", encoding="utf-8")
+
+
+def comando_lote(args):
+    from .cache import arquivo_padrao
+    from .lote import ler_pedidos, processar
+
+    cache = None if args.sem_cache else args.cache or arquivo_padrao()
+    entrada, saida = _abrir_entrada(args.entrada), _abrir_saida(args.saida)
+    try:
+        respostas = processar(ler_pedidos(entrada), processos=args.processos,
+                              estrategia=args.estrategia, tamanho_bloco=args.bloco, cache=cache)
+        for resposta in respostas:
+            saida.write(json.dumps(resposta, ensure_ascii=False) + "\n")
+            saida.flush()
+    except BrokenPipeError:
+        # A saída foi fechada antes do fim (por exemplo, "| head"): encerra sem erro.
+        sys.stdout = open(os.devnull, "w")
+    finally:
+        if entrada is not sys.stdin: entrada.close()
+        if saida is not sys.stdout: saida.close()
+    return 0
+
+
+def _instancias_animacao(pedidos, padrao, estrategia, cache):
+    from .lote import resolver_pedido
+    from .regras import RegrasTravessia
+
+    destinos = set()
+    for pedido in pedidos:
+        resposta = resolver_pedido(pedido, estrategia, cache)
+        if not resposta.get("caminho"):
+            motivo = resposta.get("erro", "sem solução")
+            print(f"Aviso: instância {resposta['id']} não exportada: {motivo}", file=sys.stderr)
+            continue
+        destino = padrao.format(id=resposta["id"])
+        if destino in destinos:
+            raise SystemExit(f"Destino repetido {destino!r}: use {{id}} no nome para exportar várias instâncias.")
+        destinos.add(destino)
+        especificacao = pedido.get("regras") or RegrasTravessia.classica().para_dict()
+        yield {
+            "id": resposta["id"],
+            "destino": destino,
+            "entidades": especificacao["entidades"],
+            "caminho": [estado.split() for estado in resposta["caminho"]],
+            "rotulos": resposta["rotulos"],
+        }
+
+
+def comando_exportar(args):
+    from .cache import arquivo_padrao
+    from .exportar import exportar_lote
+    from .lote import ler_pedidos
+
+    cache = None if args.sem_cache else args.cache or arquivo_padrao()
+    entrada = _abrir_entrada(args.entrada)
+    try:
+        instancias = _instancias_animacao(ler_pedidos(entrada), args.saida, args.estrategia, cache)
+        for resumo in exportar_lote(instancias, largura=args.largura, altura=args.altura, fps=args.fps,
+                                    processos=args.processos):
+            print(json.dumps(resumo, ensure_ascii=False), flush=True)
+    except RuntimeError as erro:
+        print(f"Erro: {erro}", file=sys.stderr)
+        return 1
+    finally:
+        if entrada is not sys.stdin: entrada.close()
+    return 0
+
+
+def comando_servir(args):
+    from .cache import arquivo_padrao
+    from .servico import servir
+
+    cache = None if args.sem_cache else args.cache or arquivo_padrao()
+    return servir(args.host, args.porta, processos=args.processos, tamanho_lote=args.lote, janela_ms=args.janela_ms,
+                  max_pendentes=args.max_pendentes, estrategia=args.estrategia, cache=cache)
+
+
+def criar_parser():
+    parser = argparse.ArgumentParser(prog="python -m travessia", description="Ferramentas do problema da travessia.")
+    comandos = parser.add_subparsers(dest="comando", required=True)
+
+    lote = comandos.add_parser("lote", help="resolve estados iniciais lidos em JSON Lines")
+    lote.add_argument("entrada", nargs="?", default="-", help="arquivo JSON Lines (padrão: entrada padrão)")
+    lote.add_argument("-o", "--saida", default="-", help="arquivo de saída (padrão: saída padrão)")
+    lote.add_argument("-p", "--processos", type=int, default=None,
+                      help="processos no pool (padrão: número de CPUs; 0 resolve no próprio processo)")
+    lote.add_argument("-e", "--estrategia", default="bfs", choices=["tabela", *ESTRATEGIAS])
+    lote.add_argument("--bloco", type=int, default=8, help="instâncias enviadas por tarefa ao pool")
+    lote.add_argument("--cache", default=None, help="arquivo SQLite do cache de soluções (padrão: no diretório de cache)")
+    lote.add_argument("--sem-cache", action="store_true", help="não consulta nem grava o cache de soluções")
+    lote.set_defaults(funcao=comando_lote)
+
+    exportar = comandos.add_parser("exportar", help="grava a animação da solução de cada instância em GIF, PNGs ou vídeo")
+    exportar.add_argument("entrada", nargs="?", default="-", help="arquivo JSON Lines como no lote (padrão: entrada padrão)")
+    exportar.add_argument("-o", "--saida", default="travessia_{id}.gif",
+                          help="destino por instância, com {id}: .gif, diretório (sequência de PNGs) ou .mp4 etc. (ffmpeg)")
+    exportar.add_argument("-p", "--processos", type=int, default=None,
+                          help="processos que renderizam quadros (padrão: número de CPUs; 0 renderiza no próprio processo)")
+    exportar.add_argument("-e", "--estrategia", default="bfs", choices=["tabela", *ESTRATEGIAS])
+    exportar.add_argument("--largura", type=int, default=800)
+    exportar.add_argument("--altura", type=int, default=500)
+    exportar.add_argument("--fps", type=int, default=20)
+    exportar.add_argument("--cache", default=None, help="arquivo SQLite do cache de soluções (padrão: no diretório de cache)")
+    exportar.add_argument("--sem-cache", action="store_true", help="não consulta nem grava o cache de soluções")
+    exportar.set_defaults(funcao=comando_exportar)
+
+    servir = comandos.add_parser("servir", help="serviço HTTP/JSON local (POST /resolver, GET /metricas)")
+    servir.add_argument("--host", default="127.0.0.1")
+    servir.add_argument("--porta", type=int, default=8765, help="porta TCP (0 escolhe uma livre)")
+    servir.add_argument("-p", "--processos", type=int, default=None,
+                        help="processos no pool (padrão: número de CPUs; 0 resolve numa thread do próprio processo)")
+    servir.add_argument("-e", "--estrategia", default="bfs", choices=["tabela", *ESTRATEGIAS])
+    servir.add_argument("--lote", type=int, default=32, help="máximo de pedidos distintos por tarefa do pool")
+    servir.add_argument("--janela-ms", type=float, default=2.0, help="espera para juntar pedidos num lote")
+    servir.add_argument("--max-pendentes", type=int, default=1024,
+                        help="cálculos pendentes a partir dos quais o serviço responde 503")
+    servir.add_argument("--cache", default=None, help="arquivo SQLite do cache de soluções (padrão: no diretório de cache)")
+    servir.add_argument("--sem-cache", action="store_true", help="não consulta nem grava o cache de soluções")
+    servir.set_defaults(funcao=comando_servir)
+
+    return parser
+
+
+def main(argv=None):
+    args = criar_parser().parse_args(argv)
+    return args.funcao(args)
@@ -0,0 +1,123 @@
+import sys
+from array import array
+
+from .regras import RegrasTravessia
+
+_ASSINATURA = b"TRAVESSIA-TABELA 1\n"
+_ARRAYS = (("estados", "Q"), ("transicoes", "i"), ("proximo", "i"), ("distancia", "i"))
+
+
+class TabelaCompilada:
+    """Espaço de estados válido pré-compilado para um conjunto de regras.
+
+    ``transicoes[i * num_movimentos + m]`` é o índice do estado alcançado a
+    partir de ``estados[i]`` com o movimento ``m`` (ou -1). Uma única BFS
+    reversa a partir do estado final preenche ``proximo`` (índice do próximo
+    estado rumo ao final) e ``distancia`` (-1 quando não há solução).
+    """
+
+    def __init__(self, regras, final, estados, transicoes, proximo, distancia, indice=None):
+        self.regras = regras
+        self.final = final
+        self.estados = estados
+        self.transicoes = transicoes
+        self.proximo = proximo
+        self.distancia = distancia
+        self.num_movimentos = len(regras.movimentos)
+        self.indice = indice if indice is not None else {estado: i for i, estado in enumerate(estados)}
+
+    @classmethod
+    def compilar(cls, regras, final=None):
+        if final is None: final = regras.estado_final
+        valido, consistente = regras.valido, regras.consistente
+        estados = array("Q", (e for e in range(regras.num_estados) if valido(e) and consistente(e)))
+        indice = {estado: i for i, estado in enumerate(estados)}
+
+        num_movimentos = len(regras.movimentos)
+        transicoes = array("i", [-1]) * (len(estados) * num_movimentos)
+        for i, estado in enumerate(estados):
+            base = i * num_movimentos
+            for movimento, proximo in regras.sucessores(estado):
+                transicoes[base + movimento] = indice[proximo]
+
+        proximo = array("i", [-1]) * len(estados)
+        distancia = array("i", [-1]) * len(estados)
+        if final in indice:
+            # As travessias são reversíveis, então a BFS reversa pode usar a
+            # própria tabela de transições como lista de predecessores.
+            alvo = indice[final]
+            distancia[alvo] = 0
+            camada = [alvo]
+            while camada:
+                seguinte = []
+                for destino in camada:
+                    d = distancia[destino] + 1
+                    base = destino * num_movimentos
+                    for origem in transicoes[base:base + num_movimentos]:
+                        if origem < 0 or distancia[origem] >= 0: continue
+                        distancia[origem] = d
+                        proximo[origem] = destino
+                        seguinte.append(origem)
+                camada = seguinte
+
+        return cls(regras, final, estados, transicoes, proximo, distancia, indice)
+
+    def __len__(self):
+        return len(self.estados)
+
+    def valido(self, estado):
+        return estado in self.indice
+
+    def distancia_ate_final(self, estado):
+        i = self.indice.get(estado)
+        return None if i is None or self.distancia[i] < 0 else self.distancia[i]
+
+    def caminho(self, estado):
+        """Caminho mínimo de ``estado`` até o final seguindo os próximos saltos.
+
+        Devolve None, sem percorrer nada, se o estado for inválido ou não tiver solução.
+        """
+        i = self.indice.get(estado)
+        if i is None or self.distancia[i] < 0: return None
+        caminho = [self.estados[i]]
+        while self.proximo[i] >= 0:
+            i = self.proximo[i]
+            caminho.append(self.estados[i])
+        return caminho
+
+    def vizinhos(self, estado):
+        i = self.indice[estado]
+        base = i * self.num_movimentos
+        return [(m, self.estados[j]) for m, j in enumerate(self.transicoes[base:base + self.num_movimentos]) if j >= 0]
+
+    def salvar(self, arquivo):
+        import json
+        cabecalho = {
+            "regras": self.regras.para_dict(),
+            "final": self.final,
+            "ordem_bytes": sys.byteorder,
+            "tamanhos": {nome: len(getattr(self, nome)) for nome, _tipo in _ARRAYS},
+        }
+        with open(arquivo, "wb") as saida:
+            saida.write(_ASSINATURA)
+            saida.write(json.dumps(cabecalho).encode("utf-8") + b"\n")
+            for nome, _tipo in _ARRAYS:
+                getattr(self, nome).tofile(saida)
+
+    @classmethod
+    def carregar(cls, arquivo, regras=None):
+        import json
+        with open(arquivo, "rb") as entrada:
+            if entrada.readline() != _ASSINATURA:
+                raise ValueError(f"{arquivo} não é uma tabela de travessia compilada.")
+            cabecalho = json.loads(entrada.readline().decode("utf-8"))
+            regras_arquivo = RegrasTravessia.de_dict(cabecalho["regras"])
+            if regras is not None and regras != regras_arquivo:
+                raise ValueError(f"A tabela em {arquivo} foi compilada para outras regras.")
+            dados = {}
+            for nome, tipo in _ARRAYS:
+                valores = array(tipo)
+                valores.fromfile(entrada, cabecalho["tamanhos"][nome])
+                if cabecalho["ordem_bytes"] != sys.byteorder: valores.byteswap()
+                dados[nome] = valores
+        return cls(regras_arquivo, cabecalho["final"], **dados)
@@ -0,0 +1,310 @@
+"""Exportação da animação da travessia para GIF, sequência de PNGs ou vídeo, sem Tk.
+
+Os quadros seguem a mesma geometria do canvas da interface (``layout``) e
+são compostos com PIL sobre o cenário de ``renderizar_cenario``. Cada quadro
+é descrito só por ``(passo, progresso, repeticoes)``; a composição e a
+codificação (quantização na paleta comum do GIF, PNG, RGB cru para o ffmpeg)
+rodam em paralelo num pool de processos, e o processo principal apenas grava
+os bytes na ordem. Só uma janela de tarefas fica em voo; a exceção é o GIF,
+cujos quadros (1 byte por pixel) ficam com o escritor até o Pillow gravar o
+arquivo, com LZW, no fim da instância.
+"""
+import io
+import os
+import shutil
+import subprocess
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from PIL import Image, ImageDraw
+
+from .cenario import FONTES_ITALICO, FONTES_NEGRITO, carregar_fonte, renderizar_cenario
+from .layout import DURACAO_TRAVESSIA, SPRITES, TAMANHO_SUBSTITUTO, deslocamento_barco, lugares_no_barco, \
+    posicoes_personagens, trajeto_barco
+from .sprites import carregar_sprite, sprite_substituto
+
+DIRETORIO_BASE = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Pausas da interface: 0,5 s depois da travessia mais 0,8 s antes da próxima.
+PAUSA_PASSO = 1.3
+PAUSA_FINAL = 2.5
+MENSAGEM_FINAL = "Travessia Concluída! Parabéns!"
+QUADROS_POR_TAREFA = 8
+
+# Cenários, sprites, fontes e paletas já prontos neste processo.
+_CENARIOS = {}
+_SPRITES = {}
+_FONTES = {}
+_PALETAS = {}
+
+
+def formato_destino(destino):
+    """``"gif"``, ``"png"`` (diretório com uma imagem por quadro) ou ``"video"`` (via ffmpeg)."""
+    extensao = os.path.splitext(destino)[1].lower()
+    if extensao == ".gif": return "gif"
+    if extensao in ("", ".png"): return "png"
+    return "video"
+
+
+def quadros_travessia(caminho, fps=20):
+    """Quadros ``(passo, progresso, repeticoes)`` da animação de ``caminho``.
+
+    Com ``progresso`` None o quadro mostra ``caminho[passo]`` parado por
+    ``repeticoes`` quadros; senão, o barco indo de ``caminho[passo]`` para o
+    próximo estado.
+    """
+    por_travessia = max(1, round(DURACAO_TRAVESSIA * fps))
+    yield 0, None, max(1, round(PAUSA_PASSO * fps))
+    for passo in range(len(caminho) - 1):
+        for i in range(1, por_travessia + 1):
+            yield passo, i / por_travessia, 1
+        pausa = PAUSA_FINAL if passo == len(caminho) - 2 else PAUSA_PASSO
+        yield passo + 1, None, max(1, round(pausa * fps))
+
+
+def _sprite(nome):
+    if nome not in _SPRITES:
+        if nome in SPRITES:
+            arquivo, tamanho = SPRITES[nome]
+            _SPRITES[nome] = carregar_sprite(os.path.join(DIRETORIO_BASE, arquivo), tamanho)
+        else:
+            _SPRITES[nome] = sprite_substituto(TAMANHO_SUBSTITUTO, nome)
+    return _SPRITES[nome]
+
+
+def _fonte(tamanho, nomes):
+    if (tamanho, nomes) not in _FONTES: _FONTES[tamanho, nomes] = carregar_fonte(tamanho, nomes)
+    return _FONTES[tamanho, nomes]
+
+
+def _colar(imagem, sprite, centro):
+    # Como no canvas, a posição é o centro do sprite.
+    imagem.paste(sprite, (round(centro[0] - sprite.width / 2), round(centro[1] - sprite.height / 2)), sprite)
+
+
+def renderizar_quadro(entidades, caminho, rotulos, passo, progresso, largura, altura):
+    """Quadro RGB da animação; ``caminho`` são tuplas de margens ("E"/"D") na ordem de ``entidades``."""
+    if (largura, altura) not in _CENARIOS: _CENARIOS[largura, altura] = renderizar_cenario(largura, altura)
+    imagem = _CENARIOS[largura, altura].copy()
+    desenho = ImageDraw.Draw(imagem)
+    estado = caminho[passo]
+
+    if progresso is None:
+        for nome, posicao in posicoes_personagens(zip(entidades, estado), largura, altura).items():
+            _colar(imagem, _sprite(nome), posicao)
+        if passo == len(caminho) - 1 and passo > 0:
+            desenho.text((largura / 2, 50), MENSAGEM_FINAL, font=_fonte(22, FONTES_NEGRITO), fill="#32CD32", anchor="mm")
+        elif passo > 0:
+            desenho.text((largura / 2, 50), rotulos[passo - 1], font=_fonte(16, FONTES_ITALICO), fill="black", anchor="mm")
+        return imagem
+
+    # Quem fica continua onde estava no estado anterior; quem muda de margem vai no barco.
+    seguinte = caminho[passo + 1]
+    no_barco = [nome for nome, antes, depois in zip(entidades, estado, seguinte) if antes != depois]
+    for nome, posicao in posicoes_personagens(zip(entidades, estado), largura, altura).items():
+        if nome not in no_barco: _colar(imagem, _sprite(nome), posicao)
+
+    x_partida, x_chegada, y_barco = trajeto_barco(estado[entidades.index(no_barco[0])] if no_barco else "E",
+                                                  largura, altura)
+    dx, dy = deslocamento_barco(x_chegada - x_partida, progresso)
+    x, y = x_partida + dx, y_barco + dy
+    _colar(imagem, _sprite("barco"), (x, y))
+    for nome, lugar in zip(no_barco, lugares_no_barco(x, y, len(no_barco))):
+        _colar(imagem, _sprite(nome), lugar)
+    desenho.text((largura / 2, 50), rotulos[passo], font=_fonte(16, FONTES_ITALICO), fill="black", anchor="mm")
+    return imagem
+
+
+def _imagem_paleta(entidades, largura, altura):
+    """Cenário com todos os sprites e textos: as cores de qualquer quadro saem daqui."""
+    imagem = renderizar_cenario(largura, altura)
+    desenho = ImageDraw.Draw(imagem)
+    x = 0
+    for nome in ("barco", *entidades):
+        sprite = _sprite(nome)
+        imagem.paste(sprite, (x % max(1, largura - sprite.width), 0), sprite)
+        x += sprite.width
+    desenho.text((10, altura / 2), MENSAGEM_FINAL, font=_fonte(22, FONTES_NEGRITO), fill="#32CD32", anchor="lm")
+    desenho.text((10, altura / 2 + 30), MENSAGEM_FINAL, font=_fonte(16, FONTES_ITALICO), fill="black", anchor="lm")
+    return imagem.quantize(256, method=Image.Quantize.MEDIANCUT, dither=Image.Dither.NONE)
+
+
+def paleta_gif(entidades, largura, altura):
+    """Paleta (768 bytes) comum a todos os quadros de um GIF, para usar uma tabela global de cores."""
+    return bytes(_imagem_paleta(tuple(entidades), largura, altura).getpalette()[:768]).ljust(768, b"\0")
+
+
+def _paleta(bytes_paleta):
+    if bytes_paleta not in _PALETAS:
+        imagem = Image.new("P", (1, 1))
+        imagem.putpalette(bytes_paleta)
+        _PALETAS[bytes_paleta] = imagem
+    return _PALETAS[bytes_paleta]
+
+
+def _codificar(imagem, formato, bytes_paleta):
+    if formato == "gif":
+        # Só os índices na paleta comum; o escritor monta o GIF com ela.
+        return imagem.quantize(palette=_paleta(bytes_paleta), dither=Image.Dither.NONE).tobytes()
+    if formato == "png":
+        saida = io.BytesIO()
+        imagem.save(saida, "PNG", compress_level=1)
+        return saida.getvalue()
+    return imagem.tobytes()
+
+
+def renderizar_tarefa(tarefa):
+    """Renderiza e codifica um bloco de quadros de uma instância (roda nos processos do pool)."""
+    entidades, caminho, rotulos, quadros, largura, altura, formato, bytes_paleta = tarefa
+    return [_codificar(renderizar_quadro(entidades, caminho, rotulos, passo, progresso, largura, altura),
+                       formato, bytes_paleta)
+            for passo, progresso, _repeticoes in quadros]
+
+
+class _EscritorGif:
+    def __init__(self, destino, entidades, largura, altura, fps):
+        self.destino, self.tamanho, self.fps = destino, (largura, altura), fps
+        self.paleta = paleta_gif(entidades, largura, altura)
+        self.quadros, self.duracoes = deque(), []
+
+    def escrever(self, dados, repeticoes):
+        self.quadros.append(dados)
+        # Em ms, arredondado aos centésimos de segundo que o GIF guarda.
+        self.duracoes.append(round(100 * repeticoes / self.fps) * 10)
+
+    def _imagens(self):
+        # Libera cada quadro assim que o Pillow o consome.
+        while self.quadros:
+            imagem = Image.frombytes("P", self.tamanho, self.quadros.popleft())
+            imagem.putpalette(self.paleta)
+            yield imagem
+
+    def fechar(self):
+        if not self.quadros: return
+        imagens = self._imagens()
+        next(imagens).save(self.destino, "GIF", save_all=True, append_images=imagens, duration=self.duracoes,
+                           loop=0, palette=self.paleta, optimize=False)
+
+
+class _EscritorPng:
+    paleta = None
+
+    def __init__(self, destino, *_args):
+        self.diretorio = os.path.splitext(destino)[0] if destino.lower().endswith(".png") else destino
+        os.makedirs(self.diretorio, exist_ok=True)
+        self.numero = 0
+
+    def escrever(self, dados, repeticoes):
+        # Sequência com taxa fixa: as pausas repetem o mesmo quadro.
+        for _ in range(repeticoes):
+            with open(os.path.join(self.diretorio, f"quadro_{self.numero:05d}.png"), "wb") as arquivo:
+                arquivo.write(dados)
+            self.numero += 1
+
+    def fechar(self):
+        pass
+
+
+class _EscritorVideo:
+    paleta = None
+
+    def __init__(self, destino, _entidades, largura, altura, fps):
+        ffmpeg = shutil.which("ffmpeg")
+        if ffmpeg is None: raise RuntimeError("A exportação de vídeo precisa do ffmpeg no PATH; use .gif ou um diretório de PNGs.")
+        self.processo = subprocess.Popen(
+            [ffmpeg, "-y", "-loglevel", "error", "-f", "rawvideo", "-pix_fmt", "rgb24", "-s", f"{largura}x{altura}",
+             "-r", str(fps), "-i", "-", "-vf", "pad=ceil(iw/2)*2:ceil(ih/2)*2", "-pix_fmt", "yuv420p", destino],
+            stdin=subprocess.PIPE)
+
+    def escrever(self, dados, repeticoes):
+        for _ in range(repeticoes): self.processo.stdin.write(dados)
+
+    def fechar(self):
+        self.processo.stdin.close()
+        if self.processo.wait() != 0: raise RuntimeError(f"o ffmpeg terminou com código {self.processo.returncode}")
+
+
+_ESCRITORES = {"gif": _EscritorGif, "png": _EscritorPng, "video": _EscritorVideo}
+
+
+def _blocos(quadros, tamanho):
+    bloco = []
+    for quadro in quadros:
+        bloco.append(quadro)
+        if len(bloco) >= tamanho:
+            yield bloco
+            bloco = []
+    if bloco: yield bloco
+
+
+def exportar_lote(instancias, largura=800, altura=500, fps=20, processos=None, max_pendentes=None):
+    """Exporta várias animações compartilhando um pool e produz um resumo por instância, na ordem.
+
+    Cada instância é um dicionário com ``id``, ``destino``, ``entidades``,
+    ``caminho`` (tuplas de margens) e ``rotulos`` (um por passo). As tarefas
+    de uma instância entram no pool enquanto a anterior ainda é gravada. Com
+    ``processos=0`` tudo roda no próprio processo.
+    """
+    pendentes = deque()
+    escritores = {}
+
+    def tarefas():
+        for numero, instancia in enumerate(instancias):
+            destino, entidades = instancia["destino"], tuple(instancia["entidades"])
+            formato = formato_destino(destino)
+            caminho = [tuple(estado) for estado in instancia["caminho"]]
+            escritor = _ESCRITORES[formato](destino, entidades, largura, altura, fps)
+            escritores[numero] = [instancia, escritor, time.perf_counter(), 0]
+            quadros = quadros_travessia(caminho, fps)
+            for bloco in _blocos(quadros, QUADROS_POR_TAREFA):
+                yield numero, bloco, (entidades, caminho, instancia["rotulos"], bloco, largura, altura, formato,
+                                      escritor.paleta)
+            yield numero, None, None
+
+    def gravar(numero, bloco, resultado):
+        instancia, escritor, comeco, total = escritores[numero]
+        if bloco is None:
+            del escritores[numero]
+            escritor.fechar()
+            return {"id": instancia.get("id"), "arquivo": instancia["destino"], "quadros": total,
+                    "tempo_ms": round((time.perf_counter() - comeco) * 1000, 3)}
+        for dados, (_passo, _progresso, repeticoes) in zip(resultado, bloco):
+            escritor.escrever(dados, repeticoes)
+            escritores[numero][3] += repeticoes
+        return None
+
+    try:
+        if processos == 0:
+            for numero, bloco, tarefa in tarefas():
+                resumo = gravar(numero, bloco, renderizar_tarefa(tarefa) if bloco else None)
+                if resumo: yield resumo
+            return
+
+        processos = processos or os.cpu_count() or 1
+        max_pendentes = max_pendentes or 2 * processos
+        with ProcessPoolExecutor(max_workers=processos) as pool:
+            for numero, bloco, tarefa in tarefas():
+                pendentes.append((numero, bloco, pool.submit(renderizar_tarefa, tarefa) if bloco else None))
+                # Grava na ordem de envio; só espera quando a janela enche.
+                while pendentes and (len(pendentes) > max_pendentes or pendentes[0][2] is None
+                                     or pendentes[0][2].done()):
+                    numero_feito, bloco_feito, futuro = pendentes.popleft()
+                    resumo = gravar(numero_feito, bloco_feito, futuro.result() if futuro else None)
+                    if resumo: yield resumo
+            while pendentes:
+                numero_feito, bloco_feito, futuro = pendentes.popleft()
+                resumo = gravar(numero_feito, bloco_feito, futuro.result() if futuro else None)
+                if resumo: yield resumo
+    finally:
+        for _instancia, escritor, _comeco, _total in escritores.values():
+            try:
+                escritor.fechar()
+            except (OSError, RuntimeError):
+                pass
+
+
+def exportar_animacao(entidades, caminho, rotulos, destino, **opcoes):
+    """Exporta uma única animação; ``opcoes`` são as de ``exportar_lote``."""
+    instancia = {"destino": destino, "entidades": entidades, "caminho": caminho, "rotulos": rotulos}
+    return next(exportar_lote([instancia], **opcoes))
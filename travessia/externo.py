@@ -0,0 +1,144 @@
+"""BFS em memória externa para espaços de estados maiores que a RAM.
+
+Os visitados são um bitset mapeado em disco (um bit por estado codificado) e
+o pai de cada estado é só o índice do movimento que o descobriu, num vetor
+mapeado de 1 byte por estado (2 se houver mais de 256 movimentos): como a
+travessia é um XOR, o pai se recupera a partir do movimento. Cada camada da
+BFS é um arquivo de estados gravado e relido em blocos sequenciais; a
+expansão de um bloco é a mesma do solucionador vetorizado, então o caminho
+encontrado é o mesmo.
+
+A memória residente fica limitada por ``memoria_mb``: ela define o tamanho
+dos blocos e, quando os mapas passam desse tamanho, suas páginas são
+devolvidas ao sistema depois de cada bloco (continuam no arquivo).
+"""
+import mmap
+import os
+import shutil
+import tempfile
+
+try:
+    import numpy as np
+except ImportError as erro:
+    raise ImportError("O solucionador em memória externa precisa do NumPy. Instale com: pip install numpy") from erro
+
+from .busca import ResultadoBusca
+from .vetorizado import expandir
+
+MEMORIA_PADRAO_MB = 64
+# Bytes por par (estado, movimento) nas matrizes temporárias de ``expandir``.
+_BYTES_POR_PAR = 48
+
+
+class _Mapa:
+    """Arquivo de ``tamanho`` elementos zerados, mapeado em memória e visto como vetor NumPy."""
+
+    def __init__(self, arquivo, tamanho, dtype):
+        dtype = np.dtype(dtype)
+        self.bytes = max(1, tamanho * dtype.itemsize)
+        with open(arquivo, "w+b") as saida:
+            # truncate cria um arquivo esparso: só os blocos tocados ocupam disco.
+            saida.truncate(self.bytes)
+            self._mmap = mmap.mmap(saida.fileno(), self.bytes)
+        self.vetor = np.frombuffer(self._mmap, dtype=dtype, count=tamanho)
+
+    def liberar_paginas(self):
+        if hasattr(mmap, "MADV_DONTNEED"): self._mmap.madvise(mmap.MADV_DONTNEED)
+
+    def fechar(self):
+        # Sem referências ao buffer o mmap pode ser fechado.
+        self.vetor = None
+        self._mmap.close()
+
+
+class _Bitset(_Mapa):
+    def __init__(self, arquivo, tamanho):
+        super().__init__(arquivo, (tamanho + 7) // 8, np.uint8)
+
+    def contem(self, estados):
+        return (self.vetor[estados >> np.uint64(3)] >> (estados & np.uint64(7)).astype(np.uint8)) & np.uint8(1) != 0
+
+    def marcar(self, estados):
+        # ufunc.at acumula bits de estados diferentes que caem no mesmo byte.
+        np.bitwise_or.at(self.vetor, estados >> np.uint64(3),
+                         np.left_shift(np.uint8(1), (estados & np.uint64(7)).astype(np.uint8)))
+
+
+def _ler_camada(arquivo, dtype, por_bloco):
+    with open(arquivo, "rb") as entrada:
+        while True:
+            bloco = np.fromfile(entrada, dtype=dtype, count=por_bloco)
+            if not bloco.size: return
+            yield bloco.astype(np.uint64, copy=False)
+
+
+def buscar_externo(regras, inicio, final=None, progresso=None, diretorio=None, memoria_mb=MEMORIA_PADRAO_MB):
+    """BFS com visitados, pais e camadas em arquivos temporários dentro de ``diretorio``.
+
+    ``memoria_mb`` limita a memória residente da busca, sem contar o interpretador.
+    """
+    if final is None: final = regras.estado_final
+    if inicio == final: return ResultadoBusca([inicio], 0, "externo")
+
+    movimentos = np.array(regras.movimentos, dtype=np.uint64)
+    memoria = int(memoria_mb * (1 << 20))
+    por_bloco = max(1, memoria // (_BYTES_POR_PAR * max(1, len(movimentos))))
+    tipo_estado = np.uint32 if regras.num_estados <= 1 << 32 else np.uint64
+    tipo_pai = np.uint8 if len(movimentos) <= 1 << 8 else np.uint16
+
+    pasta = tempfile.mkdtemp(prefix="travessia-externo-", dir=diretorio)
+    visitados = pais = None
+    try:
+        visitados = _Bitset(os.path.join(pasta, "visitados.bin"), regras.num_estados)
+        pais = _Mapa(os.path.join(pasta, "pais.bin"), regras.num_estados, tipo_pai)
+        mapas_grandes = visitados.bytes + pais.bytes > memoria
+        visitados.marcar(np.array([inicio], dtype=np.uint64))
+        camada = os.path.join(pasta, "camada_0.bin")
+        np.array([inicio], dtype=tipo_estado).tofile(camada)
+        tamanho_camada, expandidos, profundidade = 1, 0, 0
+
+        while tamanho_camada:
+            proxima = os.path.join(pasta, f"camada_{profundidade + 1}.bin")
+            restantes, tamanho_proxima = tamanho_camada, 0
+            with open(proxima, "wb") as saida:
+                for bloco in _ler_camada(camada, tipo_estado, por_bloco):
+                    linhas, colunas, destinos = expandir(regras, bloco, movimentos)
+                    novos = ~visitados.contem(destinos)
+                    linhas, colunas, destinos = linhas[novos], colunas[novos], destinos[novos]
+                    # Só a primeira ocorrência de cada estado, na ordem de descoberta.
+                    _unicos, primeiros = np.unique(destinos, return_index=True)
+                    primeiros.sort()
+                    linhas, colunas, destinos = linhas[primeiros], colunas[primeiros], destinos[primeiros]
+
+                    visitados.marcar(destinos)
+                    pais.vetor[destinos] = colunas
+                    if visitados.contem(np.array([final], dtype=np.uint64))[0]:
+                        posicao = int(np.flatnonzero(destinos == np.uint64(final))[0])
+                        expandidos += int(linhas[posicao]) + 1
+                        return ResultadoBusca(_reconstruir(regras, pais.vetor, inicio, final), expandidos, "externo")
+                    expandidos += bloco.size
+                    restantes -= bloco.size
+                    destinos.astype(tipo_estado).tofile(saida)
+                    tamanho_proxima += destinos.size
+                    if mapas_grandes:
+                        visitados.liberar_paginas()
+                        pais.liberar_paginas()
+                    if progresso: progresso(expandidos, restantes, profundidade)
+            os.remove(camada)
+            camada, tamanho_camada = proxima, tamanho_proxima
+            profundidade += 1
+        return ResultadoBusca(None, expandidos, "externo")
+    finally:
+        for mapa in (visitados, pais):
+            if mapa is not None: mapa.fechar()
+        shutil.rmtree(pasta, ignore_errors=True)
+
+
+def _reconstruir(regras, pais, inicio, final):
+    caminho = [final]
+    estado = final
+    while estado != inicio:
+        estado ^= regras.movimentos[int(pais[estado])] ^ regras.bit_barco
+        caminho.append(estado)
+    caminho.reverse()
+    return caminho
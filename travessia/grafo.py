@@ -0,0 +1,81 @@
+"""Grafo do espaço de estados alcançável e seu layout em camadas.
+
+A exploração usa só a biblioteca padrão; o layout precisa do NumPy e é
+pensado para rodar fora da thread do Tk.
+"""
+from collections import deque
+
+
+class EspacoEstados:
+    def __init__(self, estados, profundidades, arestas, indice=None):
+        self.estados = estados
+        self.profundidades = profundidades
+        self.arestas = arestas
+        self.indice = indice if indice is not None else {estado: i for i, estado in enumerate(estados)}
+
+    def __len__(self):
+        return len(self.estados)
+
+
+def explorar(regras, inicio, limite=None):
+    """BFS a partir de ``inicio`` guardando profundidade e arestas (i, j, movimento).
+
+    Cada aresta aparece uma vez, com ``i < j``. ``limite`` corta a exploração
+    depois de tantos estados.
+    """
+    indice = {inicio: 0}
+    estados, profundidades, arestas = [inicio], [0], []
+    fila = deque([inicio])
+    while fila:
+        estado = fila.popleft()
+        i = indice[estado]
+        for movimento, proximo in regras.sucessores(estado):
+            j = indice.get(proximo)
+            if j is None:
+                if limite is not None and len(estados) >= limite: continue
+                j = indice[proximo] = len(estados)
+                estados.append(proximo)
+                profundidades.append(profundidades[i] + 1)
+                fila.append(proximo)
+            if i < j: arestas.append((i, j, movimento))
+    return EspacoEstados(estados, profundidades, arestas, indice)
+
+
+def layout_camadas(profundidades, arestas, varreduras=6):
+    """Posições normalizadas em [0, 1] x [0, 1]: y pela profundidade na BFS e x
+    pela ordem dentro da camada, refinada por baricentros dos vizinhos.
+
+    Devolve um ``numpy.ndarray`` de forma (n, 2).
+    """
+    try:
+        import numpy as np
+    except ImportError as erro:
+        raise ImportError("O layout do espaço de estados precisa do NumPy. Instale com: pip install numpy") from erro
+
+    profundidade = np.asarray(profundidades, dtype=np.int64)
+    n = profundidade.size
+    if n == 0: return np.zeros((0, 2))
+    arestas = np.asarray(arestas, dtype=np.int64).reshape(-1, 3)
+    origem, destino = arestas[:, 0], arestas[:, 1]
+
+    tamanhos = np.bincount(profundidade)
+    inicio_camada = np.concatenate(([0], np.cumsum(tamanhos)[:-1]))
+    grau = np.bincount(origem, minlength=n) + np.bincount(destino, minlength=n)
+
+    def posicionar(chave):
+        # Ordena por (profundidade, chave) e converte o posto dentro da camada em x.
+        ordem = np.lexsort((np.arange(n), chave, profundidade))
+        posto = np.empty(n, dtype=np.int64)
+        posto[ordem] = np.arange(n) - inicio_camada[profundidade[ordem]]
+        return (posto + 0.5) / tamanhos[profundidade]
+
+    x = posicionar(np.arange(n, dtype=np.float64))
+    for _ in range(varreduras):
+        soma = np.zeros(n)
+        np.add.at(soma, origem, x[destino])
+        np.add.at(soma, destino, x[origem])
+        baricentro = np.where(grau > 0, soma / np.maximum(grau, 1), x)
+        x = posicionar(baricentro)
+
+    maior = max(int(profundidade.max()), 1)
+    return np.column_stack((x, profundidade / maior))
@@ -0,0 +1,214 @@
+"""Contadores e medidas de tempo opcionais do solucionador e da renderização.
+
+Desligada (o padrão), cada ponto instrumentado custa só a leitura de
+``ATIVA``. Liga com ``ativar()`` ou com ``TRAVESSIA_INSTRUMENTAR=1`` no
+ambiente. As medidas guardam contagem, soma, máximo, um histograma fixo e as
+últimas amostras, usadas para os percentis.
+
+Só o que o núcleo usa é importado no topo; json, csv e functools ficam nas
+funções que precisam deles, para não pesar no ``import travessia``.
+"""
+import math
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+ATIVA = os.environ.get("TRAVESSIA_INSTRUMENTAR", "") not in ("", "0")
+
+# Limites superiores (em ms ou na unidade da medida) das faixas do histograma.
+FAIXAS = (1, 2, 4, 8, 16, 33, 50, 100, 250, 1000, math.inf)
+MAX_AMOSTRAS = 10000
+
+_trava = threading.Lock()
+_contadores = {}
+_medidas = {}
+
+
+class Medida:
+    """Contagem, soma, máximo, histograma fixo e as últimas amostras de uma grandeza."""
+
+    def __init__(self):
+        self.n = 0
+        self.total = 0.0
+        self.maximo = 0.0
+        self.faixas = [0] * len(FAIXAS)
+        self.amostras = deque(maxlen=MAX_AMOSTRAS)
+
+    def adicionar(self, valor):
+        self.n += 1
+        self.total += valor
+        self.maximo = max(self.maximo, valor)
+        self.faixas[next(i for i, limite in enumerate(FAIXAS) if valor <= limite)] += 1
+        self.amostras.append(valor)
+
+    def resumo(self):
+        ordenadas = sorted(self.amostras)
+        percentil = lambda p: ordenadas[min(len(ordenadas) - 1, math.ceil(p * len(ordenadas)) - 1)] if ordenadas else 0.0
+        return {
+            "n": self.n,
+            "total": self.total,
+            "media": self.total / self.n if self.n else 0.0,
+            "p50": percentil(0.5),
+            "p95": percentil(0.95),
+            "p99": percentil(0.99),
+            "max": self.maximo,
+            "histograma": {_rotulo_faixa(limite): n for limite, n in zip(FAIXAS, self.faixas)},
+        }
+
+
+def _rotulo_faixa(limite):
+    return f"<={limite:g}" if limite != math.inf else "inf"
+
+
+def ativar(ativa=True):
+    global ATIVA
+    ATIVA = ativa
+
+
+def reiniciar():
+    with _trava:
+        _contadores.clear()
+        _medidas.clear()
+
+
+def contar(nome, quantidade=1):
+    if not ATIVA: return
+    with _trava:
+        _contadores[nome] = _contadores.get(nome, 0) + quantidade
+
+
+def registrar(nome, valor):
+    if not ATIVA: return
+    with _trava:
+        medida = _medidas.get(nome)
+        if medida is None: medida = _medidas[nome] = Medida()
+        medida.adicionar(valor)
+
+
+class _Cronometro:
+    __slots__ = ("nome", "inicio")
+
+    def __init__(self, nome):
+        self.nome = nome
+
+    def __enter__(self):
+        self.inicio = time.perf_counter()
+        return self
+
+    def __exit__(self, *_erro):
+        registrar(self.nome, (time.perf_counter() - self.inicio) * 1000)
+
+
+class _Nulo:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_erro):
+        return False
+
+
+_NULO = _Nulo()
+
+
+def medir(nome):
+    """``with medir("x_ms"):`` registra a duração do bloco em milissegundos."""
+    return _Cronometro(nome) if ATIVA else _NULO
+
+
+@contextmanager
+def _contando_criacoes():
+    # Todos os create_* do Tkinter passam por Canvas._create; como o Tk roda
+    # numa thread só, basta trocá-lo durante a chamada medida.
+    import tkinter
+    original = tkinter.Canvas._create
+    contagem = [0]
+
+    def criar(canvas, *args, **kwargs):
+        contagem[0] += 1
+        return original(canvas, *args, **kwargs)
+
+    tkinter.Canvas._create = criar
+    try:
+        yield contagem
+    finally:
+        tkinter.Canvas._create = original
+
+
+def itens_canvas(nome):
+    """Decorador que registra em ``nome`` quantos itens de canvas cada chamada cria."""
+    import functools
+
+    def decorador(funcao):
+        @functools.wraps(funcao)
+        def envolvida(*args, **kwargs):
+            if not ATIVA: return funcao(*args, **kwargs)
+            with _contando_criacoes() as contagem:
+                resultado = funcao(*args, **kwargs)
+            registrar(nome, contagem[0])
+            return resultado
+        return envolvida
+    return decorador
+
+
+class RegrasContadas:
+    """Regras que contam as transições tentadas e as rejeitadas por ``valido``.
+
+    Só as buscas que chamam ``sucessores`` passam por aqui; as do NumPy
+    expandem camadas inteiras sem ele e não têm esses contadores.
+    """
+
+    def __init__(self, regras):
+        self._regras = regras
+        self.tentadas = 0
+        self.rejeitadas = 0
+
+    def __getattr__(self, nome):
+        # Ao desserializar ``_regras`` ainda não existe: repassar a busca dele recursaria sem fim.
+        if nome == "_regras" or nome.startswith("__"): raise AttributeError(nome)
+        return getattr(self._regras, nome)
+
+    def sucessores(self, estado):
+        for i, proximo in self._regras.sucessores_com_invalidos(estado):
+            self.tentadas += 1
+            if proximo is None: self.rejeitadas += 1
+            else: yield i, proximo
+
+
+def resumo():
+    with _trava:
+        return {
+            "contadores": dict(_contadores),
+            "medidas": {nome: medida.resumo() for nome, medida in _medidas.items()},
+        }
+
+
+def exportar_json(arquivo):
+    import json
+    with open(arquivo, "w", encoding="utf-8") as saida:
+        json.dump(resumo(), saida, indent=2, ensure_ascii=False)
+
+
+def exportar_csv(arquivo):
+    """Uma linha por contador ou medida; as faixas do histograma viram colunas."""
+    import csv
+    dados = resumo()
+    faixas = [_rotulo_faixa(limite) for limite in FAIXAS]
+    with open(arquivo, "w", newline="", encoding="utf-8") as saida:
+        escritor = csv.writer(saida)
+        escritor.writerow(["nome", "tipo", "n", "total", "media", "p50", "p95", "max", *faixas])
+        for nome, valor in sorted(dados["contadores"].items()):
+            escritor.writerow([nome, "contador", "", valor])
+        for nome, medida in sorted(dados["medidas"].items()):
+            escritor.writerow([nome, "medida", medida["n"], medida["total"], medida["media"], medida["p50"],
+                               medida["p95"], medida["max"], *medida["histograma"].values()])
+
+
+def texto_resumo():
+    """Resumo em poucas linhas, para a sobreposição de depuração."""
+    dados = resumo()
+    linhas = [f"{nome}: {valor}" for nome, valor in sorted(dados["contadores"].items())]
+    for nome, medida in sorted(dados["medidas"].items()):
+        linhas.append(f"{nome}: n={medida['n']} média={medida['media']:.2f} p95={medida['p95']:.2f} max={medida['max']:.2f}")
+    return "\n".join(linhas) or "(sem dados)"
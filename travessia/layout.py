@@ -0,0 +1,61 @@
+"""Geometria da animação da travessia, sem Tk nem PIL.
+
+Usada pelo canvas da interface e pela exportação de quadros, para que as
+duas desenhem os personagens e o barco nos mesmos lugares. As posições são
+os centros dos sprites.
+"""
+import math
+
+# Arquivo (relativo à raiz do projeto) e tamanho de cada sprite.
+SPRITES = {
+    "fazendeiro": ("assets/fazendeiro.png", (60, 60)),
+    "lobo": ("assets/lobo.png", (55, 55)),
+    "cabra": ("assets/cabra.png", (55, 55)),
+    "repolho": ("assets/repolho.png", (50, 50)),
+    "barco": ("assets/barco.png", (150, 100)),
+}
+TAMANHO_SUBSTITUTO = (55, 55)
+
+# Segundos na velocidade 1 e amplitude, em pixels, da ondulação vertical do barco.
+DURACAO_TRAVESSIA = 2.4
+ONDULACAO_BARCO = 3
+
+ESPACO_PERSONAGENS = 65
+ESPACO_NO_BARCO = 40
+
+
+def geometria_margens(largura, altura):
+    """Fim da margem esquerda, início da margem direita e nível da grama."""
+    return largura * 0.25, largura * 0.75, max(altura - 120, altura * 0.6)
+
+
+def posicoes_personagens(margens, largura, altura):
+    """Posição de cada personagem parado; ``margens`` são pares (nome, "E" ou "D") na ordem das entidades."""
+    margem_esq_x_fim, margem_dir_x_inicio, nivel_grama = geometria_margens(largura, altura)
+    margens = list(margens)
+    y = nivel_grama - 25
+    posicoes = {}
+    for lado, centro in (("E", margem_esq_x_fim / 2), ("D", (margem_dir_x_inicio + largura) / 2)):
+        nomes = [nome for nome, posicao in margens if posicao == lado]
+        inicio_x = centro - (len(nomes) - 1) * ESPACO_PERSONAGENS / 2
+        for i, nome in enumerate(nomes):
+            posicoes[nome] = (inicio_x + i * ESPACO_PERSONAGENS, y)
+    return posicoes
+
+
+def trajeto_barco(lado_partida, largura, altura):
+    """``(x_partida, x_chegada, y)`` do barco saindo da margem ``lado_partida``."""
+    margem_esq_x_fim, margem_dir_x_inicio, nivel_grama = geometria_margens(largura, altura)
+    esquerda, direita = margem_esq_x_fim + 75, margem_dir_x_inicio - 75
+    x_partida, x_chegada = (esquerda, direita) if lado_partida == "E" else (direita, esquerda)
+    return x_partida, x_chegada, nivel_grama - 40
+
+
+def lugares_no_barco(x_barco, y_barco, quantidade):
+    """Posições de quem viaja no barco: o remador atrás (-15) e os passageiros à frente."""
+    return [(x_barco - 15 + i * ESPACO_NO_BARCO, y_barco + 5) for i in range(quantidade)]
+
+
+def deslocamento_barco(dx, progresso):
+    """Deslocamento do barco em relação à partida; ``progresso`` vai de 0 a 1."""
+    return dx * progresso, ONDULACAO_BARCO * (1 - math.cos(2 * math.pi * progresso))
@@ -0,0 +1,155 @@
+"""Resolução em lote de instâncias descritas em JSON Lines.
+
+Cada linha de entrada é um estado inicial (``"E E E E"`` ou ``["E", ...]``)
+ou um objeto com ``estado`` e, opcionalmente, ``id``, ``regras`` e
+``estrategia``. Cada linha de saída é o resultado de uma instância, emitido
+assim que ela termina.
+"""
+import json
+import os
+import sqlite3
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+from .busca import resolver
+from .cache import CacheSolucoes
+from .compilado import TabelaCompilada
+from .regras import RegrasTravessia
+from .rotulos import SIMBOLOS_ACOES, acoes_caminho, rotulos_caminho
+
+# Regras e tabelas já construídas neste processo, reaproveitadas entre instâncias.
+_REGRAS = {}
+_TABELAS = {}
+_CACHES = {}
+
+
+def ler_pedidos(linhas):
+    for numero, linha in enumerate(linhas, 1):
+        linha = linha.strip()
+        if not linha or linha.startswith("#"): continue
+        try:
+            pedido = json.loads(linha)
+        except json.JSONDecodeError:
+            pedido = linha
+        if not isinstance(pedido, dict):
+            pedido = {"estado": pedido}
+        pedido.setdefault("id", numero)
+        yield pedido
+
+
+def _regras_do_pedido(pedido):
+    especificacao = pedido.get("regras")
+    if especificacao is None:
+        especificacao = RegrasTravessia.classica().para_dict()
+    chave = json.dumps(especificacao, sort_keys=True)
+    if chave not in _REGRAS:
+        _REGRAS[chave] = RegrasTravessia.de_dict(especificacao)
+    return _REGRAS[chave]
+
+
+def _estado_do_pedido(regras, pedido):
+    estado = pedido.get("estado")
+    if isinstance(estado, str):
+        estado = estado.upper().split()
+    if estado is None:
+        return 0
+    return regras.codificar(tuple(estado))
+
+
+def _buscar(regras, inicio, estrategia):
+    if estrategia == "tabela":
+        if regras not in _TABELAS:
+            _TABELAS[regras] = TabelaCompilada.compilar(regras)
+        return _TABELAS[regras].caminho(inicio)
+    return resolver(regras, inicio, estrategia).caminho
+
+
+def _abrir_cache(arquivo):
+    if arquivo not in _CACHES:
+        try:
+            _CACHES[arquivo] = CacheSolucoes(arquivo)
+        except (sqlite3.Error, OSError) as erro:
+            print(f"Aviso: cache de soluções desativado: {erro}", file=sys.stderr)
+            _CACHES[arquivo] = None
+    return _CACHES[arquivo]
+
+
+def resolver_pedido(pedido, estrategia="bfs", cache=None):
+    """Resolve um pedido; ``cache`` é o arquivo do cache de soluções (None desativa)."""
+    comeco = time.perf_counter()
+    resposta = {"id": pedido.get("id")}
+    try:
+        regras = _regras_do_pedido(pedido)
+        inicio = _estado_do_pedido(regras, pedido)
+        resposta["estado_inicial"] = " ".join(regras.decodificar(inicio))
+        if not regras.valido(inicio):
+            raise ValueError("O estado inicial viola as regras do problema.")
+        if not regras.consistente(inicio):
+            raise ValueError("O estado inicial é inconsistente: o barco não está na margem do remador.")
+        solucoes = _abrir_cache(cache) if cache is not None else None
+        encontrado, caminho = solucoes.obter(regras, inicio) if solucoes else (False, None)
+        if not encontrado:
+            caminho = _buscar(regras, inicio, pedido.get("estrategia", estrategia))
+            if solucoes: solucoes.guardar(regras, inicio, caminho)
+        if solucoes: resposta["do_cache"] = encontrado
+    except (ValueError, KeyError, TypeError, ImportError, sqlite3.Error) as erro:
+        resposta["erro"] = str(erro)
+        caminho = None
+    else:
+        if caminho is None:
+            resposta.update(caminho=None, comprimento=None, acoes=None, rotulos=None)
+        else:
+            acoes = acoes_caminho(regras, caminho)
+            resposta.update(
+                caminho=[" ".join(regras.decodificar(estado)) for estado in caminho],
+                comprimento=len(caminho) - 1,
+                acoes=[SIMBOLOS_ACOES.get(acao, acao) for acao in acoes],
+                rotulos=rotulos_caminho(regras, caminho),
+            )
+    resposta["tempo_ms"] = round((time.perf_counter() - comeco) * 1000, 3)
+    return resposta
+
+
+def resolver_bloco(pedidos, estrategia="bfs", cache=None):
+    return [resolver_pedido(pedido, estrategia, cache) for pedido in pedidos]
+
+
+def _blocos(pedidos, tamanho):
+    bloco = []
+    for pedido in pedidos:
+        bloco.append(pedido)
+        if len(bloco) >= tamanho:
+            yield bloco
+            bloco = []
+    if bloco: yield bloco
+
+
+def processar(pedidos, processos=None, estrategia="bfs", tamanho_bloco=8, max_pendentes=None, cache=None):
+    """Resolve os pedidos num pool de processos e produz as respostas conforme terminam.
+
+    No máximo ``max_pendentes`` blocos ficam em voo ao mesmo tempo, então a
+    memória usada não depende do tamanho da entrada. Com ``processos=0`` tudo
+    roda no próprio processo, na ordem da entrada. ``cache`` é o arquivo
+    SQLite compartilhado pelos processos para reaproveitar soluções.
+    """
+    if processos == 0:
+        for pedido in pedidos:
+            yield resolver_pedido(pedido, estrategia, cache)
+        return
+
+    processos = processos or os.cpu_count() or 1
+    max_pendentes = max_pendentes or 2 * processos
+    blocos = _blocos(pedidos, tamanho_bloco)
+    with ProcessPoolExecutor(max_workers=processos) as pool:
+        pendentes = set()
+        for bloco in blocos:
+            pendentes.add(pool.submit(resolver_bloco, bloco, estrategia, cache))
+            if len(pendentes) < max_pendentes: continue
+            prontos, pendentes = wait(pendentes, return_when=FIRST_COMPLETED)
+            for futuro in prontos:
+                yield from futuro.result()
+        while pendentes:
+            prontos, pendentes = wait(pendentes, return_when=FIRST_COMPLETED)
+            for futuro in prontos:
+                yield from futuro.result()
@@ -0,0 +1,206 @@
+"""BFS paralela por camadas num pool de processos.
+
+Os estados são repartidos entre ``processos`` partições por um hash
+multiplicativo; cada partição tem dono fixo. Cada camada tem duas fases:
+
+1. expansão: cada partição expande a sua fronteira (com ``vetorizado.expandir``)
+   e grava os candidatos ainda não visitados, agrupados pela partição dona, num
+   segmento de memória compartilhada;
+2. deduplicação: cada dono junta os candidatos que recebeu, descarta os já
+   visitados e os repetidos, registra o movimento pai e grava a nova fronteira
+   da partição noutro segmento.
+
+Entre os processos só trafegam nomes de segmentos e contagens; os estados
+vão em vetores ``uint64`` e o pai de cada estado é o índice do movimento, num
+vetor compartilhado de 1 byte por estado (2 se houver 255 movimentos ou
+mais). Como as camadas são sincronizadas, o comprimento do caminho é sempre
+o da BFS serial; o caminho pode ser outro de mesmo comprimento.
+"""
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import resource_tracker, shared_memory
+
+try:
+    import numpy as np
+except ImportError as erro:
+    raise ImportError("O solucionador paralelo precisa do NumPy. Instale com: pip install numpy") from erro
+
+from .busca import ResultadoBusca
+from .vetorizado import TAMANHO_BLOCO, _reconstruir, expandir
+
+_HASH = np.uint64(0x9E3779B97F4A7C15)
+
+# Estado de cada processo: regras, movimentos e o vetor de pais compartilhado.
+_regras = _movimentos = _pais = _memoria_pais = None
+
+
+def particao(estados, processos):
+    """Partição dona de cada estado (hash de Fibonacci, bem espalhado mesmo com estados vizinhos)."""
+    return ((estados * _HASH) >> np.uint64(32)) % np.uint64(processos)
+
+
+def _tipo_pai(num_movimentos):
+    return np.uint8 if num_movimentos < 0xFF else np.uint16
+
+
+def _criar(vetor):
+    # Segmento com o tamanho exato do vetor; quem cria devolve só o nome.
+    memoria = shared_memory.SharedMemory(create=True, size=max(1, vetor.nbytes))
+    np.ndarray(vetor.shape, vetor.dtype, buffer=memoria.buf)[:] = vetor
+    nome = memoria.name
+    memoria.close()
+    return nome
+
+
+def _ler(nome, dtype, inicio, fim):
+    memoria = shared_memory.SharedMemory(name=nome)
+    try:
+        return np.ndarray((fim,), dtype, buffer=memoria.buf)[inicio:fim].copy()
+    finally:
+        memoria.close()
+
+
+def _liberar(nome):
+    memoria = shared_memory.SharedMemory(name=nome)
+    memoria.close()
+    memoria.unlink()
+
+
+def _iniciar_processo(regras, nome_pais):
+    global _regras, _movimentos, _pais, _memoria_pais
+    _regras = regras
+    _movimentos = np.array(regras.movimentos, dtype=np.uint64)
+    _memoria_pais = shared_memory.SharedMemory(name=nome_pais)
+    _pais = np.ndarray((regras.num_estados,), _tipo_pai(len(regras.movimentos)), buffer=_memoria_pais.buf)
+
+
+def _expandir_particao(nome_fronteira, tamanho, processos):
+    """Fase 1: devolve ``(segmento, contagem por dono)`` com destinos e movimentos ordenados por dono."""
+    fronteira = _ler(nome_fronteira, np.uint64, 0, tamanho)
+    sem_pai = np.iinfo(_pais.dtype).max
+    por_bloco = max(1, TAMANHO_BLOCO // max(1, len(_movimentos)))
+    destinos, movimentos = [], []
+    for comeco in range(0, fronteira.size, por_bloco):
+        _linhas, colunas, novos = expandir(_regras, fronteira[comeco:comeco + por_bloco], _movimentos)
+        # Leitura sem trava: um estado marcado agora por outro dono só chega repetido e é descartado na fase 2.
+        ainda = _pais[novos] == sem_pai
+        destinos.append(novos[ainda])
+        movimentos.append(colunas[ainda].astype(_pais.dtype))
+    destinos = np.concatenate(destinos) if destinos else np.empty(0, np.uint64)
+    movimentos = np.concatenate(movimentos) if movimentos else np.empty(0, _pais.dtype)
+    donos = particao(destinos, processos)
+    ordem = np.argsort(donos, kind="stable")
+    contagens = np.bincount(donos.astype(np.int64), minlength=processos)
+    pacote = np.empty(destinos.size * 8 + movimentos.nbytes, dtype=np.uint8)
+    pacote[:destinos.size * 8] = destinos[ordem].view(np.uint8)
+    pacote[destinos.size * 8:] = movimentos[ordem].view(np.uint8)
+    return _criar(pacote), contagens.tolist()
+
+
+def _deduplicar_particao(pacotes, dono, final):
+    """Fase 2: ``pacotes`` são ``(segmento, contagens)`` da fase 1; devolve ``(segmento, tamanho, achou_final)``."""
+    destinos, movimentos = [], []
+    for nome, contagens in pacotes:
+        total, inicio = sum(contagens), sum(contagens[:dono])
+        if not contagens[dono]: continue
+        memoria = shared_memory.SharedMemory(name=nome)
+        try:
+            todos = np.ndarray((total,), np.uint64, buffer=memoria.buf)
+            destinos.append(todos[inicio:inicio + contagens[dono]].copy())
+            pais = np.ndarray((total,), _pais.dtype, buffer=memoria.buf, offset=total * 8)
+            movimentos.append(pais[inicio:inicio + contagens[dono]].copy())
+            del todos, pais
+        finally:
+            memoria.close()
+    if not destinos: return None, 0, False
+
+    destinos, movimentos = np.concatenate(destinos), np.concatenate(movimentos)
+    novos = _pais[destinos] == np.iinfo(_pais.dtype).max
+    destinos, movimentos = destinos[novos], movimentos[novos]
+    # Só a primeira ocorrência de cada estado, na ordem das partições de origem.
+    _unicos, primeiros = np.unique(destinos, return_index=True)
+    primeiros.sort()
+    destinos, movimentos = destinos[primeiros], movimentos[primeiros]
+    _pais[destinos] = movimentos
+    if not destinos.size: return None, 0, False
+    return _criar(destinos), int(destinos.size), bool(np.any(destinos == np.uint64(final)))
+
+
+class _NoProcesso:
+    """Executor que roda tudo no próprio processo (``processos=0``), com a mesma interface."""
+
+    def __init__(self, regras, nome_pais):
+        _iniciar_processo(regras, nome_pais)
+
+    def map(self, funcao, *argumentos):
+        return map(funcao, *argumentos)
+
+    def shutdown(self, **_opcoes):
+        global _pais, _memoria_pais
+        _pais = None
+        _memoria_pais.close()
+
+
+def buscar_paralelo(regras, inicio, final=None, progresso=None, processos=None, contexto=None):
+    """BFS em ``processos`` processos (padrão: número de CPUs; 0 roda no próprio processo).
+
+    ``contexto`` é o contexto do multiprocessing do pool (por exemplo
+    ``multiprocessing.get_context("spawn")``). ``nos_expandidos`` conta camadas
+    inteiras: inclui toda a camada em que o final aparece.
+    """
+    # As regras vão para cada processo: sem o invólucro da instrumentação, que só contaria em outro processo.
+    regras = getattr(regras, "_regras", regras)
+    if final is None: final = regras.estado_final
+    if inicio == final: return ResultadoBusca([inicio], 0, "paralelo")
+    processos = processos if processos is not None else os.cpu_count() or 1
+    particoes = max(1, processos)
+    tipo_pai = _tipo_pai(len(regras.movimentos))
+
+    # O rastreador de recursos precisa existir antes do fork para ser compartilhado com os processos.
+    resource_tracker.ensure_running()
+    memoria_pais = shared_memory.SharedMemory(create=True, size=regras.num_estados * np.dtype(tipo_pai).itemsize)
+    pais = np.ndarray((regras.num_estados,), tipo_pai, buffer=memoria_pais.buf)
+    pais[:] = np.iinfo(tipo_pai).max
+    pais[inicio] = 0
+    segmentos = set()
+    executor = None
+    try:
+        if processos == 0:
+            executor = _NoProcesso(regras, memoria_pais.name)
+        else:
+            executor = ProcessPoolExecutor(max_workers=processos, mp_context=contexto, initializer=_iniciar_processo,
+                                           initargs=(regras, memoria_pais.name))
+        fronteiras = [(None, 0)] * particoes
+        dono_inicio = int(particao(np.array([inicio], dtype=np.uint64), particoes)[0])
+        fronteiras[dono_inicio] = (_criar(np.array([inicio], dtype=np.uint64)), 1)
+        segmentos.add(fronteiras[dono_inicio][0])
+        expandidos, profundidade = 0, 0
+
+        while any(tamanho for _nome, tamanho in fronteiras):
+            ativas = [(nome, tamanho) for nome, tamanho in fronteiras if tamanho]
+            pacotes = list(executor.map(_expandir_particao, *zip(*ativas), [particoes] * len(ativas)))
+            segmentos.update(nome for nome, _contagens in pacotes)
+            expandidos += sum(tamanho for _nome, tamanho in ativas)
+            for nome, _tamanho in ativas:
+                _liberar(nome)
+                segmentos.discard(nome)
+
+            resultados = list(executor.map(_deduplicar_particao, [pacotes] * particoes, range(particoes),
+                                           [final] * particoes))
+            for nome, _contagens in pacotes:
+                _liberar(nome)
+                segmentos.discard(nome)
+            fronteiras = [(nome, tamanho) for nome, tamanho, _achou in resultados]
+            segmentos.update(nome for nome, _tamanho in fronteiras if nome)
+            profundidade += 1
+            if any(achou for _nome, _tamanho, achou in resultados):
+                return ResultadoBusca(_reconstruir(regras, pais, inicio, final), expandidos, "paralelo")
+            if progresso: progresso(expandidos, sum(tamanho for _nome, tamanho in fronteiras), profundidade)
+        return ResultadoBusca(None, expandidos, "paralelo")
+    finally:
+        if executor is not None: executor.shutdown(cancel_futures=True)
+        for nome in segmentos: _liberar(nome)
+        del pais
+        memoria_pais.close()
+        memoria_pais.unlink()
+
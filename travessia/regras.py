@@ -0,0 +1,203 @@
+from itertools import combinations
+
+ESQUERDA, DIREITA = 'E', 'D'
+
+
+class RegrasTravessia:
+    """Especificação de um problema de travessia generalizado.
+
+    Cada estado é um inteiro: o bit i vale 1 quando a entidade i está na
+    margem direita e o bit ``len(entidades)`` guarda a posição do barco.
+    """
+
+    def __init__(self, entidades, grupos_proibidos, guardioes=None, remadores=None, capacidade=2):
+        self.entidades = list(entidades)
+        if len(set(self.entidades)) != len(self.entidades):
+            raise ValueError("Os nomes das entidades devem ser únicos.")
+        self.indice = {nome: i for i, nome in enumerate(self.entidades)}
+
+        self.remadores = list(remadores) if remadores is not None else self.entidades[:1]
+        self.itens = {nome: i for nome, i in self.indice.items() if nome not in self.remadores}
+        self.guardioes = list(guardioes) if guardioes is not None else list(self.remadores)
+        self.grupos_proibidos = [tuple(grupo) for grupo in grupos_proibidos]
+        self.capacidade = capacidade
+        if not self.remadores:
+            raise ValueError("É necessário pelo menos um remador.")
+        if capacidade < 1:
+            raise ValueError("O barco precisa levar pelo menos um passageiro.")
+
+        n = len(self.entidades)
+        self.num_entidades = n
+        self.todos = (1 << n) - 1
+        self.bit_barco = 1 << n
+        self.num_estados = 1 << (n + 1)
+        self.estado_final = self.todos | self.bit_barco
+
+        self.mascara_remadores = self._mascara(self.remadores)
+        self.mascara_guardioes = self._mascara(self.guardioes)
+        self.mascaras_conflito = [self._mascara(grupo) for grupo in self.grupos_proibidos]
+
+        # Com um único remador o barco acompanha sempre essa entidade, então o
+        # estado em tupla não precisa carregar a posição do barco.
+        self.barco_implicito = len(self.remadores) == 1
+        self._indice_remador = self.indice[self.remadores[0]]
+
+        self.movimentos, self.nomes_movimentos = self._gerar_movimentos()
+        self.indice_movimento = {nome: i for i, nome in enumerate(self.nomes_movimentos)}
+        self._movimento_por_mascara = {mascara: i for i, mascara in enumerate(self.movimentos)}
+
+    @classmethod
+    def classica(cls):
+        return cls(
+            entidades=["fazendeiro", "lobo", "cabra", "repolho"],
+            grupos_proibidos=[("lobo", "cabra"), ("cabra", "repolho")],
+            guardioes=["fazendeiro"],
+            remadores=["fazendeiro"],
+            capacidade=2,
+        )
+
+    @classmethod
+    def sintetica(cls, num_itens, capacidade=2):
+        """Variante escalável usada em benchmarks.
+
+        Os itens formam pares que não podem ficar sozinhos sem o fazendeiro e
+        qualquer entidade pode remar, então quase todo o espaço é alcançável.
+        """
+        itens = [f"item{i}" for i in range(num_itens)]
+        grupos = [(itens[i], itens[i + 1]) for i in range(0, num_itens - 1, 2)]
+        return cls(["fazendeiro", *itens], grupos, guardioes=["fazendeiro"],
+                   remadores=["fazendeiro", *itens], capacidade=capacidade)
+
+    @classmethod
+    def de_dict(cls, dados):
+        return cls(
+            entidades=dados["entidades"],
+            grupos_proibidos=dados.get("grupos_proibidos", []),
+            guardioes=dados.get("guardioes"),
+            remadores=dados.get("remadores"),
+            capacidade=dados.get("capacidade", 2),
+        )
+
+    def para_dict(self):
+        return {
+            "entidades": list(self.entidades),
+            "grupos_proibidos": [list(grupo) for grupo in self.grupos_proibidos],
+            "guardioes": list(self.guardioes),
+            "remadores": list(self.remadores),
+            "capacidade": self.capacidade,
+        }
+
+    @classmethod
+    def generalizada(cls, lobos=2, cabras=2, repolhos=2, capacidade=3):
+        """Clássico com vários animais de cada tipo: lobo come cabra e cabra come repolho.
+
+        Animais do mesmo tipo são intercambiáveis, o caso da redução por simetria.
+        """
+        nomes = lambda tipo, n: [f"{tipo}{i + 1}" if n > 1 else tipo for i in range(n)]
+        lobo, cabra, repolho = nomes("lobo", lobos), nomes("cabra", cabras), nomes("repolho", repolhos)
+        grupos = [(l, c) for l in lobo for c in cabra] + [(c, r) for c in cabra for r in repolho]
+        return cls(["fazendeiro", *lobo, *cabra, *repolho], grupos, guardioes=["fazendeiro"],
+                   remadores=["fazendeiro"], capacidade=capacidade)
+
+    def __eq__(self, outra):
+        if not isinstance(outra, RegrasTravessia): return NotImplemented
+        return self.para_dict() == outra.para_dict()
+
+    def __hash__(self):
+        return hash(repr(self.para_dict()))
+
+    def _mascara(self, nomes):
+        mascara = 0
+        for nome in nomes:
+            if nome not in self.indice:
+                raise ValueError(f"Entidade desconhecida nas regras: {nome!r}")
+            mascara |= 1 << self.indice[nome]
+        return mascara
+
+    def _gerar_movimentos(self):
+        # Maiores grupos primeiro e, dentro de cada tamanho, ordem lexicográfica
+        # dos índices: no problema clássico isso reproduz lobo, cabra, repolho, sozinho.
+        movimentos, nomes = [], []
+        for tamanho in range(min(self.capacidade, self.num_entidades), 0, -1):
+            for grupo in combinations(range(self.num_entidades), tamanho):
+                mascara = sum(1 << i for i in grupo)
+                if not mascara & self.mascara_remadores: continue
+                movimentos.append(mascara)
+                nomes.append(self._nomear_movimento(grupo))
+        return movimentos, nomes
+
+    def _nomear_movimento(self, grupo):
+        if self.barco_implicito:
+            passageiros = [self.entidades[i] for i in grupo if i != self._indice_remador]
+            return "+".join(passageiros) if passageiros else "sozinho"
+        return "+".join(self.entidades[i] for i in grupo)
+
+    def valido(self, estado):
+        direita = estado & self.todos
+        esquerda = direita ^ self.todos
+        guardioes = self.mascara_guardioes
+        for grupo in self.mascaras_conflito:
+            if direita & grupo == grupo and not direita & guardioes: return False
+            if esquerda & grupo == grupo and not esquerda & guardioes: return False
+        return True
+
+    def consistente(self, estado):
+        if not self.barco_implicito: return True
+        return bool(estado & self.bit_barco) == bool(estado >> self._indice_remador & 1)
+
+    def transicao(self, estado, movimento):
+        passageiros = self.movimentos[movimento]
+        lado = passageiros if estado & self.bit_barco else 0
+        if estado & passageiros != lado: return None
+        proximo = estado ^ passageiros ^ self.bit_barco
+        return proximo if self.valido(proximo) else None
+
+    def sucessores(self, estado):
+        bit_barco = self.bit_barco
+        na_direita = estado & bit_barco
+        for i, passageiros in enumerate(self.movimentos):
+            if estado & passageiros != (passageiros if na_direita else 0): continue
+            proximo = estado ^ passageiros ^ bit_barco
+            if self.valido(proximo):
+                yield i, proximo
+
+    def sucessores_com_invalidos(self, estado):
+        """Como ``sucessores``, mas também gera ``(i, None)`` quando o destino é inválido."""
+        bit_barco = self.bit_barco
+        na_direita = estado & bit_barco
+        for i, passageiros in enumerate(self.movimentos):
+            if estado & passageiros != (passageiros if na_direita else 0): continue
+            proximo = estado ^ passageiros ^ bit_barco
+            yield i, proximo if self.valido(proximo) else None
+
+    def movimento_entre(self, estado, proximo):
+        """Índice do movimento que leva ``estado`` a ``proximo`` (None se não houver)."""
+        return self._movimento_por_mascara.get((estado ^ proximo) & self.todos)
+
+    def codificar(self, estado, barco=None):
+        """Converte uma tupla de 'E'/'D' no estado inteiro.
+
+        A tupla pode trazer a posição do barco como último elemento; caso
+        contrário ela é deduzida da posição do primeiro remador.
+        """
+        n = self.num_entidades
+        if len(estado) == n + 1 and barco is None:
+            estado, barco = estado[:n], estado[n]
+        if len(estado) != n:
+            raise ValueError(f"O estado deve ter {n} posições, recebido {len(estado)}.")
+        codigo = 0
+        for i, pos in enumerate(estado):
+            if pos == DIREITA: codigo |= 1 << i
+            elif pos != ESQUERDA:
+                raise ValueError(f"Posição inválida {pos!r}: use 'E' ou 'D'.")
+        if barco is None:
+            barco = estado[self._indice_remador]
+        if barco == DIREITA: codigo |= self.bit_barco
+        return codigo
+
+    def decodificar(self, codigo, com_barco=None):
+        if com_barco is None: com_barco = not self.barco_implicito
+        estado = tuple(DIREITA if codigo >> i & 1 else ESQUERDA for i in range(self.num_entidades))
+        if com_barco:
+            estado += (DIREITA if codigo & self.bit_barco else ESQUERDA,)
+        return estado
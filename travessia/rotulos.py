@@ -0,0 +1,29 @@
+from .regras import DIREITA, ESQUERDA
+
+# Vocabulário das ações do problema clássico, o mesmo da fita do autômato.
+SIMBOLOS_ACOES = {"cabra": "a", "sozinho": "b", "lobo": "c", "repolho": "d"}
+
+
+def nome_margem(posicao):
+    return "Direita" if posicao == DIREITA else "Esquerda"
+
+
+def rotulo_acao(acao, destino, remador="fazendeiro"):
+    simbolo = SIMBOLOS_ACOES.get(acao)
+    prefixo = f"({simbolo}) " if simbolo else ""
+    if acao == "sozinho":
+        return f"{prefixo}{remador.capitalize()} volta sozinho para a margem {destino}"
+    return f"{prefixo}Leva o(a) {acao} para a margem {destino}"
+
+
+def acoes_caminho(regras, caminho):
+    """Nomes dos movimentos (como em ``regras.nomes_movimentos``) ao longo de um caminho de inteiros."""
+    return [regras.nomes_movimentos[regras.movimento_entre(a, b)] for a, b in zip(caminho, caminho[1:])]
+
+
+def rotulos_caminho(regras, caminho):
+    rotulos = []
+    for acao, proximo in zip(acoes_caminho(regras, caminho), caminho[1:]):
+        destino = nome_margem(DIREITA if proximo & regras.bit_barco else ESQUERDA)
+        rotulos.append(rotulo_acao(acao, destino, regras.remadores[0]))
+    return rotulos
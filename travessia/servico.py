@@ -0,0 +1,286 @@
+"""Serviço HTTP/JSON local do solucionador, em asyncio.
+
+``POST /resolver`` recebe um pedido no formato do lote (um estado ou um
+objeto com ``estado`` e, opcionalmente, ``id``, ``regras`` e
+``estrategia``) e responde como o lote. ``GET /metricas`` devolve contadores,
+latência e vazão, e ``GET /saude`` só confirma que o serviço está de pé.
+
+Pedidos idênticos (mesmas regras, estado e estratégia) que chegam enquanto
+um deles está sendo calculado esperam o mesmo resultado. Os pedidos
+distintos são agrupados em pequenos lotes (até ``tamanho_lote`` ou
+``janela_ms`` depois do primeiro) e resolvidos num pool de processos, então
+o laço de eventos só lida com E/S. Com mais de ``max_pendentes`` cálculos
+pendentes o serviço responde 503 em vez de acumular fila.
+"""
+import asyncio
+import json
+import os
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from .instrumentacao import Medida
+from .lote import resolver_bloco
+
+MAX_CORPO = 64 * 1024
+MAX_CABECALHOS = 100
+_MOTIVOS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+            413: "Payload Too Large", 414: "URI Too Long", 431: "Request Header Fields Too Large",
+            500: "Internal Server Error", 503: "Service Unavailable"}
+
+
+class ErroHttp(Exception):
+    def __init__(self, status, mensagem):
+        super().__init__(mensagem)
+        self.status = status
+
+
+def chave_pedido(pedido, estrategia):
+    """Chave de coalescência: o pedido sem ``id``, com o estado normalizado."""
+    estado = pedido.get("estado")
+    if isinstance(estado, str): estado = estado.upper().split()
+    return json.dumps({"estado": estado, "regras": pedido.get("regras"),
+                       "estrategia": pedido.get("estrategia", estrategia)}, sort_keys=True, separators=(",", ":"))
+
+
+class ServicoTravessia:
+    def __init__(self, processos=None, tamanho_lote=32, janela_ms=2.0, max_pendentes=1024, estrategia="bfs",
+                 cache=None):
+        self.processos = processos if processos is not None else os.cpu_count() or 1
+        self.tamanho_lote = tamanho_lote
+        self.janela = janela_ms / 1000
+        self.max_pendentes = max_pendentes
+        self.estrategia = estrategia
+        self.cache = cache
+        self._pool = None
+        self._servidor = None
+        self._despachante = None
+        self._fila = None
+        self._vagas = None
+        self._em_voo = {}
+        self._tarefas = set()
+        self._conexoes = {}
+        self._reiniciar_metricas()
+
+    def _reiniciar_metricas(self):
+        self.inicio = time.monotonic()
+        self.requisicoes = 0
+        self.respostas = {}
+        self.coalescidas = 0
+        self.calculos = 0
+        self.lotes = 0
+        self.latencia_ms = Medida()
+        self.tamanho_lotes = Medida()
+        self._concluidas = deque(maxlen=100000)
+
+    async def iniciar(self, host="127.0.0.1", porta=8765):
+        """Abre o pool e o socket; ``porta=0`` escolhe uma porta livre (veja ``endereco``)."""
+        if self.processos: self._pool = ProcessPoolExecutor(max_workers=self.processos)
+        self._fila = asyncio.Queue()
+        # Lotes em execução ao mesmo tempo: o bastante para o pool nunca ficar ocioso.
+        self._vagas = asyncio.Semaphore(2 * max(1, self.processos))
+        self._despachante = asyncio.create_task(self._despachar())
+        self._servidor = await asyncio.start_server(self._atender, host, porta)
+        return self
+
+    @property
+    def endereco(self):
+        return self._servidor.sockets[0].getsockname()[:2]
+
+    async def servir_para_sempre(self):
+        async with self._servidor:
+            await self._servidor.serve_forever()
+
+    async def fechar(self):
+        if self._servidor is not None:
+            self._servidor.close()
+            await self._servidor.wait_closed()
+        if self._despachante is not None:
+            self._despachante.cancel()
+        for tarefa in list(self._tarefas): tarefa.cancel()
+        for futuro in self._em_voo.values():
+            if not futuro.done(): futuro.set_exception(ErroHttp(503, "O serviço está encerrando."))
+        # Fecha as conexões em vez de cancelar quem as atende: cada uma termina ao ver o fim do fluxo.
+        for escritor in list(self._conexoes): escritor.close()
+        if self._conexoes: await asyncio.wait(list(self._conexoes.values()), timeout=5)
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *_erro):
+        await self.fechar()
+
+    async def resolver(self, pedido):
+        """Resolve um pedido, juntando-o a um cálculo idêntico em andamento se houver."""
+        chave = chave_pedido(pedido, self.estrategia)
+        futuro = self._em_voo.get(chave)
+        if futuro is not None:
+            self.coalescidas += 1
+        else:
+            if len(self._em_voo) >= self.max_pendentes:
+                raise ErroHttp(503, f"Mais de {self.max_pendentes} cálculos pendentes; tente de novo em instantes.")
+            futuro = self._em_voo[chave] = asyncio.get_running_loop().create_future()
+            self._fila.put_nowait((chave, pedido))
+        # shield: um cliente que desiste não cancela o cálculo dos outros.
+        resposta = await asyncio.shield(futuro)
+        return dict(resposta, id=pedido.get("id"))
+
+    async def _despachar(self):
+        while True:
+            lote = [await self._fila.get()]
+            if self._fila.qsize() < self.tamanho_lote - 1 and self.janela > 0:
+                await asyncio.sleep(self.janela)
+            while len(lote) < self.tamanho_lote and not self._fila.empty():
+                lote.append(self._fila.get_nowait())
+            await self._vagas.acquire()
+            tarefa = asyncio.create_task(self._executar(lote))
+            self._tarefas.add(tarefa)
+            tarefa.add_done_callback(self._tarefas.discard)
+
+    async def _executar(self, lote):
+        chaves = [chave for chave, _pedido in lote]
+        try:
+            pedidos = [dict(pedido, id=None) for _chave, pedido in lote]
+            respostas = await asyncio.get_running_loop().run_in_executor(
+                self._pool, resolver_bloco, pedidos, self.estrategia, self.cache)
+        except Exception as erro:
+            for chave in chaves:
+                futuro = self._em_voo.pop(chave)
+                if not futuro.done(): futuro.set_exception(erro)
+        else:
+            self.lotes += 1
+            self.calculos += len(lote)
+            self.tamanho_lotes.adicionar(len(lote))
+            for chave, resposta in zip(chaves, respostas):
+                futuro = self._em_voo.pop(chave)
+                if not futuro.done(): futuro.set_result(resposta)
+        finally:
+            self._vagas.release()
+
+    def metricas(self):
+        agora = time.monotonic()
+        recentes = sum(1 for instante in self._concluidas if agora - instante <= 10)
+        decorrido = agora - self.inicio
+        return {
+            "tempo_ativo_s": round(decorrido, 3),
+            "requisicoes": self.requisicoes,
+            "respostas": dict(self.respostas),
+            "coalescidas": self.coalescidas,
+            "calculos": self.calculos,
+            "lotes": self.lotes,
+            "tamanho_lote": self.tamanho_lotes.resumo(),
+            "pendentes": len(self._em_voo),
+            "fila": self._fila.qsize() if self._fila else 0,
+            "latencia_ms": self.latencia_ms.resumo(),
+            "vazao_rps": round(self.latencia_ms.n / decorrido, 3) if decorrido else 0.0,
+            "vazao_10s_rps": round(recentes / min(10, decorrido), 3) if decorrido else 0.0,
+        }
+
+    async def _atender(self, leitor, escritor):
+        self._conexoes[escritor] = asyncio.current_task()
+        try:
+            while True:
+                try:
+                    requisicao = await _ler_requisicao(leitor)
+                except ErroHttp as erro:
+                    await self._responder(escritor, erro.status, {"erro": str(erro)}, time.perf_counter(), False)
+                    return
+                if requisicao is None: return
+                comeco = time.perf_counter()
+                metodo, caminho, cabecalhos, corpo = requisicao
+                manter = cabecalhos.get("connection", "").lower() != "close"
+                self.requisicoes += 1
+                try:
+                    status, dados = 200, await self._rotear(metodo, caminho, corpo)
+                except ErroHttp as erro:
+                    status, dados = erro.status, {"erro": str(erro)}
+                except Exception as erro:
+                    # Por exemplo, um processo do pool que morreu: o serviço continua atendendo.
+                    status, dados = 500, {"erro": f"{type(erro).__name__}: {erro}"}
+                await self._responder(escritor, status, dados, comeco, manter)
+                if not manter: return
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            del self._conexoes[escritor]
+            escritor.close()
+
+    async def _rotear(self, metodo, caminho, corpo):
+        if caminho == "/resolver":
+            if metodo != "POST": raise ErroHttp(405, "Use POST em /resolver.")
+            try:
+                pedido = json.loads(corpo or b"null")
+            except (UnicodeDecodeError, json.JSONDecodeError) as erro:
+                raise ErroHttp(400, f"JSON inválido: {erro}")
+            if not isinstance(pedido, dict): pedido = {"estado": pedido}
+            return await self.resolver(pedido)
+        if caminho == "/metricas": return self.metricas()
+        if caminho == "/saude": return {"ok": True}
+        raise ErroHttp(404, f"Caminho desconhecido: {caminho}")
+
+    async def _responder(self, escritor, status, dados, comeco, manter):
+        corpo = json.dumps(dados, ensure_ascii=False).encode("utf-8")
+        cabecalho = (f"HTTP/1.1 {status} {_MOTIVOS.get(status, '')}\r\n"
+                     f"Content-Type: application/json; charset=utf-8\r\n"
+                     f"Content-Length: {len(corpo)}\r\n"
+                     f"Connection: {'keep-alive' if manter else 'close'}\r\n")
+        if status == 503: cabecalho += "Retry-After: 1\r\n"
+        escritor.write(cabecalho.encode("latin-1") + b"\r\n" + corpo)
+        await escritor.drain()
+        self.respostas[str(status)] = self.respostas.get(str(status), 0) + 1
+        self.latencia_ms.adicionar((time.perf_counter() - comeco) * 1000)
+        self._concluidas.append(time.monotonic())
+
+
+async def _ler_linha(leitor, status, mensagem):
+    # Uma linha maior que o limite do StreamReader (64 KiB) faz o readline lançar ValueError.
+    try:
+        return await leitor.readline()
+    except ValueError:
+        raise ErroHttp(status, mensagem)
+
+
+async def _ler_requisicao(leitor):
+    """``(metodo, caminho, cabecalhos, corpo)`` ou None se a conexão fechou entre requisições."""
+    linha = await _ler_linha(leitor, 414, "Linha de requisição longa demais.")
+    if not linha: return None
+    try:
+        metodo, alvo, _versao = linha.decode("latin-1").split()
+    except ValueError:
+        raise ErroHttp(400, "Linha de requisição inválida.")
+    cabecalhos = {}
+    while True:
+        linha = await _ler_linha(leitor, 431, "Linha de cabeçalho longa demais.")
+        if linha in (b"\r\n", b"\n", b""): break
+        if len(cabecalhos) >= MAX_CABECALHOS: raise ErroHttp(400, "Cabeçalhos demais.")
+        nome, separador, valor = linha.decode("latin-1").partition(":")
+        if not separador: raise ErroHttp(400, "Linha de cabeçalho sem ':'.")
+        cabecalhos[nome.strip().lower()] = valor.strip()
+    try:
+        tamanho = int(cabecalhos.get("content-length", 0))
+    except ValueError:
+        raise ErroHttp(400, "Content-Length inválido.")
+    if tamanho < 0: raise ErroHttp(400, "Content-Length inválido.")
+    if tamanho > MAX_CORPO: raise ErroHttp(413, f"Corpo maior que {MAX_CORPO} bytes.")
+    corpo = await leitor.readexactly(tamanho) if tamanho else b""
+    return metodo.upper(), alvo.split("?", 1)[0], cabecalhos, corpo
+
+
+def servir(host="127.0.0.1", porta=8765, **opcoes):
+    """Roda o serviço até Ctrl+C; ``opcoes`` são as de ``ServicoTravessia``."""
+    async def principal():
+        servico = await ServicoTravessia(**opcoes).iniciar(host, porta)
+        host_real, porta_real = servico.endereco
+        print(f"Servindo em http://{host_real}:{porta_real} (POST /resolver, GET /metricas)", flush=True)
+        try:
+            await servico.servir_para_sempre()
+        finally:
+            await servico.fechar()
+
+    try:
+        asyncio.run(principal())
+    except KeyboardInterrupt:
+        pass
+    return 0
@@ -0,0 +1,108 @@
+"""Redução por simetria para entidades intercambiáveis.
+
+Duas entidades são intercambiáveis quando trocá-las não muda as regras: os
+grupos proibidos continuam os mesmos e ambas são (ou não são) guardiãs e
+remadoras. Dentro de uma classe de intercambiáveis só importa quantas estão
+em cada margem, então o estado canônico coloca na margem direita as de menor
+índice. A busca percorre o grafo quociente dos estados canônicos e depois
+reconstrói um caminho concreto, passo a passo, a partir do estado inicial.
+"""
+from collections import deque
+
+from .busca import INTERVALO_PROGRESSO, ResultadoBusca, reconstruir_caminho
+
+
+def _trocar_bits(mascara, i, j):
+    if (mascara >> i & 1) == (mascara >> j & 1): return mascara
+    return mascara ^ (1 << i | 1 << j)
+
+
+def classes_intercambiaveis(regras):
+    """Classes (tuplas de índices, com 2 ou mais entidades) de entidades intercambiáveis."""
+    conflitos = set(regras.mascaras_conflito)
+    papeis = [(regras.mascara_guardioes >> i & 1, regras.mascara_remadores >> i & 1)
+              for i in range(regras.num_entidades)]
+    classes = []
+    for i in range(regras.num_entidades):
+        for classe in classes:
+            # Transposições de uma mesma classe se compõem, então basta testar o primeiro.
+            j = classe[0]
+            if papeis[i] == papeis[j] and {_trocar_bits(g, i, j) for g in conflitos} == conflitos:
+                classe.append(i)
+                break
+        else:
+            classes.append([i])
+    return [tuple(classe) for classe in classes if len(classe) > 1]
+
+
+class Simetria:
+    def __init__(self, regras):
+        self.regras = regras
+        self.classes = classes_intercambiaveis(regras)
+        # Para cada classe: a máscara dela e, para cada k, a máscara dos k primeiros membros.
+        self._mascaras = []
+        for classe in self.classes:
+            prefixos, acumulado = [0], 0
+            for i in classe:
+                acumulado |= 1 << i
+                prefixos.append(acumulado)
+            self._mascaras.append((acumulado, prefixos))
+
+    def canonico(self, estado):
+        for mascara, prefixos in self._mascaras:
+            na_direita = bin(estado & mascara).count("1")
+            estado = estado & ~mascara | prefixos[na_direita]
+        return estado
+
+    def invariante(self, estado):
+        """Se ``estado`` é o único da sua órbita (cada classe inteira numa margem)."""
+        return all(estado & mascara in (0, mascara) for mascara, _prefixos in self._mascaras)
+
+    def concretizar(self, caminho_canonico, inicio):
+        """Caminho concreto a partir de ``inicio`` cujos estados têm as formas canônicas dadas."""
+        canonico, regras = self.canonico, self.regras
+        caminho = [inicio]
+        for alvo in caminho_canonico[1:]:
+            caminho.append(next(proximo for _movimento, proximo in regras.sucessores(caminho[-1])
+                                if canonico(proximo) == alvo))
+        return caminho
+
+
+def buscar_simetria(regras, inicio, final, progresso=None):
+    """BFS no grafo quociente; o caminho devolvido é concreto e mínimo.
+
+    Se o estado final tiver outros equivalentes (alguma classe dividida entre
+    as margens), a redução não garante chegar exatamente nele e a busca usa a BFS comum.
+    """
+    simetria = Simetria(regras)
+    if not simetria.invariante(final):
+        from .busca import buscar_bfs
+        resultado = buscar_bfs(regras, inicio, final, progresso)
+        resultado.estrategia = "simetria"
+        return resultado
+    if inicio == final: return ResultadoBusca([inicio], 0, "simetria")
+
+    canonico = simetria.canonico
+    raiz = canonico(inicio)
+    pais = {raiz: None}
+    fila = deque([raiz])
+    expandidos = 0
+    profundidade, restantes_camada, proxima_camada = 0, 1, 0
+    while fila:
+        estado = fila.popleft()
+        expandidos += 1
+        if progresso and expandidos % INTERVALO_PROGRESSO == 0:
+            progresso(expandidos, len(fila), profundidade)
+        for _movimento, proximo in regras.sucessores(estado):
+            proximo = canonico(proximo)
+            if proximo in pais: continue
+            pais[proximo] = estado
+            if proximo == final:
+                caminho = simetria.concretizar(reconstruir_caminho(pais, proximo), inicio)
+                return ResultadoBusca(caminho, expandidos, "simetria")
+            fila.append(proximo)
+            proxima_camada += 1
+        restantes_camada -= 1
+        if restantes_camada == 0:
+            profundidade, restantes_camada, proxima_camada = profundidade + 1, proxima_camada, 0
+    return ResultadoBusca(None, expandidos, "simetria")
@@ -0,0 +1,107 @@
+"""Contagem e enumeração de todos os caminhos mínimos.
+
+Uma BFS por camadas dá a distância de cada estado ao início; percorrendo as
+camadas de trás para frente, ``ate_final[s]`` conta os caminhos mínimos de
+``s`` até o final. Com essas contagens o total sai sem listar nada, a
+enumeração nunca entra num ramo sem saída e a k-ésima solução pode ser obtida
+diretamente. A ordem é a lexicográfica pelos índices dos movimentos.
+"""
+from .busca import INTERVALO_PROGRESSO
+
+
+class SolucoesMinimas:
+    def __init__(self, regras, inicio, final=None, progresso=None):
+        """``progresso(processados, camada, profundidade)`` é chamado como nas buscas e pode lançar ``BuscaCancelada``."""
+        self.regras = regras
+        self.inicio = inicio
+        self.final = regras.estado_final if final is None else final
+        self.distancia = {inicio: 0}
+        self.ate_final = {}
+
+        camadas = [[inicio]]
+        processados = 0
+        while camadas[-1] and self.final not in self.distancia:
+            seguinte = []
+            d = len(camadas)
+            for estado in camadas[-1]:
+                processados += 1
+                if progresso and processados % INTERVALO_PROGRESSO == 0: progresso(processados, len(seguinte), d - 1)
+                for _movimento, proximo in regras.sucessores(estado):
+                    if proximo in self.distancia: continue
+                    self.distancia[proximo] = d
+                    seguinte.append(proximo)
+            camadas.append(seguinte)
+
+        if self.final not in self.distancia:
+            self.comprimento, self.total = None, 0
+            return
+        self.comprimento = self.distancia[self.final]
+        self.ate_final[self.final] = 1
+        for d in range(self.comprimento - 1, -1, -1):
+            for estado in camadas[d]:
+                processados += 1
+                if progresso and processados % INTERVALO_PROGRESSO == 0: progresso(processados, len(camadas[d]), d)
+                total = sum(self.ate_final.get(proximo, 0) for proximo in self._seguintes(estado))
+                if total: self.ate_final[estado] = total
+        self.total = self.ate_final.get(inicio, 0)
+
+    def _seguintes(self, estado):
+        d = self.distancia[estado] + 1
+        for _movimento, proximo in self.regras.sucessores(estado):
+            if self.distancia.get(proximo) == d: yield proximo
+
+    def _filhos(self, estado):
+        # Só os próximos estados que ainda levam ao final por um caminho mínimo.
+        return (proximo for proximo in self._seguintes(estado) if proximo in self.ate_final)
+
+    def __iter__(self):
+        """Gera as soluções em ordem; guarda só o caminho atual e um iterador por nível."""
+        if not self.total: return
+        if self.inicio == self.final:
+            yield [self.inicio]
+            return
+        caminho, pilha = [self.inicio], [self._filhos(self.inicio)]
+        while pilha:
+            proximo = next(pilha[-1], None)
+            if proximo is None:
+                pilha.pop()
+                caminho.pop()
+                continue
+            caminho.append(proximo)
+            if proximo == self.final:
+                yield list(caminho)
+                caminho.pop()
+            else:
+                pilha.append(self._filhos(proximo))
+
+    def caminho(self, indice):
+        """A solução de posição ``indice`` na ordem de ``__iter__``, sem gerar as anteriores."""
+        if not 0 <= indice < self.total: raise IndexError(f"solução {indice} fora de [0, {self.total})")
+        caminho = [self.inicio]
+        while caminho[-1] != self.final:
+            for proximo in self._filhos(caminho[-1]):
+                if indice < self.ate_final[proximo]: break
+                indice -= self.ate_final[proximo]
+            caminho.append(proximo)
+        return caminho
+
+    def posicao(self, caminho):
+        """Inverso de ``caminho``: a posição de uma solução mínima na enumeração."""
+        if caminho[0] != self.inicio or caminho[-1] != self.final or len(caminho) != self.comprimento + 1:
+            raise ValueError("o caminho não é uma solução mínima")
+        indice = 0
+        for estado, seguinte in zip(caminho, caminho[1:]):
+            for proximo in self._filhos(estado):
+                if proximo == seguinte: break
+                indice += self.ate_final[proximo]
+            else:
+                raise ValueError("o caminho não é uma solução mínima")
+        return indice
+
+
+def contar_solucoes(regras, inicio, final=None):
+    return SolucoesMinimas(regras, inicio, final).total
+
+
+def enumerar_solucoes(regras, inicio, final=None):
+    return iter(SolucoesMinimas(regras, inicio, final))
@@ -0,0 +1,67 @@
+"""Carregamento de sprites com cache em disco das versões já redimensionadas.
+
+A chave do cache é o caminho absoluto do PNG, seu ``mtime`` e o tamanho
+pedido; o conteúdo é o RGBA cru, que é lido sem decodificar PNG nem
+reamostrar com LANCZOS.
+"""
+import hashlib
+import os
+import sys
+
+from PIL import Image, ImageDraw
+
+from . import cache, instrumentacao
+
+
+def diretorio_cache():
+    return os.path.join(cache.diretorio_cache(), "sprites")
+
+
+def _arquivo_cache(arquivo, tamanho, diretorio):
+    info = os.stat(arquivo)
+    chave = f"{os.path.abspath(arquivo)}|{info.st_mtime_ns}|{tamanho[0]}x{tamanho[1]}"
+    return os.path.join(diretorio, hashlib.sha1(chave.encode("utf-8")).hexdigest() + ".rgba")
+
+
+def sprite_substituto(tamanho, rotulo="?"):
+    imagem = Image.new("RGBA", tamanho, (0, 0, 0, 0))
+    desenho = ImageDraw.Draw(imagem)
+    desenho.rounded_rectangle((1, 1, tamanho[0] - 2, tamanho[1] - 2), radius=8,
+                              fill=(255, 0, 255, 200), outline=(80, 0, 80, 255), width=2)
+    desenho.text((tamanho[0] / 2, tamanho[1] / 2), rotulo[:1].upper(), fill="white", anchor="mm")
+    return imagem
+
+
+def carregar_sprite(arquivo, tamanho, diretorio=None):
+    """Devolve o sprite ``arquivo`` redimensionado para ``tamanho`` como imagem RGBA.
+
+    Se o arquivo não existir, devolve um substituto em vez de falhar.
+    """
+    tamanho = tuple(tamanho)
+    try:
+        destino = _arquivo_cache(arquivo, tamanho, diretorio or diretorio_cache())
+    except FileNotFoundError:
+        print(f"Aviso: imagem não encontrada, usando substituto: {arquivo}", file=sys.stderr)
+        return sprite_substituto(tamanho, os.path.splitext(os.path.basename(arquivo))[0])
+
+    try:
+        with open(destino, "rb") as entrada:
+            dados = entrada.read()
+        if len(dados) == tamanho[0] * tamanho[1] * 4:
+            instrumentacao.contar("imagens.sprites_do_cache")
+            return Image.frombuffer("RGBA", tamanho, dados, "raw", "RGBA", 0, 1)
+    except OSError:
+        pass
+
+    with instrumentacao.medir("imagens.decodificar_redimensionar_ms"), Image.open(arquivo) as original:
+        imagem = original.convert("RGBA").resize(tamanho, Image.Resampling.LANCZOS)
+    try:
+        os.makedirs(os.path.dirname(destino), exist_ok=True)
+        temporario = f"{destino}.{os.getpid()}.tmp"
+        with open(temporario, "wb") as saida:
+            saida.write(imagem.tobytes())
+        os.replace(temporario, destino)
+    except OSError:
+        # Sem permissão de escrita o sprite continua funcionando, só não fica em cache.
+        pass
+    return imagem
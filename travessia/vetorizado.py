@@ -0,0 +1,102 @@
+"""Backend opcional da BFS que expande camadas inteiras com NumPy.
+
+Cada camada da busca é um vetor ``uint64``; todos os movimentos são aplicados
+ao mesmo tempo com operações bit a bit, os estados inválidos são filtrados com
+as máscaras de conflito e a deduplicação usa um mapa de visitados indexado
+pelo próprio estado. A ordem de descoberta é a mesma da BFS em Python puro,
+então o caminho e a contagem de expandidos também são os mesmos.
+"""
+try:
+    import numpy as np
+except ImportError as erro:
+    raise ImportError("O solucionador vetorizado precisa do NumPy. Instale com: pip install numpy") from erro
+
+from .busca import ResultadoBusca
+
+# Limite de elementos da matriz (estados x movimentos) gerada por bloco.
+TAMANHO_BLOCO = 1 << 20
+
+
+def mascara_validos(regras, estados):
+    todos = np.uint64(regras.todos)
+    guardioes = np.uint64(regras.mascara_guardioes)
+    zero = np.uint64(0)
+    direita = estados & todos
+    esquerda = direita ^ todos
+    validos = np.ones(estados.shape, dtype=bool)
+    for conflito in regras.mascaras_conflito:
+        grupo = np.uint64(conflito)
+        validos &= ~(((direita & grupo) == grupo) & ((direita & guardioes) == zero))
+        validos &= ~(((esquerda & grupo) == grupo) & ((esquerda & guardioes) == zero))
+    return validos
+
+
+def expandir(regras, fronteira, movimentos=None):
+    """Aplica todos os movimentos a todos os estados de ``fronteira``.
+
+    Devolve ``(linha, movimento, destino)`` dos pares válidos, em ordem de
+    estado e, dentro de cada estado, na ordem dos movimentos.
+    """
+    if movimentos is None: movimentos = np.array(regras.movimentos, dtype=np.uint64)
+    bit_barco = np.uint64(regras.bit_barco)
+    zero = np.uint64(0)
+    na_direita = (fronteira & bit_barco) != zero
+    lado = np.where(na_direita[:, None], movimentos[None, :], zero)
+    aplicavel = (fronteira[:, None] & movimentos[None, :]) == lado
+    destinos = fronteira[:, None] ^ movimentos[None, :] ^ bit_barco
+    aplicavel &= mascara_validos(regras, destinos)
+    linhas, colunas = np.nonzero(aplicavel)
+    return linhas, colunas, destinos[linhas, colunas]
+
+
+def buscar_vetorizado(regras, inicio, final=None, tamanho_bloco=TAMANHO_BLOCO, progresso=None):
+    if final is None: final = regras.estado_final
+    if inicio == final: return ResultadoBusca([inicio], 0, "vetorizado")
+
+    movimentos = np.array(regras.movimentos, dtype=np.uint64)
+    visitados = np.zeros(regras.num_estados, dtype=bool)
+    # O pai não precisa ser guardado: basta o movimento, pois a travessia é um XOR.
+    movimento_pai = np.full(regras.num_estados, -1, dtype=np.int32)
+    visitados[inicio] = True
+
+    por_bloco = max(1, tamanho_bloco // max(1, len(movimentos)))
+    fronteira = np.array([inicio], dtype=np.uint64)
+    expandidos = 0
+    profundidade = 0
+
+    while fronteira.size:
+        proxima = []
+        for comeco in range(0, fronteira.size, por_bloco):
+            bloco = fronteira[comeco:comeco + por_bloco]
+            linhas, colunas, destinos = expandir(regras, bloco, movimentos)
+
+            novos = ~visitados[destinos]
+            linhas, colunas, destinos = linhas[novos], colunas[novos], destinos[novos]
+            # Mantém só a primeira ocorrência de cada estado, na ordem de descoberta.
+            _unicos, primeiros = np.unique(destinos, return_index=True)
+            primeiros.sort()
+            linhas, colunas, destinos = linhas[primeiros], colunas[primeiros], destinos[primeiros]
+
+            visitados[destinos] = True
+            movimento_pai[destinos] = colunas
+            if visitados[final]:
+                posicao = int(np.flatnonzero(destinos == np.uint64(final))[0])
+                expandidos += int(linhas[posicao]) + 1
+                return ResultadoBusca(_reconstruir(regras, movimento_pai, inicio, final), expandidos, "vetorizado")
+            expandidos += bloco.size
+            proxima.append(destinos)
+            if progresso: progresso(expandidos, fronteira.size - comeco - bloco.size, profundidade)
+        fronteira = np.concatenate(proxima) if proxima else np.empty(0, dtype=np.uint64)
+        profundidade += 1
+
+    return ResultadoBusca(None, expandidos, "vetorizado")
+
+
+def _reconstruir(regras, movimento_pai, inicio, final):
+    caminho = [final]
+    estado = final
+    while estado != inicio:
+        estado ^= regras.movimentos[movimento_pai[estado]] ^ regras.bit_barco
+        caminho.append(estado)
+    caminho.reverse()
+    return caminho